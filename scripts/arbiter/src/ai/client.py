@@ -1,18 +1,35 @@
 """GPT-OSS API client (OpenAI-compatible)."""
 
+import asyncio
 import json
+import threading
 from typing import Any, Dict, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+from src.ai.response_cache import ResponseCache
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class AIClient:
-    """Synchronous client for GPT-OSS / OpenAI-compatible APIs."""
+    """
+    Synchronous client for GPT-OSS / OpenAI-compatible APIs.
 
-    def __init__(self, base_url: str, api_key: str, model: str = "gpt-oss", timeout: int = 120):
+    With a ResponseCache, complete_json() answers a request it has seen
+    before from the cache.  Such hits count in ``cache_hits`` and, with the
+    tokens the original call consumed, in ``tokens_saved`` — never in
+    ``api_calls`` or ``token_usage``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        model: str = "gpt-oss",
+        timeout: int = 120,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Initialize AI client.
 
@@ -21,14 +38,40 @@ class AIClient:
             api_key:  API authentication key
             model:    Model name
             timeout:  Request timeout in seconds
+            cache:    Optional cache of complete_json() responses
         """
         self.client = OpenAI(base_url=base_url, api_key=api_key)
         self.model = model
         self.timeout = timeout
+        self.cache = cache
         self.token_usage = 0
         self.api_calls = 0
+        self.cache_hits = 0
+        self.tokens_saved = 0
+        # Counters are updated from PR / file worker threads
+        self._usage_lock = threading.Lock()
         logger.info(f"AI client initialized — model: {model}")
 
+    def _record_usage(self, response: Any) -> int:
+        """Add a response's token usage and one API call to the run counters; return its tokens."""
+        tokens = (response.usage.total_tokens or 0) if response.usage else 0
+        with self._usage_lock:
+            self.token_usage += tokens
+            self.api_calls += 1
+        return tokens
+
+    def _cached(self, request_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """The cached response of a request, counted as a hit, or None."""
+        if request_key is None:
+            return None
+        hit = self.cache.get(request_key)
+        if hit is None:
+            return None
+        with self._usage_lock:
+            self.cache_hits += 1
+            self.tokens_saved += hit[1]
+        return hit[0]
+
     def complete(
         self,
         prompt: str,
@@ -63,9 +106,7 @@ class AIClient:
             if not content:
                 raise ValueError("No content in AI response")
 
-            if response.usage:
-                self.token_usage += response.usage.total_tokens or 0
-            self.api_calls += 1
+            self._record_usage(response)
 
             logger.debug(f"AI completion: {len(content)} chars")
             return content
@@ -85,6 +126,10 @@ class AIClient:
         Returns:
             Parsed JSON as dictionary
         """
+        request_key = self.cache.key(prompt, self.model, temperature) if self.cache else None
+        cached = self._cached(request_key)
+        if cached is not None:
+            return cached
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -99,11 +144,12 @@ class AIClient:
             if not content:
                 raise ValueError("No content in AI response")
 
-            if response.usage:
-                self.token_usage += response.usage.total_tokens or 0
-            self.api_calls += 1
+            tokens = self._record_usage(response)
 
-            return json.loads(content)
+            result = json.loads(content)
+            if request_key is not None:
+                self.cache.put(request_key, result, tokens)
+            return result
 
         except Exception as e:
             logger.error(f"AI JSON completion failed: {e}")
@@ -148,9 +194,7 @@ class AIClient:
             if not content:
                 raise ValueError("No content in AI response")
 
-            if response.usage:
-                self.token_usage += response.usage.total_tokens or 0
-            self.api_calls += 1
+            self._record_usage(response)
 
             logger.debug(f"AI completion (with system): {len(content)} chars")
             return content
@@ -158,3 +202,91 @@ class AIClient:
         except Exception as e:
             logger.error(f"AI completion with system failed: {e}")
             raise
+
+
+class AsyncAIClient:
+    """
+    Asyncio client for GPT-OSS / OpenAI-compatible APIs (used by --async mode).
+
+    Exposes the same ``token_usage`` / ``api_calls`` / ``cache_hits`` /
+    ``tokens_saved`` counters as AIClient so metrics reporting does not care
+    which engine ran.  All coroutines must run on one event loop, so the
+    counters need no lock.  Cache lookups and stores are SQLite I/O and
+    run in a worker thread, off the loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        model: str = "gpt-oss",
+        timeout: int = 120,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Initialize async AI client.
+
+        Args:
+            base_url: API base URL
+            api_key:  API authentication key
+            model:    Model name
+            timeout:  Request timeout in seconds
+            cache:    Optional cache of complete_json() responses
+        """
+        self.client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
+        self.model = model
+        self.timeout = timeout
+        self.cache = cache
+        self.token_usage = 0
+        self.api_calls = 0
+        self.cache_hits = 0
+        self.tokens_saved = 0
+        logger.info(f"Async AI client initialized — model: {model}")
+
+    async def complete_json(self, prompt: str, temperature: float = 0.2) -> Dict[str, Any]:
+        """
+        Chat completion that forces JSON output.
+
+        Args:
+            prompt:      User prompt (should explicitly request JSON)
+            temperature: Sampling temperature (low for consistency)
+
+        Returns:
+            Parsed JSON as dictionary
+        """
+        request_key = self.cache.key(prompt, self.model, temperature) if self.cache else None
+        hit = await asyncio.to_thread(self.cache.get, request_key) if request_key is not None else None
+        if hit is not None:
+            self.cache_hits += 1
+            self.tokens_saved += hit[1]
+            return hit[0]
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                response_format={"type": "json_object"},
+            )
+
+            message = response.choices[0].message
+            content = getattr(message, 'content', None) or getattr(message, 'reasoning_content', None)
+
+            if not content:
+                raise ValueError("No content in AI response")
+
+            tokens = (response.usage.total_tokens or 0) if response.usage else 0
+            self.token_usage += tokens
+            self.api_calls += 1
+
+            result = json.loads(content)
+            if request_key is not None:
+                await asyncio.to_thread(self.cache.put, request_key, result, tokens)
+            return result
+
+        except Exception as e:
+            logger.error(f"AI JSON completion failed: {e}")
+            raise
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
@@ -0,0 +1,112 @@
+"""AI responses keyed by a hash of the request, stored in SQLite."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ResponseCache:
+    """
+    Parsed JSON responses of AI requests already made, so the same page is
+    not sent to the model again — on a re-review, after ``clear_review``,
+    or when identical pages show up in different PRs.
+
+    A request is identified by key(): a hash of the rendered prompt (the
+    prompt template applied to the truncated content), the model and the
+    temperature.  Any change to one of them is a different request.
+
+    Schema (table: 'responses'):
+        request_key : str   - key() of the request
+        response    : str   - JSON of the parsed response
+        tokens      : int   - Tokens the original call consumed
+        created_at  : float - Unix time the response was stored
+        used_at     : float - Unix time of the last write or hit
+
+    Entries older than ``ttl_s`` are not returned and are dropped.  The
+    table holds at most ``max_entries`` rows; the least recently used are
+    evicted first.  One connection is shared by PR worker threads behind
+    a lock.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/ai_cache.sqlite",
+        ttl_s: float = 30 * 86400,
+        max_entries: int = 20000,
+    ):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " request_key TEXT PRIMARY KEY, response TEXT NOT NULL,"
+                " tokens INTEGER NOT NULL, created_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)"
+            )
+        logger.info(f"ResponseCache initialised at {db_path}")
+
+    @staticmethod
+    def key(prompt: str, model: str, temperature: float) -> str:
+        """Cache key of a request: SHA-256 of the model, temperature and prompt."""
+        digest = hashlib.sha256(f"{model}\n{temperature!r}\n".encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def get(self, request_key: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        A stored response (marked as recently used), or None if there is
+        none or it has expired.
+
+        Returns:
+            Tuple of (parsed response, tokens the original call consumed)
+        """
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT response, tokens, created_at FROM responses WHERE request_key = ?",
+                (request_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[2] > self.ttl_s:
+                self.conn.execute("DELETE FROM responses WHERE request_key = ?", (request_key,))
+                return None
+            self.conn.execute(
+                "UPDATE responses SET used_at = ? WHERE request_key = ?", (now, request_key),
+            )
+        return json.loads(row[0]), row[1]
+
+    def put(self, request_key: str, response: Dict[str, Any], tokens: int) -> None:
+        """Store a response, then drop expired entries and evict the least recently used over the limit."""
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (request_key, json.dumps(response), tokens, now, now),
+            )
+            self.conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_s,))
+            excess = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.conn.execute(
+                    "DELETE FROM responses WHERE rowid IN"
+                    " (SELECT rowid FROM responses ORDER BY used_at LIMIT ?)",
+                    (excess,),
+                )
+                logger.debug(f"ResponseCache evicted {excess} least recently used responses")
@@ -0,0 +1,278 @@
+"""
+Asyncio GitHub REST client for the --async engine.
+
+PyGithub is blocking, so the async engine talks to the REST API directly
+over one shared ``httpx.AsyncClient``.  Return values mirror the sync
+helpers in pr_fetcher.py / pr_reviewer.py (file dicts, bool success flags),
+and PRs are plain dicts:
+
+    {'number': int, 'title': str, 'updated_at': str (ISO),
+     'head_sha': str, 'head_ref': str, 'base_sha': str, 'labels': [str]}
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+import httpx
+from src.github.pr_fetcher import pr_matches
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_API_URL = "https://api.github.com"
+_PAGE_SIZE = 100
+
+
+class AsyncGitHubClient:
+    """Minimal async wrapper over the GitHub REST endpoints the arbiter uses."""
+
+    def __init__(self, token: str, timeout: int = 30, max_connections: int = 100):
+        """
+        Initialise the async GitHub client.
+
+        Args:
+            token:           Personal access token with repo + pull_request scopes
+            timeout:         Per-request timeout in seconds
+            max_connections: Connection pool size shared by all in-flight requests
+        """
+        self.client = httpx.AsyncClient(
+            base_url=_API_URL,
+            headers={
+                'Authorization': f"Bearer {token}",
+                'Accept': 'application/vnd.github+json',
+                'X-GitHub-Api-Version': '2022-11-28',
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    def full_name(repo_url: str) -> str:
+        """Resolve https://github.com/owner/repo to 'owner/repo'."""
+        parts = repo_url.rstrip('/').split('/')
+        if len(parts) < 2:
+            raise ValueError(f"Invalid repository URL: {repo_url}")
+        return f"{parts[-2]}/{parts[-1]}"
+
+    # ── Fetch ─────────────────────────────────────────────────────────────────
+
+    async def _get_paginated(self, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """GET every page of a list endpoint, following Link: rel="next"."""
+        items: List[Dict[str, Any]] = []
+        next_url: Optional[str] = url
+        next_params: Optional[Dict[str, Any]] = {**params, 'per_page': _PAGE_SIZE}
+        while next_url:
+            response = await self.client.get(next_url, params=next_params)
+            response.raise_for_status()
+            items.extend(response.json())
+            next_url = response.links.get('next', {}).get('url')
+            next_params = None  # the next URL already carries the query string
+        return items
+
+    async def fetch_open_prs(
+        self,
+        full_name: str,
+        branch_prefix: Optional[str] = None,
+        required_labels: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of pr_fetcher.fetch_open_prs()."""
+        try:
+            raw_prs = await self._get_paginated(
+                f"/repos/{full_name}/pulls",
+                {'state': 'open', 'sort': 'created', 'direction': 'asc'},
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch PRs for {full_name}: {e}")
+            return []
+
+        matched: List[Dict[str, Any]] = []
+        seen_numbers: set = set()
+        for raw in raw_prs:
+            if raw['number'] in seen_numbers:
+                continue
+            labels = [label['name'] for label in raw.get('labels', [])]
+            if pr_matches(raw['head']['ref'], set(labels), branch_prefix, required_labels):
+                matched.append({
+                    'number': raw['number'],
+                    'title': raw['title'],
+                    # Same ISO form as PyGithub's updated_at.isoformat()
+                    'updated_at': datetime.fromisoformat(
+                        raw['updated_at'].replace('Z', '+00:00')
+                    ).isoformat(),
+                    'head_sha': raw['head']['sha'],
+                    'head_ref': raw['head']['ref'],
+                    'base_sha': raw['base']['sha'],
+                    'labels': labels,
+                })
+                seen_numbers.add(raw['number'])
+
+        logger.info(
+            f"{full_name}: {len(matched)} matching open PR(s) "
+            f"(prefix='{branch_prefix}', labels={required_labels})"
+        )
+        return matched
+
+    async def get_pr_files(self, full_name: str, pr_number: int) -> List[Dict[str, Any]]:
+        """Async counterpart of pr_fetcher.get_pr_files()."""
+        try:
+            raw_files = await self._get_paginated(
+                f"/repos/{full_name}/pulls/{pr_number}/files", {},
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to get files for PR #{pr_number}: {e}")
+            return []
+
+        files = [
+            {
+                'path': f['filename'],
+                'status': f['status'],
+                'patch': f.get('patch') or '',
+                'additions': f.get('additions', 0),
+                'deletions': f.get('deletions', 0),
+                'sha': f.get('sha') or '',
+            }
+            for f in raw_files
+        ]
+        logger.debug(f"PR #{pr_number}: {len(files)} file(s) changed")
+        return files
+
+    async def get_changed_file_count(self, full_name: str, pr_number: int) -> int:
+        """Number of files a PR changes (the list endpoint omits it); 0 on error."""
+        try:
+            response = await self.client.get(f"/repos/{full_name}/pulls/{pr_number}")
+            response.raise_for_status()
+            return int(response.json().get('changed_files', 0))
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not get changed-file count for PR #{pr_number}: {e}")
+            return 0
+
+    async def get_file_content(self, full_name: str, path: str, ref: str) -> Optional[str]:
+        """Async counterpart of pr_fetcher.get_file_content() (raw media type, no base64)."""
+        try:
+            response = await self.client.get(
+                f"/repos/{full_name}/contents/{quote(path)}",
+                params={'ref': ref},
+                headers={'Accept': 'application/vnd.github.raw'},
+            )
+            response.raise_for_status()
+            return response.content.decode('utf-8')
+        except (httpx.HTTPError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not fetch {path} @ {ref}: {e}")
+            return None
+
+    async def get_tree_sha(self, full_name: str, path: str, ref: str) -> Optional[str]:
+        """Async counterpart of pr_fetcher.get_tree_sha()."""
+        parent, _, name = path.strip('/').rpartition('/')
+        try:
+            response = await self.client.get(
+                f"/repos/{full_name}/contents/{quote(parent)}", params={'ref': ref},
+            )
+            response.raise_for_status()
+            entries = response.json()
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not list {parent} @ {ref}: {e}")
+            return None
+        for entry in entries if isinstance(entries, list) else []:
+            if entry.get('name') == name and entry.get('type') == 'dir':
+                return entry['sha']
+        logger.debug(f"No directory {path} @ {ref}")
+        return None
+
+    async def get_tree_paths(self, full_name: str, tree_sha: str) -> Optional[List[str]]:
+        """Async counterpart of pr_fetcher.get_tree_paths()."""
+        try:
+            response = await self.client.get(
+                f"/repos/{full_name}/git/trees/{tree_sha}", params={'recursive': 1},
+            )
+            response.raise_for_status()
+            tree = response.json()
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not get git tree {tree_sha}: {e}")
+            return None
+        if tree.get('truncated'):
+            logger.warning(f"Git tree {tree_sha} truncated by GitHub — not used for link resolution")
+            return None
+        return [element['path'] for element in tree.get('tree', []) if element.get('type') == 'blob']
+
+    # ── Post ──────────────────────────────────────────────────────────────────
+
+    async def post_review(self, full_name: str, pr_number: int, decision: str, body: str) -> bool:
+        """Async counterpart of pr_reviewer.post_review(), same 422 fallback."""
+        event = 'APPROVE' if decision == 'APPROVE' else 'REQUEST_CHANGES'
+        try:
+            response = await self.client.post(
+                f"/repos/{full_name}/pulls/{pr_number}/reviews",
+                json={'body': body, 'event': event},
+            )
+            if response.status_code == 422 and 'own pull request' in response.text.lower():
+                logger.warning(
+                    f"PR #{pr_number}: cannot post formal review (same author) — "
+                    f"falling back to comment"
+                )
+                return await self.post_comment(full_name, pr_number, body)
+            response.raise_for_status()
+            logger.info(f"Posted '{decision}' review on PR #{pr_number}")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to post review on PR #{pr_number}: {e}")
+            return False
+
+    async def post_comment(self, full_name: str, pr_number: int, body: str) -> bool:
+        """Async counterpart of pr_reviewer.post_comment()."""
+        try:
+            response = await self.client.post(
+                f"/repos/{full_name}/issues/{pr_number}/comments",
+                json={'body': body},
+            )
+            response.raise_for_status()
+            logger.info(f"Posted comment on PR #{pr_number}")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to post comment on PR #{pr_number}: {e}")
+            return False
+
+    async def add_labels(self, full_name: str, pr_number: int, labels: list) -> None:
+        """Async counterpart of pr_reviewer.add_labels() (silently ignores failures)."""
+        try:
+            response = await self.client.post(
+                f"/repos/{full_name}/issues/{pr_number}/labels",
+                json={'labels': labels},
+            )
+            response.raise_for_status()
+            logger.debug(f"Added labels {labels} to PR #{pr_number}")
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to add labels to PR #{pr_number}: {e}")
+
+    async def merge_pr(
+        self,
+        full_name: str,
+        pr_number: int,
+        commit_message: Optional[str] = None,
+        merge_method: str = "squash",
+    ) -> bool:
+        """Async counterpart of pr_reviewer.merge_pr()."""
+        try:
+            response = await self.client.get(f"/repos/{full_name}/pulls/{pr_number}")
+            response.raise_for_status()
+            if not response.json().get('mergeable'):
+                logger.warning(
+                    f"PR #{pr_number} is not mergeable (conflicts or checks pending)"
+                )
+                return False
+
+            payload: Dict[str, Any] = {'merge_method': merge_method}
+            if commit_message:
+                payload['commit_message'] = commit_message
+            response = await self.client.put(
+                f"/repos/{full_name}/pulls/{pr_number}/merge", json=payload,
+            )
+            response.raise_for_status()
+            logger.info(f"Merged PR #{pr_number} via {merge_method}")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to merge PR #{pr_number}: {e}")
+            return False
@@ -1,6 +1,6 @@
 """Fetch open pull requests from a repository, with optional filtering."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from github.GithubException import GithubException
 from github.PullRequest import PullRequest
@@ -40,10 +40,7 @@ def fetch_open_prs(
                 continue
 
             pr_labels = {label.name for label in pr.labels}
-            by_prefix = branch_prefix and pr.head.ref.startswith(branch_prefix)
-            by_labels = required_labels and all(lbl in pr_labels for lbl in required_labels)
-
-            if by_prefix or by_labels:
+            if pr_matches(pr.head.ref, pr_labels, branch_prefix, required_labels):
                 matched.append(pr)
                 seen_numbers.add(pr.number)
 
@@ -58,6 +55,21 @@ def fetch_open_prs(
         return []
 
 
+def pr_matches(
+    head_ref: str,
+    label_names: Set[str],
+    branch_prefix: Optional[str] = None,
+    required_labels: Optional[List[str]] = None,
+) -> bool:
+    """
+    Return True if a PR is in scope: its head branch starts with
+    ``branch_prefix`` or it carries all of ``required_labels``.
+    """
+    by_prefix = bool(branch_prefix) and head_ref.startswith(branch_prefix)
+    by_labels = bool(required_labels) and all(lbl in label_names for lbl in required_labels)
+    return by_prefix or by_labels
+
+
 def get_pr_files(pr: PullRequest) -> List[Dict[str, str]]:
     """
     Return the list of files changed in a PR.
@@ -68,6 +80,7 @@ def get_pr_files(pr: PullRequest) -> List[Dict[str, str]]:
     Returns:
         List of dicts:  [{'path': str, 'status': str, 'patch': str}, ...]
         'patch' is the unified diff for the file (may be empty for binary files).
+        'sha' is the file's blob SHA, used to reuse results of unchanged files.
     """
     try:
         files = []
@@ -78,6 +91,7 @@ def get_pr_files(pr: PullRequest) -> List[Dict[str, str]]:
                 'patch': f.patch or '',        # unified diff (empty for binary)
                 'additions': f.additions,
                 'deletions': f.deletions,
+                'sha': f.sha,                  # blob SHA of the new version
             })
         logger.debug(f"PR #{pr.number}: {len(files)} file(s) changed")
         return files
@@ -114,6 +128,58 @@ def get_file_content(
         return None
 
 
+def get_tree_sha(
+    repo: Repository,
+    path: str,
+    ref: str,
+) -> Optional[str]:
+    """
+    Return the git tree SHA of a directory at a specific git ref.
+
+    Args:
+        repo: PyGithub Repository object
+        path: Directory path within the repository
+        ref:  Commit SHA or branch name
+
+    Returns:
+        Tree SHA, or None if the directory does not exist or is unavailable
+    """
+    parent, _, name = path.strip('/').rpartition('/')
+    try:
+        for entry in repo.get_contents(parent, ref=ref):
+            if entry.name == name and entry.type == 'dir':
+                return entry.sha
+        logger.debug(f"No directory {path} @ {ref}")
+        return None
+    except (GithubException, TypeError) as e:
+        logger.warning(f"Could not list {parent} @ {ref}: {e}")
+        return None
+
+
+def get_tree_paths(repo: Repository, tree_sha: str) -> Optional[List[str]]:
+    """
+    Return the blob paths of a git tree, recursively, in one API call.
+
+    Args:
+        repo:     PyGithub Repository object
+        tree_sha: Tree SHA (see get_tree_sha())
+
+    Returns:
+        Paths relative to the tree, or None if unavailable.  GitHub truncates
+        trees over 100,000 entries; a truncated tree is also None, since
+        links to the pages it left out would be reported as unresolved.
+    """
+    try:
+        tree = repo.get_git_tree(tree_sha, recursive=True)
+    except GithubException as e:
+        logger.warning(f"Could not get git tree {tree_sha}: {e}")
+        return None
+    if tree.truncated:
+        logger.warning(f"Git tree {tree_sha} truncated by GitHub — not used for link resolution")
+        return None
+    return [element.path for element in tree.tree if element.type == 'blob']
+
+
 def get_english_markdown_files(
     pr_files: List[Dict[str, str]],
     path_filter: Optional[str] = '/english/',
@@ -17,11 +17,16 @@ Workflow per run:
   3. Post run metrics to monitoring endpoint
 """
 
+import hashlib
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.ai.client import AIClient
+from src.ai.response_cache import ResponseCache
 from src.config.loader import load_config
 from src.config.validator import validate_config
 from src.github.client import GitHubClient
@@ -30,18 +35,53 @@ from src.github.pr_fetcher import (
     get_english_markdown_files,
     get_file_content,
     get_pr_files,
+    get_tree_paths,
+    get_tree_sha,
 )
 from src.github.pr_reviewer import add_labels, merge_pr, post_review
-from src.review.checklist import load_checklist, run_checks
-from src.review.decision import build_review_comment, make_decision
-from src.review.evaluator import evaluate_content
+from src.review.aggregator import ReviewAggregator, compact_ai_result
+from src.review.check_matrix import REQUIRED_CAP, CheckMatrix
+from src.review.check_profile import CheckProfile
+from src.review.checklist import (
+    ParsedDocument,
+    budget_needs_worker,
+    check_pool,
+    checklist_fingerprint,
+    load_checklist,
+    run_checks,
+    run_checks_batch,
+    uses_context,
+)
+from src.review.decision import build_review_comment, decision_if_fixed, make_decision
+from src.review.diff_classifier import TRIVIAL_KINDS, classify_patch
+from src.review.evaluator import (
+    disabled_result,
+    estimated_result,
+    evaluate_batch,
+    plan_batches,
+    skipped_result,
+)
+from src.review.link_index import LINK_CHECK_ID, LinkIndex, tree_urls
+from src.review.sampling import (
+    page_type,
+    plan_sample,
+    sample_size,
+    sample_summary,
+    stratum_key,
+    stratum_means,
+)
+from src.review.scheduler import estimate_pr_cost, plan_within_budget
+from src.state.check_cache import CheckCache
+from src.state.file_results import FileResultStore
 from src.state.repository import StateRepository
+from src.state.tree_cache import TreeCache
 try:
     from src.utils.email_reporter import WeeklyReporter
 except ImportError:
     WeeklyReporter = None
 from src.utils.logger import setup_logger
 from src.utils.metrics_logger import MetricsLogger
+from src.utils.pipeline import StagedPipeline
 
 logger = setup_logger(__name__)
 
@@ -77,10 +117,26 @@ def _detect_platforms(file_paths: List[str]) -> str:
     return ', '.join(found) if found else 'All'
 
 
+# Review stages, in order; each maps to a PRArbitrAgent._stage_<name> method
+_REVIEW_STAGES = ('fetch', 'checks', 'ai', 'decide', 'publish', 'persist')
+
+# Labels applied to a PR for each decision
+_LABELS = {
+    'APPROVE': ['arbiter:approved'],
+    'REQUEST_CHANGES': ['arbiter:needs-changes'],
+    'REJECT': ['arbiter:rejected'],
+}
+
+
 class PRArbitrAgent:
     """Orchestrates PR review across all configured tutorial repositories."""
 
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", ai_cache: bool = True):
+        """
+        Args:
+            config_path: Path to config YAML
+            ai_cache:    False to bypass review.ai_cache for this run (--no-ai-cache)
+        """
         logger.info("=" * 70)
         logger.info("Tutorials PR Arbiter Starting")
         logger.info("=" * 70)
@@ -89,12 +145,25 @@ class PRArbitrAgent:
         if not validate_config(self.config):
             raise ValueError("Invalid configuration — aborting.")
 
+        # AI responses cached by request, across PRs and runs
+        ai_cache_cfg = self.config['review'].get('ai_cache', {}) or {}
+        self.ai_cache: Optional[ResponseCache] = None
+        if ai_cache and ai_cache_cfg.get('enabled', True):
+            self.ai_cache = ResponseCache(
+                ai_cache_cfg.get('path', 'data/ai_cache.sqlite'),
+                ttl_s=float(ai_cache_cfg.get('ttl_days', 30)) * 86400,
+                max_entries=int(ai_cache_cfg.get('max_entries', 20000)),
+            )
+        elif not ai_cache:
+            logger.info("AI response cache disabled for this run (--no-ai-cache)")
+
         gpt_cfg = self.config['gpt_oss']
         self.ai_client = AIClient(
             base_url=gpt_cfg['endpoint'],
             api_key=gpt_cfg['api_key'],
             model=gpt_cfg['model'],
             timeout=gpt_cfg.get('timeout', 120),
+            cache=self.ai_cache,
         )
 
         self.github_client = GitHubClient(self.config['github']['token'])
@@ -109,14 +178,120 @@ class PRArbitrAgent:
         self.checklist = load_checklist(checklist_path)
 
         self.review_cfg = self.config['review']
+        self._required_checks = {
+            c['id'] for c in self.checklist.get('checks', []) if c['type'] == 'required'
+        }
+        # Size of the review comment's top-issue list and failing-file sample
+        self.comment_cfg = self.review_cfg.get('comment', {}) or {}
         self.thresholds = self.review_cfg['score_thresholds']
         self.prompt_path = self.config['prompts']['review_pr']
+        self.batch_prompt_path = self.config['prompts'].get('review_batch', 'config/prompts/review_batch.txt')
         self.branch_prefix = self.review_cfg.get('pr_branch_prefix', 'optimize/')
         self.pr_labels = self.review_cfg.get('pr_labels', [])
         self.auto_merge = self.review_cfg.get('auto_merge', False)
         self.post_comment = self.review_cfg.get('post_review_comment', True)
+        # Re-review PRs with new commits, re-evaluating only changed files
+        self.incremental = self.review_cfg.get('incremental_review', True)
+        # Per-file results of each PR's latest review (incremental re-review,
+        # known-good verdicts for trivial diffs)
+        file_results_cfg = self.review_cfg.get('file_results', {}) or {}
+        self.file_store = FileResultStore(
+            file_results_cfg.get('path', 'data/file_results.sqlite'),
+        )
+        # Stratified AI sampling for very large PRs
+        self.sampling_cfg = self.review_cfg.get('ai_sampling', {}) or {}
+        # Several short files evaluated per AI request
+        batching_cfg = self.review_cfg.get('ai_batching', {}) or {}
+        self.ai_batching = batching_cfg.get('enabled', False)
+        self.ai_batch_tokens = max(1, int(batching_cfg.get('max_tokens', 6000)))
+        self.ai_batch_files = max(1, int(batching_cfg.get('max_files', 8)))
+        # Checkpoint per-file progress so an interrupted review resumes
+        checkpoint_cfg = self.review_cfg.get('checkpoint', {}) or {}
+        self.checkpointing = checkpoint_cfg.get('enabled', True)
+        self.checkpoint_batch = max(1, int(checkpoint_cfg.get('batch_files', 20)))
+        # Static checks of very large PRs run on worker processes
+        parallel_cfg = self.review_cfg.get('parallel_checks', {}) or {}
+        self.parallel_checks = parallel_cfg.get('enabled', True)
+        self.parallel_min_files = max(2, int(parallel_cfg.get('min_files', 200)))
+        self.check_workers = int(parallel_cfg.get('workers', 0) or 0) or None
+        # One pool of check worker processes per run, started on first use
+        self._check_pool: Optional[ProcessPoolExecutor] = None
+        self._check_pool_lock = threading.Lock()
+        # Static-check results cached by file content, across PRs and runs
+        cache_cfg = self.review_cfg.get('check_cache', {}) or {}
+        self.check_cache: Optional[CheckCache] = None
+        if cache_cfg.get('enabled', True):
+            self.check_cache = CheckCache(
+                cache_cfg.get('path', 'data/check_cache.sqlite'),
+                max_entries=int(cache_cfg.get('max_entries', 50000)),
+            )
+        self._checklist_key = checklist_fingerprint(self.checklist)
+        self._cache_by_patch = uses_context(self.checklist)
+        # Files whose diff is only a version stamp, whitespace or frontmatter
+        # take the verdict of their last approved review
+        trivial_cfg = self.review_cfg.get('trivial_diff', {}) or {}
+        self.trivial_kinds: Tuple[str, ...] = ()
+        if trivial_cfg.get('enabled', True):
+            self.trivial_kinds = tuple(trivial_cfg.get('kinds', TRIVIAL_KINDS))
+        # Internal links resolved against the PR's pages and the target repo's
+        # tree, fetched once per tree SHA
+        link_cfg = self.review_cfg.get('link_index', {}) or {}
+        self.tree_cache: Optional[TreeCache] = None
+        if link_cfg.get('enabled', True):
+            self.tree_cache = TreeCache(
+                link_cfg.get('cache_path', 'data/tree_cache.sqlite'),
+                max_entries=int(link_cfg.get('max_trees', 50)),
+            )
+        self.link_root = link_cfg.get('content_root', 'content/reference.aspose.net')
+        self.link_language = link_cfg.get('language', 'en')
+        self._link_check = next(
+            (c for c in self.checklist.get('checks', []) if c['id'] == LINK_CHECK_ID), None,
+        )
+        # (base SHA, family dir) → tree SHA; PRs against the same base share it
+        self._tree_shas: Dict[Tuple[str, str], Optional[str]] = {}
+        self._tree_shas_lock = threading.Lock()
+        # Per-check timing, printed in the summary and sent with the metrics
+        timing_cfg = self.review_cfg.get('check_timing', {}) or {}
+        self.check_timing = timing_cfg.get('enabled', False)
+        self.check_timing_show = int(timing_cfg.get('show', 15))
+        # Skip AI calls when the static score alone fixes the decision
+        self.skip_decided_ai = self.review_cfg.get('skip_ai_when_decided', True)
         file_filter_cfg = self.review_cfg.get('file_filter', {})
         self.path_filter = file_filter_cfg.get('path_contains', '/english/')
+        # Number of PRs reviewed in parallel within one product (1 = serial)
+        self.concurrency = max(1, int(self.review_cfg.get('concurrency', 1) or 1))
+
+        # Deadline-aware scheduling (review.time_budget_s or --deadline)
+        self.time_budget_s = self.review_cfg.get('time_budget_s')
+        self.scheduler_cfg = self.review_cfg.get('scheduler', {}) or {}
+        self.deadline: Optional[float] = None  # time.monotonic() value, set per run
+
+        # Staged producer/consumer review (replaces the PR worker pool)
+        self.pipeline_cfg = self.review_cfg.get('pipeline', {}) or {}
+
+        # Per-file fan-out inside a PR: content fetches and AI calls run on
+        # shared pools, so their limits hold across all PR workers.
+        fanout_cfg = self.review_cfg.get('file_fanout', {}) or {}
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+        self._ai_pool: Optional[ThreadPoolExecutor] = None
+        if fanout_cfg.get('enabled', False):
+            self._fetch_pool = ThreadPoolExecutor(
+                max_workers=max(1, int(fanout_cfg.get('github_workers', 8))),
+                thread_name_prefix='file-fetch',
+            )
+            self._ai_pool = ThreadPoolExecutor(
+                max_workers=max(1, int(fanout_cfg.get('ai_workers', 4))),
+                thread_name_prefix='file-ai',
+            )
+
+        # Files are fetched, checked and released in chunks; contents the AI
+        # stage may need are kept within a per-PR budget, the rest re-fetched
+        streaming_cfg = self.review_cfg.get('streaming', {}) or {}
+        self.chunk_files = max(1, int(streaming_cfg.get('chunk_files', 500)))
+        self.keep_content_chars = int(float(streaming_cfg.get('keep_content_mb', 32)) * 1024 * 1024)
+
+        # Guards self.metrics / product_metrics updates from PR worker threads
+        self._metrics_lock = threading.Lock()
 
         # Run-level counters (reset per run() call)
         self._reset_metrics()
@@ -130,6 +305,7 @@ class PRArbitrAgent:
         self,
         product_filter: Optional[str] = None,
         max_prs: Optional[int] = None,
+        time_budget_s: Optional[float] = None,
     ) -> None:
         """
         Review open PRs across all (or one) product repository.
@@ -139,17 +315,14 @@ class PRArbitrAgent:
                             None means process all configured products.
             max_prs:        Cap on how many PRs to review this run (None = unlimited).
                             Set to 1 for rotation mode (one PR per scheduled run).
+            time_budget_s:  Seconds this run may take (overrides review.time_budget_s).
+                            PRs that do not fit are deferred to the next run.
         """
-        self._reset_metrics()
-        self.run_start = datetime.now()
-
-        products = self.config['products']
+        self._start_run(time_budget_s)
 
-        if product_filter:
-            if product_filter not in products:
-                logger.error(f"Unknown product: '{product_filter}'")
-                return
-            products = {product_filter: products[product_filter]}
+        products = self._select_products(product_filter)
+        if not products:
+            return
 
         for product_key, product_cfg in products.items():
             product_start = datetime.now()
@@ -173,30 +346,93 @@ class PRArbitrAgent:
                     f"Unhandled error processing '{product_key}': {e}",
                     exc_info=True,
                 )
-                product_metrics['errors'] += 1
-                self.metrics['errors'] += 1
+                self._incr('errors', self.metrics, product_metrics)
 
             # Post per-product metrics
-            product_duration_ms = int(
-                (datetime.now() - product_start).total_seconds() * 1000
-            )
-            run_id = self._make_run_id(product_key)
-            platform = ', '.join(product_metrics['platforms']) or 'All'
             self.metrics_logger.log_review_run(
-                run_id=run_id,
-                product=product_key,
-                platform=platform,
-                files_found=product_metrics['files_found'],
-                files_reviewed=product_metrics['files_reviewed'],
-                prs_errors=product_metrics['errors'],
-                duration_ms=product_duration_ms,
-                token_usage=self.ai_client.token_usage,
-                api_calls_count=self.ai_client.api_calls,
+                **self._product_run_metrics(product_key, product_metrics, product_start)
             )
 
+        self._finish_run()
+
+    def _start_run(self, time_budget_s: Optional[float] = None) -> None:
+        """Reset run counters and arm the deadline, if a time budget applies."""
+        self._reset_metrics()
+        self.run_start = datetime.now()
+
+        budget = time_budget_s if time_budget_s is not None else self.time_budget_s
+        if budget:
+            margin = float(self.scheduler_cfg.get('safety_margin_s', 60))
+            self.deadline = time.monotonic() + max(0.0, float(budget) - margin)
+            logger.info(f"Time budget: {budget}s ({margin:.0f}s safety margin)")
+        else:
+            self.deadline = None
+
+    def _select_products(self, product_filter: Optional[str]) -> Dict[str, Any]:
+        """Return the configured products to process ({} for an unknown filter)."""
+        products = self.config['products']
+        if product_filter:
+            if product_filter not in products:
+                logger.error(f"Unknown product: '{product_filter}'")
+                return {}
+            products = {product_filter: products[product_filter]}
+        return products
+
+    def _product_run_metrics(
+        self,
+        product_key: str,
+        product_metrics: Dict,
+        product_start: datetime,
+    ) -> Dict[str, Any]:
+        """Keyword arguments for MetricsLogger.log_review_run() for one product."""
+        product_duration_ms = int(
+            (datetime.now() - product_start).total_seconds() * 1000
+        )
+        return {
+            'run_id': self._make_run_id(product_key),
+            'product': product_key,
+            'platform': ', '.join(product_metrics['platforms']) or 'All',
+            'files_found': product_metrics['files_found'],
+            'files_reviewed': product_metrics['files_reviewed'],
+            'prs_errors': product_metrics['errors'],
+            'duration_ms': product_duration_ms,
+            'token_usage': self.ai_client.token_usage,
+            'api_calls_count': self.ai_client.api_calls,
+            'ai_cache': (
+                {'hits': self.ai_client.cache_hits, 'tokens_saved': self.ai_client.tokens_saved}
+                if self.ai_cache is not None else None
+            ),
+            'check_timings': (
+                self.check_profiles[product_key].summary()
+                if product_key in self.check_profiles else None
+            ),
+        }
+
+    def _finish_run(self) -> None:
         self._log_summary()
         self._maybe_send_weekly_report()
+
+    def close(self) -> None:
+        """
+        Release the worker pools, caches and state DB.
+
+        Call once when the agent is done; ``run()`` may be called any number
+        of times before that (one run per product on the command line).
+        """
+        for pool in (self._fetch_pool, self._ai_pool):
+            if pool is not None:
+                pool.shutdown()
+        if self._check_pool is not None:
+            self._check_pool.shutdown()
+            self._check_pool = None
         self.state_repo.close()
+        self.file_store.close()
+        if self.check_cache is not None:
+            self.check_cache.close()
+        if self.tree_cache is not None:
+            self.tree_cache.close()
+        if self.ai_cache is not None:
+            self.ai_cache.close()
 
     # ── Per-product processing ────────────────────────────────────────────────
 
@@ -214,8 +450,7 @@ class PRArbitrAgent:
             repo = self.github_client.get_repository(repo_url)
         except Exception as e:
             logger.error(f"[{product}] Cannot access repo: {e}")
-            product_metrics['errors'] += 1
-            self.metrics['errors'] += 1
+            self._incr('errors', self.metrics, product_metrics)
             return
 
         prs = fetch_open_prs(
@@ -223,218 +458,1455 @@ class PRArbitrAgent:
             branch_prefix=self.branch_prefix,
             required_labels=self.pr_labels or None,
         )
-        product_metrics['prs_found'] += len(prs)
-        self.metrics['prs_found'] += len(prs)
+        self._incr('prs_found', self.metrics, product_metrics, n=len(prs))
+        self._prune_closed(repo_url, [pr.number for pr in prs])
+
+        estimates: Dict[int, float] = {}
+        if self.deadline is not None:
+            prs, estimates = self._schedule_prs(
+                prs, repo_url,
+                number_of=lambda pr: pr.number,
+                file_count_of=lambda pr: pr.changed_files,
+                head_sha_of=lambda pr: pr.head.sha,
+            )
 
+        if self.pipeline_cfg.get('enabled', False):
+            self._run_pipeline(repo, prs, product, repo_url, product_metrics, max_prs, estimates)
+            return
+
+        # Bounded worker pool.  A PR is only dispatched while
+        # reviewed + in-flight < max_prs, so max_prs stays exact even though
+        # PRs that turn out to be skipped free their slot for the next one.
         reviewed_this_product = 0
-        for pr in prs:
-            if max_prs is not None and reviewed_this_product >= max_prs:
-                logger.info(f"[{product}] max_prs={max_prs} reached for this product — stopping")
-                break
-            try:
-                before = self.metrics['prs_reviewed']
-                self._process_pr(repo, pr, product, repo_url, product_metrics)
-                if self.metrics['prs_reviewed'] > before:
+        in_flight: Dict[Any, int] = {}
+
+        def _collect(done) -> None:
+            nonlocal reviewed_this_product
+            for future in done:
+                in_flight.pop(future)
+                if future.result():
                     reviewed_this_product += 1
-            except Exception as e:
-                logger.error(
-                    f"[{product}] Error on PR #{pr.number}: {e}",
-                    exc_info=True,
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix=f"review-{product}",
+        ) as pool:
+            for pr in prs:
+                while in_flight and (
+                    len(in_flight) >= self.concurrency
+                    or (max_prs is not None
+                        and reviewed_this_product + len(in_flight) >= max_prs)
+                ):
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    _collect(done)
+
+                if max_prs is not None and reviewed_this_product >= max_prs:
+                    logger.info(f"[{product}] max_prs={max_prs} reached for this product — stopping")
+                    break
+                if not self._fits_deadline(repo_url, pr.number, estimates.get(pr.number, 0.0)):
+                    continue
+
+                future = pool.submit(
+                    self._review_pr_guarded, repo, pr, product, repo_url, product_metrics,
                 )
-                product_metrics['errors'] += 1
-                self.metrics['errors'] += 1
+                in_flight[future] = pr.number
 
-    # ── Per-PR processing ─────────────────────────────────────────────────────
+            if in_flight:
+                done, _ = wait(in_flight)
+                _collect(done)
 
-    def _process_pr(
+    def _run_pipeline(
         self,
         repo,
-        pr,
+        prs: List[Any],
         product: str,
         repo_url: str,
         product_metrics: Dict,
+        max_prs: Optional[int] = None,
+        estimates: Optional[Dict[int, float]] = None,
     ) -> None:
-        pr_updated_at = pr.updated_at.isoformat()
+        """
+        Review PRs through the staged pipeline (review.pipeline.enabled).
 
-        if self.state_repo.was_reviewed(repo_url, pr.number):
-            logger.debug(
-                f"[{product}] Skipping PR #{pr.number} '{pr.title}' — already reviewed"
+        Every review stage gets its own workers and a bounded input queue, so
+        e.g. posting PR N's review overlaps AI evaluation of PR N+1.  PRs are
+        admitted under the same rule as the worker pool: reviewed + in-flight
+        never exceeds max_prs.
+        """
+        workers = self.pipeline_cfg.get('workers', {}) or {}
+        admitted = threading.Condition()
+        progress = {'reviewed': 0, 'in_flight': 0}
+
+        def on_done(job: Dict[str, Any], reviewed: bool) -> None:
+            with admitted:
+                progress['in_flight'] -= 1
+                if reviewed:
+                    progress['reviewed'] += 1
+                admitted.notify_all()
+
+        def on_error(job: Dict[str, Any], stage: str, exc: Exception) -> None:
+            logger.error(
+                f"[{product}] Error on PR #{job['number']} in stage '{stage}': {exc}",
+                exc_info=True,
             )
-            self.metrics['prs_skipped'] += 1
-            return
+            self._incr('errors', self.metrics, product_metrics)
+
+        pipeline = StagedPipeline(
+            [
+                (stage, getattr(self, f"_stage_{stage}"), int(workers.get(stage, 1)))
+                for stage in _REVIEW_STAGES
+            ],
+            queue_size=int(self.pipeline_cfg.get('queue_size', 2)),
+            on_done=on_done,
+            on_error=on_error,
+        )
+        pipeline.start()
+        try:
+            for pr in prs:
+                with admitted:
+                    while (max_prs is not None and progress['in_flight']
+                           and progress['reviewed'] + progress['in_flight'] >= max_prs):
+                        admitted.wait()
+                    if max_prs is not None and progress['reviewed'] >= max_prs:
+                        logger.info(f"[{product}] max_prs={max_prs} reached for this product — stopping")
+                        break
+                    if not self._fits_deadline(repo_url, pr.number, (estimates or {}).get(pr.number, 0.0)):
+                        continue
+                    progress['in_flight'] += 1
+                pipeline.submit(self._new_job(repo, pr, product, repo_url, product_metrics))
+        finally:
+            pipeline.close()
+            self.pipeline_stats.append({
+                'product': product,
+                'submitted': pipeline.submitted,
+                'blocked_s': pipeline.blocked_s,
+                'stages': pipeline.stats(),
+            })
 
-        logger.info(f"[{product}] Reviewing PR #{pr.number}: {pr.title}")
+    def _schedule_prs(
+        self,
+        prs: List[Any],
+        repo_url: str,
+        number_of,
+        file_count_of,
+        head_sha_of,
+    ) -> Tuple[List[Any], Dict[int, float]]:
+        """
+        Order and trim a product's PRs to fit the remaining time budget.
 
-        # ── Gather changed English Markdown files ─────────────────────────────
-        pr_files = get_pr_files(pr)
-        english_files = get_english_markdown_files(pr_files, path_filter=self.path_filter)
+        Cost per PR = file count × per-file latency from past reviews + a fixed
+        overhead.  PRs deferred by earlier runs go first; PRs that do not fit
+        are recorded as deferred so the next run picks them up first.  ``prs``
+        must be all of the product's open PRs: deferred records of any other
+        PR are dropped.
 
-        if not english_files:
-            logger.info(
-                f"[{product}] PR #{pr.number} has no English Markdown files — skipping"
+        Args:
+            prs:           PR objects in discovery order
+            repo_url:      Repository URL (state key)
+            number_of:     Callable returning a PR's number
+            file_count_of: Callable returning a PR's changed-file count
+            head_sha_of:   Callable returning a PR's head commit SHA
+
+        Returns:
+            Tuple of (PRs to review in order, {pr_number: estimated seconds})
+        """
+        per_file_s = self.state_repo.per_file_latency(
+            default=float(self.scheduler_cfg.get('default_per_file_s', 1.0)),
+        )
+        overhead_s = float(self.scheduler_cfg.get('per_pr_overhead_s', 5.0))
+        # Deferred PRs merged or closed since are never reviewed, so never cleared
+        self.state_repo.prune_deferred(repo_url, [number_of(pr) for pr in prs])
+        deferred_records = self.state_repo.get_deferred(repo_url)
+
+        by_number: Dict[int, Any] = {}
+        candidates: List[Dict[str, Any]] = []
+        for pr in prs:
+            number = number_of(pr)
+            by_number[number] = pr
+            if not self._needs_review(repo_url, number, head_sha_of(pr)):
+                estimate = 0.0  # skipped straight away; no need to count its files
+            else:
+                estimate = estimate_pr_cost(file_count_of(pr), per_file_s, overhead_s)
+            candidates.append({
+                'number': number,
+                'estimate_s': estimate,
+                'deferred_at': deferred_records.get(number, {}).get('deferred_at'),
+            })
+
+        # The staged pipeline overlaps stages of different PRs rather than
+        # running whole PRs side by side, so plan it as a single lane.
+        lanes = 1 if self.pipeline_cfg.get('enabled', False) else self.concurrency
+        remaining_s = max(0.0, self.deadline - time.monotonic())
+        selected, deferred = plan_within_budget(candidates, remaining_s, lanes)
+
+        for candidate in deferred:
+            self.state_repo.defer_pr(repo_url, candidate['number'], candidate['estimate_s'])
+            self._incr('prs_deferred', self.metrics)
+
+        return (
+            [by_number[c['number']] for c in selected],
+            {c['number']: c['estimate_s'] for c in selected},
+        )
+
+    def _prune_closed(self, repo_url: str, open_numbers: List[int]) -> None:
+        """Drop the stored file results of PRs merged or closed since their review."""
+        if not open_numbers:
+            return  # a failed PR listing is empty too; keep everything
+        removed = self.file_store.prune(repo_url, open_numbers)
+        if removed:
+            logger.info(f"Pruned {removed} stored file result(s) of closed PRs")
+
+    def _fits_deadline(self, repo_url: str, pr_number: int, estimate_s: float) -> bool:
+        """
+        Return True if a PR can still start: its estimate ends before the deadline.
+        Otherwise the PR is recorded as deferred.
+        """
+        if self.deadline is None or time.monotonic() + estimate_s <= self.deadline:
+            return True
+        logger.info(
+            f"PR #{pr_number} (~{estimate_s:.0f}s) no longer fits before the deadline — deferring"
+        )
+        self.state_repo.defer_pr(repo_url, pr_number, estimate_s)
+        self._incr('prs_deferred', self.metrics)
+        return False
+
+    def _review_pr_guarded(
+        self,
+        repo,
+        pr,
+        product: str,
+        repo_url: str,
+        product_metrics: Dict,
+    ) -> bool:
+        """Run _process_pr in a worker thread; errors are counted, never raised."""
+        try:
+            return self._process_pr(repo, pr, product, repo_url, product_metrics)
+        except Exception as e:
+            logger.error(
+                f"[{product}] Error on PR #{pr.number}: {e}",
+                exc_info=True,
             )
-            self.metrics['prs_skipped'] += 1
-            return
+            self._incr('errors', self.metrics, product_metrics)
+            return False
 
-        # Detect platform(s) from file paths and accumulate file count
-        file_paths = [f['path'] for f in english_files]
-        pr_platform = _detect_platforms(file_paths)
-        product_metrics['files_found'] += len(english_files)
-        for p in pr_platform.split(', '):
-            if p and p not in product_metrics['platforms']:
-                product_metrics['platforms'].append(p)
-
-        # ── Evaluate each file ────────────────────────────────────────────────
-        file_summaries: List[Dict[str, Any]] = []
-        aggregate_static = 0
-        aggregate_ai_contribution = 0
-        aggregate_check_results: List[Dict[str, Any]] = []
-        any_required_failure = False  # True if ANY file fails a required check
+    # ── Per-PR processing ─────────────────────────────────────────────────────
 
-        for file_info in english_files:
-            file_path = file_info['path']
-            content = get_file_content(repo, file_path, ref=pr.head.sha)
+    def _process_pr(
+        self,
+        repo,
+        pr,
+        product: str,
+        repo_url: str,
+        product_metrics: Dict,
+    ) -> bool:
+        """
+        Review a single PR end to end by running every review stage in order.
 
-            if content is None:
-                logger.warning(f"[{product}] Could not fetch {file_path} — skipping file")
-                continue
+        Returns:
+            True if a review was posted and persisted, False if the PR was skipped.
+        """
+        job = self._new_job(repo, pr, product, repo_url, product_metrics)
+        for stage in _REVIEW_STAGES:
+            job = getattr(self, f"_stage_{stage}")(job)
+            if job is None:
+                return False
+        return True
 
-            static_score, check_results = run_checks(
-                content, self.checklist,
-                context={'patch': file_info.get('patch', '')},
+    @staticmethod
+    def _new_job(repo, pr, product: str, repo_url: str, product_metrics: Dict) -> Dict[str, Any]:
+        """Per-PR state handed from one review stage to the next."""
+        return {
+            'repo': repo,
+            'pr': pr,
+            'number': pr.number,
+            'title': pr.title,
+            'head_sha': pr.head.sha,
+            'base_sha': pr.base.sha,
+            'product': product,
+            'repo_url': repo_url,
+            'product_metrics': product_metrics,
+            'pr_updated_at': pr.updated_at.isoformat(),
+        }
+
+    # ── Review stages ─────────────────────────────────────────────────────────
+    # Each stage takes the job dict and returns it for the next stage, or None
+    # when the PR leaves the pipeline (already reviewed, nothing to review).
+    # Only the GitHub and LLM calls are engine-specific; everything else goes
+    # through the stage steps below, shared with AsyncPRArbitrAgent.
+
+    def _stage_fetch(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Skip PRs reviewed at their current head; list the PR's files, plan
+        which to fetch and check, and build the PR's link index.  Contents
+        are fetched by the checks stage, one chunk at a time.
+        """
+        if not self._open_review(job):
+            return None
+        pr_files = get_pr_files(job['pr'])
+        if not self._plan_files(job, pr_files):
+            return None
+        job['link_index'] = self._build_link_index(job['repo'], job['base_sha'], pr_files)
+        return job
+
+    def _stage_checks(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch, check and link-resolve the PR's files in chunks of
+        review.streaming.chunk_files, fetching the next chunk while one is
+        checked; then merge trivial-diff, cached and reused results back in.
+        Only contents the AI stage may use outlive their chunk.
+        """
+        chunks = self._plan_chunks(job)
+        upcoming = self._start_fetch(job, chunks[0]) if chunks else None
+        for index, chunk in enumerate(chunks):
+            contents = upcoming()
+            if index + 1 < len(chunks):
+                upcoming = self._start_fetch(job, chunks[index + 1])
+            self._check_chunk(job, chunk, contents)
+        self._finish_checks(job)
+        return job
+
+    def _stage_ai(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        AI-evaluate the planned files in checkpointed batches: each batch
+        re-fetches the contents released after the checks, is evaluated, and
+        releases them again.
+        """
+        evaluated: List[Dict[str, Any]] = []
+        for batch in self._checkpoint_batches(self._plan_ai(job)):
+            refetch = [r for r in batch if 'content' not in r]
+            contents = self._map_files(
+                self._fetch_pool,
+                lambda r: get_file_content(job['repo'], r['path'], ref=job['head_sha']),
+                refetch,
+            )
+            batch = self._attach_contents(batch, refetch, contents)
+            grouped = self._map_files(
+                self._ai_pool,
+                lambda documents: evaluate_batch(
+                    documents=documents,
+                    ai_client=self.ai_client,
+                    prompt_path=self.prompt_path,
+                    batch_prompt_path=self.batch_prompt_path,
+                    checklist_config=self.checklist,
+                ),
+                self._ai_requests(batch),
             )
+            self._finish_ai_batch(job, batch, grouped)
+            evaluated += batch
+        self._finish_ai(job, evaluated)
+        return job
+
+    def _stage_decide(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Aggregate per-file results into the decision and review comment."""
+        verdict = self._decide_pr(job['product'], job['number'], job.pop('results'))
+        if verdict is None:
+            return None
+        job['verdict'] = verdict
+        return job
+
+    def _stage_publish(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Post the review, label the PR and auto-merge when configured."""
+        pr, verdict = job['pr'], job['verdict']
+        decision = verdict['decision']
+
+        post_review(pr, decision, verdict['comment_body'])
+        add_labels(pr, _LABELS.get(decision, []))
+
+        job['merged'] = False
+        if self.auto_merge and decision == 'APPROVE':
+            job['merged'] = merge_pr(pr, commit_message=self._merge_message(job), merge_method='squash')
+        return job
+
+    def _stage_persist(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Save the review to the state DB and update counters."""
+        self._record_review(
+            job['repo_url'], job['number'], job['product'], job['pr_updated_at'],
+            job['verdict'], job['merged'], job['product_metrics'],
+            duration_s=time.monotonic() - job['started'],
+            head_sha=job['head_sha'],
+            checked_files=len(job.pop('worked')),
+        )
+        return job
 
-            # Propagate required-failure flag across all files in the PR
-            if any(r['type'] == 'required' and not r['passed'] for r in check_results):
-                any_required_failure = True
+    # ── Stage steps (threaded and async engines) ──────────────────────────────
+    # The blocking parts of each stage — state DB, caches, static checks —
+    # which AsyncPRArbitrAgent runs off the event loop.
 
-            ai_result = evaluate_content(
-                content=content,
-                ai_client=self.ai_client,
-                prompt_path=self.prompt_path,
-                checklist_config=self.checklist,
+    def _open_review(self, job: Dict[str, Any]) -> bool:
+        """
+        Start a PR's review: load its earlier file results and checkpoint into
+        the job, or return False (counted as skipped) when the PR was already
+        reviewed at its current head.
+        """
+        product, pr_number = job['product'], job['number']
+        if not self._needs_review(job['repo_url'], pr_number, job['head_sha']):
+            logger.debug(
+                f"[{product}] Skipping PR #{pr_number} '{job['title']}' — already reviewed"
             )
+            self._incr('prs_skipped', self.metrics)
+            return False
+        # Only a re-review reuses them: with state.json reset, the PR is new
+        job['previous'] = (
+            self.file_store.get(job['repo_url'], pr_number)
+            if self.state_repo.was_reviewed(job['repo_url'], pr_number) else {}
+        )
+        job['checkpoint'] = self._load_checkpoint(product, job['repo_url'], pr_number, job['head_sha'])
 
-            failed_checks = [c['description'] for c in check_results if not c['passed']]
-            per_file_issues = failed_checks + ai_result.get('issues', [])
+        logger.info(f"[{product}] Reviewing PR #{pr_number}: {job['title']}")
+        job['started'] = time.monotonic()
+        return True
 
-            file_summaries.append({
-                'path': file_path,
-                'static_score': static_score,
-                'ai_score': ai_result.get('score', 0),
-                'issues': per_file_issues,
-            })
+    def _plan_files(self, job: Dict[str, Any], pr_files: List[Dict[str, Any]]) -> bool:
+        """
+        Split the PR's files under review into reused, trivial-diff, cached
+        and fresh (to be fetched and checked) ones.
 
-            aggregate_static += static_score
-            aggregate_ai_contribution += ai_result.get('weighted_contribution', 0)
+        Returns:
+            False when the PR leaves the review: no English Markdown files,
+            or nothing changed since its last review.
+        """
+        product, repo_url, pr_number = job['product'], job['repo_url'], job['number']
+        previous, checkpoint = job.pop('previous'), job.pop('checkpoint')
+        english_files = self._select_files(pr_files, product, pr_number, job['product_metrics'])
+        if not english_files:
+            return False
 
-            # Merge check results: a check is failed if it failed in ANY file
-            if not aggregate_check_results:
-                aggregate_check_results = [dict(r) for r in check_results]
-            else:
-                for merged, current in zip(aggregate_check_results, check_results):
-                    if not current['passed']:
-                        merged['passed'] = False
+        fresh, job['reused'] = self._split_unchanged(
+            product, pr_number, english_files, previous, checkpoint,
+        )
+        if not self._has_changes(
+            repo_url, pr_number, job['head_sha'], job['pr_updated_at'], fresh, job['reused'], previous,
+        ):
+            return False
+        job['trivial'], fresh = self._reuse_trivial(product, repo_url, pr_number, fresh)
+        job['cached'], fresh = self._cached_checks(product, pr_number, fresh)
+
+        job['paths'] = [f['path'] for f in english_files]
+        job['files'] = fresh
+        return True
+
+    def _plan_chunks(self, job: Dict[str, Any]) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Split the contents to fetch into chunks of review.streaming.chunk_files:
+        (files to check, carried results to re-link) per chunk.  With a link
+        index, every file's links are judged against this PR, so reused,
+        trivial-diff and cached results without content are fetched too.
+        """
+        files = job.pop('files')
+        relink: List[Dict[str, Any]] = []
+        if job['link_index'] is not None:
+            carried = list(job['reused'].values()) + job['trivial'] + job['cached']
+            relink = [r for r in carried if 'content' not in r]
+        job['to_check'] = len(files)
+        job['checked'] = []
+        job['linked'] = set()
+        job['content_budget'] = self.keep_content_chars
+
+        items = [(True, f) for f in files] + [(False, r) for r in relink]
+        return [
+            (
+                [f for check, f in items[start:start + self.chunk_files] if check],
+                [r for check, r in items[start:start + self.chunk_files] if not check],
+            )
+            for start in range(0, len(items), self.chunk_files)
+        ]
 
-        if not file_summaries:
-            logger.warning(f"[{product}] PR #{pr.number} — no files could be evaluated")
-            self.metrics['prs_skipped'] += 1
+    @staticmethod
+    def _chunk_paths(chunk: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]) -> List[str]:
+        """Paths whose content a chunk needs: its files to check, then its results to re-link."""
+        files, relink = chunk
+        return [f['path'] for f in files] + [r['path'] for r in relink]
+
+    def _start_fetch(self, job: Dict[str, Any], chunk) -> Callable[[], List[Optional[str]]]:
+        """
+        Start fetching a chunk's contents on the fetch pool; the returned
+        callable waits for them, in _chunk_paths() order.  Without fan-out
+        the fetch happens when it is called.
+        """
+        paths = self._chunk_paths(chunk)
+        fetch = lambda path: get_file_content(job['repo'], path, ref=job['head_sha'])  # noqa: E731
+        if self._fetch_pool is None:
+            return lambda: [fetch(path) for path in paths]
+        futures = [self._fetch_pool.submit(fetch, path) for path in paths]
+        return lambda: [future.result() for future in futures]
+
+    def _check_chunk(
+        self,
+        job: Dict[str, Any],
+        chunk: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]],
+        contents: List[Optional[str]],
+    ) -> None:
+        """
+        Check one chunk's files, judge the links of its files and re-linked
+        results, checkpoint the new results and release every content the
+        AI stage is not going to use (see _hold_content()).
+        """
+        files, relink = chunk
+        fresh = self._check_files(
+            job['product'], files, contents[:len(files)], pr_files=job['to_check'],
+        )
+        for result, content in zip(relink, contents[len(files):]):
+            if content is not None:
+                result['content'] = content
+        for result in fresh + relink:
+            self._resolve_links(job['link_index'], result)
+            self._hold_content(job, result)
+            job['linked'].add(id(result))
+        self._checkpoint(job['repo_url'], job['number'], job['head_sha'], fresh)
+        job['checked'] += fresh
+
+    def _finish_checks(self, job: Dict[str, Any]) -> None:
+        """
+        Merge checked, trivial-diff, cached and reused results in file order
+        and judge the links of those no chunk covered.
+        """
+        carried = job.pop('trivial') + job.pop('cached')
+        fresh = job.pop('checked')
+        job['worked'] = {r['path'] for r in fresh}
+        results = self._merge_results(job.pop('paths'), fresh + carried, job.pop('reused'))
+        linked, link_index = job.pop('linked'), job.pop('link_index')
+        for result in results:
+            if id(result) not in linked:
+                self._resolve_links(link_index, result)
+                self._hold_content(job, result)
+        self._checkpoint(job['repo_url'], job['number'], job['head_sha'], carried)
+        del job['to_check'], job['content_budget']
+        job['results'] = results
+
+    def _hold_content(self, job: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        Keep a result's content for the AI stage while the PR's
+        review.streaming.keep_content_mb lasts and the file may be
+        evaluated; otherwise release it.  The AI stage re-fetches released
+        contents of the files it evaluates.
+        """
+        content = result.get('content')
+        if content is None:
             return
+        if (
+            self.checklist.get('ai_evaluation', {}).get('enabled', True)
+            and ('ai_result' not in result or result['ai_result'].get('skipped'))
+            and len(content) <= job['content_budget']
+        ):
+            job['content_budget'] -= len(content)
+            return
+        del result['content']
+
+    def _plan_ai(self, job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        The results to AI-evaluate in this review, in file order; empty when
+        AI is skipped (decision already fixed, AI disabled) or nothing is
+        pending.  Files resumed from a checkpoint and files left out of the
+        sample are kept in the job for _finish_ai().
+        """
+        results = job['results']
+        pending = self._ai_pending(results)
+        job['evaluated'] = self._resumed_ai(results)
+        job['unsampled'] = []
+        if not pending or self._skip_ai_if_decided(
+            job['product'], job['number'], results, pending,
+        ) or self._skip_ai_if_disabled(pending):
+            return []
+        pending, job['unsampled'] = self._sample_for_ai(
+            job['product'], job['number'], pending, job['evaluated'],
+        )
+        return pending
+
+    def _finish_ai_batch(
+        self,
+        job: Dict[str, Any],
+        batch: List[Dict[str, Any]],
+        grouped: List[List[Dict[str, Any]]],
+    ) -> None:
+        """Attach one checkpoint batch's AI results (one list per request) and checkpoint them."""
+        ai_results = [ai_result for group in grouped for ai_result in group]
+        self._attach_ai_results(batch, ai_results)
+        self._checkpoint(job['repo_url'], job['number'], job['head_sha'], batch)
+        job['worked'].update(r['path'] for r in batch)
 
-        # ── Average scores across files ───────────────────────────────────────
-        n = len(file_summaries)
-        avg_static = round(aggregate_static / n)
-        avg_ai_contribution = round(aggregate_ai_contribution / n)
+    def _finish_ai(self, job: Dict[str, Any], evaluated: List[Dict[str, Any]]) -> None:
+        """Impute the AI score of files left out of the sample from those evaluated."""
+        self._impute_unsampled(evaluated + job.pop('evaluated'), job.pop('unsampled'))
 
-        # Re-apply the required-failure cap after averaging.
-        # Without this, a failing file can be "rescued" by passing files:
-        # e.g. (49 + 100 + 100) / 3 = 83 → would incorrectly APPROVE.
-        if any_required_failure:
-            avg_static = min(avg_static, 49)
-            logger.warning(
-                f"[{product}] PR #{pr.number} — required check failed in at least one file; "
-                f"static score capped at 49 (was {round(aggregate_static / n)})"
+    @staticmethod
+    def _merge_message(job: Dict[str, Any]) -> str:
+        """Squash-merge commit message for an auto-merged PR."""
+        return f"Auto-merge: {job['title']} (arbiter score {job['verdict']['total_score']}/100)"
+
+    # ── Shared review steps (threaded and async engines) ──────────────────────
+
+    def _select_files(
+        self,
+        pr_files: List[Dict[str, Any]],
+        product: str,
+        pr_number: int,
+        product_metrics: Dict,
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter a PR's changed files to the Markdown files under review and
+        account for them (file count, detected platforms) in product_metrics.
+
+        Returns:
+            The files to review; empty (and the PR counted as skipped) if none.
+        """
+        english_files = get_english_markdown_files(pr_files, path_filter=self.path_filter)
+
+        if not english_files:
+            logger.info(
+                f"[{product}] PR #{pr_number} has no English Markdown files — skipping"
             )
+            self._incr('prs_skipped', self.metrics)
+            return []
 
-        synthetic_ai = {
-            'weighted_contribution': avg_ai_contribution,
-            'score': round(sum(f['ai_score'] for f in file_summaries) / n),
-            'summary': f"Averaged over {n} English Markdown file(s).",
-            'strengths': [],
-            'issues': list({iss for f in file_summaries for iss in f['issues']}),
-            'technical_accuracy': 0,
-            'clarity': 0,
-            'seo_quality': 0,
-            'actionability': 0,
-            'uniqueness': 0,
-        }
+        # Detect platform(s) from file paths and accumulate file count
+        file_paths = [f['path'] for f in english_files]
+        pr_platform = _detect_platforms(file_paths)
+        with self._metrics_lock:
+            product_metrics['files_found'] += len(english_files)
+            for p in pr_platform.split(', '):
+                if p and p not in product_metrics['platforms']:
+                    product_metrics['platforms'].append(p)
+        return english_files
+
+    def _decide_pr(
+        self,
+        product: str,
+        pr_number: int,
+        results: List[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Stream per-file results (in file order) through a ReviewAggregator
+        into the PR decision and the review comment body.  The results list
+        is emptied as it is consumed.
+
+        Returns:
+            {'decision', 'total_score', 'comment_body', 'files', 'file_results',
+            'check_matrix' (CheckMatrix.pack(), rows in file_results order,
+            AI scores included)}
+            or None (and the PR counted as skipped) when no file could be evaluated.
+        """
+        aggregator = ReviewAggregator(
+            self.checklist.get('checks', []),
+            top_k=int(self.comment_cfg.get('top_issues', 10)),
+            failing_files=int(self.comment_cfg.get('failing_files', 25)),
+            unresolved_links=int(self.comment_cfg.get('unresolved_links', 25)),
+            ai_weight=self.checklist.get('ai_evaluation', {}).get('weight', 20),
+        )
+        file_results: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            aggregator.add(result)
+            # Per-file outcome, stored for incremental re-review
+            file_results[result['path']] = self._file_record(result)
+            result.pop('content', None)
+            result.pop('patch', None)
+        results.clear()
+
+        summary = aggregator.summary(
+            confidence=float(self.sampling_cfg.get('confidence', 0.95)),
+            stddev=float(self.sampling_cfg.get('assumed_stddev', 15)),
+        )
+        if summary is None:
+            logger.warning(f"[{product}] PR #{pr_number} — no files could be evaluated")
+            self._incr('prs_skipped', self.metrics)
+            return None
 
-        decision, total_score = make_decision(avg_static, synthetic_ai, self.thresholds)
+        if summary['required_failed']:
+            failed_required = [c for c in summary['failed_checks'] if c in self._required_checks]
+            logger.warning(
+                f"[{product}] PR #{pr_number} — required check(s) failed in at least one file "
+                f"({', '.join(failed_required)}); static score capped at {REQUIRED_CAP} "
+                f"(was {summary['uncapped_static']})"
+            )
+
+        decision, total_score = make_decision(
+            summary['avg_static'],
+            {'weighted_contribution': summary['avg_ai_contribution']},
+            self.thresholds,
+        )
 
-        # ── Build and post review ─────────────────────────────────────────────
         if self.post_comment:
             comment_body = build_review_comment(
                 decision=decision,
                 total_score=total_score,
-                static_score=avg_static,
-                ai_result=synthetic_ai,
-                check_results=aggregate_check_results,
-                file_summaries=file_summaries,
+                summary=summary,
                 thresholds=self.thresholds,
-                required_cap_applied=any_required_failure,
             )
         else:
             comment_body = f"PR Arbiter decision: **{decision}** (score: {total_score}/100)"
 
-        post_review(pr, decision, comment_body)
-
-        # ── Label PR ──────────────────────────────────────────────────────────
-        label_map = {
-            'APPROVE': ['arbiter:approved'],
-            'REQUEST_CHANGES': ['arbiter:needs-changes'],
-            'REJECT': ['arbiter:rejected'],
+        return {
+            'decision': decision,
+            'total_score': total_score,
+            'comment_body': comment_body,
+            'files': summary['files'],
+            'file_results': file_results,
+            'check_matrix': aggregator.matrix.pack(),
         }
-        add_labels(pr, label_map.get(decision, []))
 
-        # ── Auto-merge if configured and approved ─────────────────────────────
-        merged = False
-        if self.auto_merge and decision == 'APPROVE':
-            commit_msg = f"Auto-merge: {pr.title} (arbiter score {total_score}/100)"
-            merged = merge_pr(pr, commit_message=commit_msg, merge_method='squash')
-            if merged:
-                self.metrics['merged'] += 1
+    def _pr_static_score(self, results: List[Dict[str, Any]]) -> Tuple[int, bool]:
+        """
+        Average static score over a PR's files, with the required-failure cap
+        (same rule as ReviewAggregator.summary(), before AI results exist).
+
+        Returns:
+            Tuple of (avg_static, any_required_failure)
+        """
+        matrix = CheckMatrix(self.checklist.get('checks', []), capacity=len(results))
+        for r in results:
+            matrix.add(r)
+        avg_static, _, any_required_failure = matrix.pr_static_score()
+        return avg_static, any_required_failure
+
+    def _skip_ai_if_disabled(self, pending: List[Dict[str, Any]]) -> bool:
+        """
+        With ai_evaluation disabled, give each pending file the result
+        evaluate_content() would return, without fetching reused or cached
+        files' content for it.
+
+        Returns:
+            True if AI evaluation is disabled (results updated, content released)
+        """
+        if self.checklist.get('ai_evaluation', {}).get('enabled', True):
+            return False
+        for result in pending:
+            result['ai_result'] = compact_ai_result(disabled_result())
+            result.pop('content', None)
+        return True
+
+    def _skip_ai_if_decided(
+        self,
+        product: str,
+        pr_number: int,
+        results: List[Dict[str, Any]],
+        pending: List[Dict[str, Any]],
+    ) -> bool:
+        """
+        Skip AI evaluation when no AI result could change the PR's decision.
+
+        The AI adds 0..ai_evaluation.weight points to the averaged static
+        score; when both ends of that range give the same decision, each
+        pending file gets a zero-contribution 'skipped' result instead of an
+        LLM call.
+
+        Args:
+            product:   Product key (logging)
+            pr_number: PR number (logging)
+            results:   Every file result of the PR (decides the static score)
+            pending:   The results still lacking an AI result
+
+        Returns:
+            True if AI evaluation was skipped (results updated, content released)
+        """
+        ai_cfg = self.checklist.get('ai_evaluation', {})
+        if not (self.skip_decided_ai and ai_cfg.get('enabled', True) and results):
+            return False
+
+        avg_static, _ = self._pr_static_score(results)
+        weight = ai_cfg.get('weight', 20)
+        decision = decision_if_fixed(avg_static, weight, self.thresholds)
+        if decision is None:
+            return False
+
+        logger.info(
+            f"[{product}] PR #{pr_number} — static score {avg_static} gives {decision} "
+            f"for any AI score; skipping AI for {len(pending)} file(s)"
+        )
+        reason = (
+            f"Static score {avg_static} gives {decision} with any AI contribution "
+            f"(0–{weight} points)."
+        )
+        for result in pending:
+            result['ai_result'] = skipped_result(reason)
+            result.pop('content', None)
+        self._incr('ai_prs_skipped', self.metrics)
+        self._incr('ai_files_skipped', self.metrics, n=len(pending))
+        return True
+
+    def _record_review(
+        self,
+        repo_url: str,
+        pr_number: int,
+        product: str,
+        pr_updated_at: str,
+        verdict: Dict[str, Any],
+        merged: bool,
+        product_metrics: Dict,
+        duration_s: Optional[float] = None,
+        head_sha: Optional[str] = None,
+        checked_files: Optional[int] = None,
+    ) -> None:
+        """
+        Persist a posted review and update run- and product-level counters.
+        ``checked_files`` counts the files checked or AI-evaluated in this
+        review, as opposed to reused; it feeds the scheduler's per-file latency.
+        """
+        decision = verdict['decision']
+        total_score = verdict['total_score']
+        n = verdict['files']
 
-        # ── Persist state ─────────────────────────────────────────────────────
         self.state_repo.save_review(
             repo_url=repo_url,
-            pr_number=pr.number,
+            pr_number=pr_number,
             product=product,
             decision=decision,
             score=total_score,
             pr_updated_at=pr_updated_at,
+            duration_s=duration_s,
+            files=n,
+            head_sha=head_sha,
+            check_matrix=verdict.get('check_matrix'),
+            checked_files=checked_files,
         )
+        # Also the known-good verdicts trivial diffs reuse (_reuse_trivial)
+        if self.incremental or self.trivial_kinds:
+            self.file_store.save(
+                repo_url, pr_number, verdict['file_results'], approved=decision == 'APPROVE',
+            )
+        self.file_store.clear_checkpoint(repo_url, pr_number)
+        self.state_repo.clear_deferred(repo_url, pr_number)
 
-        # ── Update both run-level and product-level counters ──────────────────
-        self.metrics['prs_reviewed'] += 1
+        self._incr('prs_reviewed', self.metrics)
+        if merged:
+            self._incr('merged', self.metrics)
 
         # All decisions count as successfully reviewed — agent completed its job
-        product_metrics['files_reviewed'] += n
-
-        if decision == 'APPROVE':
-            self.metrics['approved'] += 1
-            product_metrics['approved'] += 1
-        elif decision == 'REQUEST_CHANGES':
-            self.metrics['request_changes'] += 1
-            product_metrics['request_changes'] += 1
-        else:
-            self.metrics['rejected'] += 1
-            product_metrics['rejected'] += 1
+        self._incr('files_reviewed', product_metrics, n=n)
+
+        decision_key = {
+            'APPROVE': 'approved',
+            'REQUEST_CHANGES': 'request_changes',
+        }.get(decision, 'rejected')
+        self._incr(decision_key, self.metrics, product_metrics)
 
         logger.info(
-            f"[{product}] PR #{pr.number} -> {decision} "
+            f"[{product}] PR #{pr_number} -> {decision} "
             f"(score={total_score}, files={n}, merged={merged})"
         )
 
+    def _needs_review(self, repo_url: str, pr_number: int, head_sha: str) -> bool:
+        """
+        True for a PR never reviewed, or — with incremental re-review — one
+        with new commits since its last review.
+        """
+        if not self.state_repo.was_reviewed(repo_url, pr_number):
+            return True
+        return self.incremental and self.state_repo.needs_re_review(
+            repo_url, pr_number, head_sha=head_sha,
+        )
+
+    def _split_unchanged(
+        self,
+        product: str,
+        pr_number: int,
+        english_files: List[Dict[str, Any]],
+        previous: Dict[str, Dict[str, Any]],
+        checkpoint: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Separate files whose blob SHA matches the last review, or a checkpoint
+        of an interrupted review at the same head, from the rest.  Results
+        stored under a different checklist are not reused.
+
+        Checkpointed files that were already AI-evaluated are flagged
+        'resumed' (see _resumed_ai()).
+
+        Returns:
+            Tuple of (files to fetch and evaluate,
+                      {path: reused result} ready for _decide_pr)
+        """
+        checkpoint = checkpoint or {}
+        fresh: List[Dict[str, Any]] = []
+        reused: Dict[str, Dict[str, Any]] = {}
+        resumed = 0
+        for file_info in english_files:
+            path = file_info['path']
+            prior = checkpoint.get(path)
+            from_checkpoint = prior is not None
+            if prior is None:
+                prior = previous.get(path)
+            if (prior and file_info.get('sha') and prior.get('sha') == file_info['sha']
+                    and self._same_checklist(prior)):
+                reused[path] = {'path': path, 'stratum': 'other/small', **prior}
+                if from_checkpoint:
+                    resumed += 1
+                    ai_result = prior.get('ai_result')
+                    if ai_result and not ai_result.get('skipped'):
+                        reused[path]['resumed'] = True
+            else:
+                fresh.append(file_info)
+
+        if previous:
+            logger.info(
+                f"[{product}] PR #{pr_number} re-review: {len(fresh)} changed file(s), "
+                f"{len(reused) - resumed} reused from the last review"
+            )
+            self._incr('files_reused', self.metrics, n=len(reused) - resumed)
+        if resumed:
+            logger.info(
+                f"[{product}] PR #{pr_number} resumed: {resumed} file(s) restored "
+                f"from the checkpoint"
+            )
+            self._incr('files_resumed', self.metrics, n=resumed)
+        return fresh, reused
+
+    def _has_changes(
+        self,
+        repo_url: str,
+        pr_number: int,
+        head_sha: str,
+        pr_updated_at: str,
+        fresh: List[Dict[str, Any]],
+        reused: Dict[str, Dict[str, Any]],
+        previous: Dict[str, Dict[str, Any]],
+    ) -> bool:
+        """
+        False when a re-reviewed PR's reviewed files are exactly as before
+        (only other files changed): the stored review is moved to the new
+        head instead of posting an identical one.
+        """
+        if not previous or fresh or len(reused) != len(previous):
+            return True
+        logger.info(
+            f"PR #{pr_number}: new commits leave every reviewed file unchanged — "
+            f"keeping the previous review"
+        )
+        self.state_repo.update_review_head(repo_url, pr_number, head_sha, pr_updated_at)
+        self._incr('prs_skipped', self.metrics)
+        return False
+
+    @staticmethod
+    def _merge_results(
+        paths: List[str],
+        fresh: List[Dict[str, Any]],
+        reused: Dict[str, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Combine fresh and reused file results in the PR's file order."""
+        by_path = {r['path']: r for r in fresh}
+        by_path.update(reused)
+        return [by_path[path] for path in paths if path in by_path]
+
+    @staticmethod
+    def _ai_pending(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Results without an AI evaluation: fresh files, or reused ones whose AI was skipped."""
+        return [
+            r for r in results
+            if 'ai_result' not in r or r['ai_result'].get('skipped')
+        ]
+
+    @staticmethod
+    def _resumed_ai(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Results whose AI evaluation was restored from a checkpoint (flag cleared)."""
+        return [r for r in results if r.pop('resumed', False)]
+
+    def _sample_for_ai(
+        self,
+        product: str,
+        pr_number: int,
+        pending: List[Dict[str, Any]],
+        evaluated: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split the files awaiting AI evaluation into a stratified sample and
+        the rest, when review.ai_sampling is enabled and the PR has at least
+        ``min_files`` of them.  Sample size follows the confidence target.
+
+        Files already evaluated before a resume count towards the population,
+        so the plan — deterministic per path — matches the interrupted run.
+
+        Returns:
+            Tuple of (files to evaluate, files to score by stratum mean)
+        """
+        cfg = self.sampling_cfg
+        population = pending + list(evaluated or [])
+        if not cfg.get('enabled', False) or len(population) < int(cfg.get('min_files', 100)):
+            return pending, []
+
+        target = sample_size(
+            len(population),
+            confidence=float(cfg.get('confidence', 0.95)),
+            margin=float(cfg.get('margin', 5)),
+            stddev=float(cfg.get('assumed_stddev', 15)),
+        )
+        chosen = plan_sample(population, target, int(cfg.get('min_per_stratum', 2)))
+        # ``pending`` leads ``population``, so zip() stops at the pending files
+        sample = [r for r, keep in zip(pending, chosen) if keep]
+        unsampled = [r for r, keep in zip(pending, chosen) if not keep]
+        for result in unsampled:
+            result.pop('content', None)  # imputed, never sent to the AI
+
+        logger.info(
+            f"[{product}] PR #{pr_number} — AI sample: {sum(chosen)} of {len(population)} "
+            f"file(s) across {len({r['stratum'] for r in population})} strata"
+            + (f" ({len(population) - len(pending)} already evaluated)" if evaluated else '')
+        )
+        self._incr('ai_files_estimated', self.metrics, n=len(unsampled))
+        return sample, unsampled
+
+    @staticmethod
+    def _impute_unsampled(
+        sample: List[Dict[str, Any]],
+        unsampled: List[Dict[str, Any]],
+    ) -> None:
+        """Score files left out of the AI sample with their stratum's mean; release their content."""
+        if not unsampled:
+            return
+        means = stratum_means(sample)
+        overall = (
+            (sum(m[0] for m in means.values()) / len(means),
+             sum(m[1] for m in means.values()) / len(means))
+            if means else (0, 0)
+        )
+        for result in unsampled:
+            score, contribution = means.get(result['stratum'], overall)
+            result['ai_result'] = estimated_result(score, contribution)
+            result.pop('content', None)
+
+    def _ai_requests(self, pending: List[Dict[str, Any]]) -> List[List[Tuple[str, str]]]:
+        """
+        Group files awaiting AI evaluation into requests of (path, content)
+        documents: packed by review.ai_batching when enabled, else one file
+        each.  Concatenated, the groups keep ``pending`` order.
+        """
+        documents = [(r['path'], r['content']) for r in pending]
+        if not self.ai_batching:
+            return [[document] for document in documents]
+        return plan_batches(documents, self.ai_batch_tokens, self.ai_batch_files)
+
+    @staticmethod
+    def _attach_ai_results(
+        pending: List[Dict[str, Any]],
+        ai_results: List[Dict[str, Any]],
+    ) -> None:
+        """Store each file's (compacted) AI result and release its content."""
+        for result, ai_result in zip(pending, ai_results):
+            result['ai_result'] = compact_ai_result(ai_result)
+            del result['content']
+
+    def _load_checkpoint(
+        self,
+        product: str,
+        repo_url: str,
+        pr_number: int,
+        head_sha: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-file progress of an interrupted review at ``head_sha``, if checkpointing is on."""
+        if not self.checkpointing:
+            return {}
+        checkpoint = self.file_store.get_checkpoint(repo_url, pr_number, head_sha)
+        if checkpoint:
+            logger.info(
+                f"[{product}] PR #{pr_number} — resuming an interrupted review "
+                f"({len(checkpoint)} file(s) checkpointed at {head_sha[:7]})"
+            )
+        return checkpoint
+
+    def _checkpoint(
+        self,
+        repo_url: str,
+        pr_number: int,
+        head_sha: str,
+        results: List[Dict[str, Any]],
+    ) -> None:
+        """Save the given file results to the PR's checkpoint."""
+        if self.checkpointing and results:
+            self.file_store.save_checkpoint(
+                repo_url, pr_number, head_sha,
+                {r['path']: self._file_record(r) for r in results},
+            )
+
+    def _checkpoint_batches(self, items: List[Any]) -> List[List[Any]]:
+        """
+        Split ``items`` into review.checkpoint.batch_files chunks.  The AI
+        stage fetches, evaluates and checkpoints one chunk at a time, so the
+        size also bounds the contents it holds.
+        """
+        size = self.checkpoint_batch
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def _file_record(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The stored form of a file result (file_results and checkpoints tables),
+        tagged with the fingerprint of the checklist it was checked under.
+        """
+        record = {
+            'sha': result.get('sha', ''),
+            'checklist': self._checklist_key,
+            'stratum': result['stratum'],
+            'static_score': result['static_score'],
+            'failed_checks': result['failed_checks'],
+        }
+        if result.get('skipped_checks'):
+            record['skipped_checks'] = result['skipped_checks']
+        if result.get('timed_out_checks'):
+            record['timed_out_checks'] = result['timed_out_checks']
+        if result.get('unresolved_links'):
+            record['unresolved_links'] = result['unresolved_links']
+            record['unresolved_link_count'] = result['unresolved_link_count']
+        if result.get('trivial'):
+            record['trivial'] = result['trivial']
+        if 'ai_result' in result:
+            record['ai_result'] = result['ai_result']
+        return record
+
+    @staticmethod
+    def _attach_contents(
+        pending: List[Dict[str, Any]],
+        refetched: List[Dict[str, Any]],
+        contents: List[Optional[str]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Give re-fetched content to reused results; those that could not be
+        fetched keep their earlier (skipped) AI result and drop out of ``pending``.
+        """
+        for result, content in zip(refetched, contents):
+            if content is not None:
+                result['content'] = content
+        return [r for r in pending if 'content' in r]
+
+    def _check_files(
+        self,
+        product: str,
+        english_files: List[Dict[str, Any]],
+        contents: List[Optional[str]],
+        pr_files: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the static checklist over fetched files, in file order.
+
+        Files whose content could not be fetched are dropped.  Results are
+        compact — failed check ids instead of full check results — and each
+        file's patch is released once scored; 'content' stays on the result
+        for _check_chunk() to keep or release.  When the PR checks at least
+        review.parallel_checks.min_files files (``pr_files``, all chunks
+        together; default: these files), the checklist runs on worker
+        processes — as it always does under a check_timeout_ms budget off
+        the main thread, which cannot enforce it.  Files with a timed-out
+        check are not cached.  Links are resolved by the caller.
+        """
+        # (file info, parsed document, run_checks() context, check-cache key)
+        fetched: List[Tuple[Dict[str, Any], ParsedDocument, Dict[str, Any], Optional[str]]] = []
+        for file_info, content in zip(english_files, contents):
+            if content is None:
+                logger.warning(f"[{product}] Could not fetch {file_info['path']} — skipping file")
+                continue
+            # Cache key first: it may hash the patch, which is released here.
+            # Parsed once for the checklist and the sampling stratum.
+            key = self._check_cache_key(file_info)
+            fetched.append((file_info, ParsedDocument(content), {'patch': file_info.pop('patch', '')}, key))
+
+        if (self.parallel_checks and fetched and (pr_files or len(fetched)) >= self.parallel_min_files) or (
+            fetched and budget_needs_worker(self.checklist)
+        ):
+            logger.info(f"[{product}] Checking {len(fetched)} files on worker processes")
+            scored = run_checks_batch(
+                [(doc.content, context) for _, doc, context, _ in fetched],
+                self.checklist, workers=self.check_workers, timed=self.check_timing,
+                pool=self._worker_pool(),
+            )
+        else:
+            scored = [
+                run_checks(doc, self.checklist, context=context, timed=self.check_timing)
+                for _, doc, context, _ in fetched
+            ]
+        if self.check_timing:
+            profile = self._check_profile(product)
+            for _, check_results in scored:
+                profile.add(check_results)
+
+        results: List[Dict[str, Any]] = []
+        cache_entries: Dict[str, Dict[str, Any]] = {}
+        for (file_info, doc, _, key), (static_score, check_results) in zip(fetched, scored):
+            page = page_type(doc)
+            result = {
+                'path': file_info['path'],
+                'sha': file_info.get('sha', ''),
+                'stratum': stratum_key(
+                    page, file_info, self.sampling_cfg.get('diff_size_buckets', [20, 200]),
+                ),
+                'content': doc.content,
+                'static_score': static_score,
+                'failed_checks': [c['id'] for c in check_results if c['outcome'] in ('fail', 'timeout')],
+            }
+            # Not evaluated under the checklist's fast_fail mode
+            skipped = [c['id'] for c in check_results if c['outcome'] == 'skipped']
+            if skipped:
+                result['skipped_checks'] = skipped
+            # Stopped by check_timeout_ms; also failed, but not worth caching
+            timed_out = [c['id'] for c in check_results if c['outcome'] == 'timeout']
+            if timed_out:
+                result['timed_out_checks'] = timed_out
+                self._incr('check_timeouts', self.metrics, n=len(timed_out))
+                logger.warning(f"[{product}] {file_info['path']}: check(s) timed out: {', '.join(timed_out)}")
+            results.append(result)
+            if key and not timed_out:
+                cache_entries[key] = {
+                    'static_score': static_score,
+                    'failed_checks': result['failed_checks'],
+                    'skipped_checks': skipped,
+                    'page_type': page,
+                }
+
+        if self.check_cache is not None:
+            self.check_cache.put_many(self._checklist_key, cache_entries)
+        return results
+
+    def _resolve_links(self, link_index: Optional[LinkIndex], result: Dict[str, Any]) -> None:
+        """
+        Record a file's unresolved internal links in its result
+        ('unresolved_links', 'unresolved_link_count') and, when the checklist
+        has the internal_links_resolve check, fail it: the score is
+        recomputed without its weight, capped if it is required.
+
+        A link verdict the result carried in (from an earlier review, a
+        trivial-diff verdict or a checkpoint) is dropped first, so it only
+        ever reflects ``link_index``.  Without an index, or without the
+        file's content, the links are not judged.
+        """
+        result.pop('unresolved_links', None)
+        result.pop('unresolved_link_count', None)
+        if LINK_CHECK_ID in result['failed_checks']:
+            result['failed_checks'] = [c for c in result['failed_checks'] if c != LINK_CHECK_ID]
+            result['static_score'] = self._static_score(result)
+        if link_index is None:
+            return
+        if result.get('content') is None:
+            logger.warning(f"{result['path']}: content unavailable — links not resolved")
+            return
+
+        count, links = link_index.unresolved(result['content'], result['path'])
+        if not count:
+            return
+        result['unresolved_links'] = links
+        result['unresolved_link_count'] = count
+        self._incr('links_unresolved', self.metrics, n=count)
+        if self._link_check is None:
+            return
+        # A new list: the check cache entry shares the old one
+        result['failed_checks'] = result['failed_checks'] + [LINK_CHECK_ID]
+        result['static_score'] = self._static_score(result)
+
+    def _static_score(self, result: Dict[str, Any]) -> int:
+        """
+        A file's static score from its failed and skipped checks: the weight
+        of the rest, capped at REQUIRED_CAP when a required check failed —
+        the score run_checks() gives it.
+        """
+        failed = set(result['failed_checks'])
+        not_earned = failed | set(result.get('skipped_checks', ()))
+        raw_score = sum(
+            check['weight'] for check in self.checklist.get('checks', [])
+            if check['id'] not in not_earned
+        )
+        if failed & self._required_checks:
+            return min(raw_score, REQUIRED_CAP)
+        return raw_score
+
+    def _new_link_index(self, pr_files: List[Dict[str, Any]]) -> Optional[LinkIndex]:
+        """An empty LinkIndex, or None when disabled or no PR file is under the content root."""
+        if self.tree_cache is None:
+            return None
+        index = LinkIndex(self.link_root, self.link_language)
+        return index if index.families(pr_files) else None
+
+    def _build_link_index(
+        self,
+        repo,
+        base_sha: str,
+        pr_files: List[Dict[str, Any]],
+    ) -> Optional[LinkIndex]:
+        """
+        Index the URLs of every family the PR touches: the family's tree at
+        the PR's base (from the tree cache, or one git tree API call), with
+        the PR's added and removed pages on top.
+
+        Returns:
+            The LinkIndex, or None when link resolution does not apply
+        """
+        index = self._new_link_index(pr_files)
+        if index is None:
+            return None
+        for family in index.families(pr_files):
+            directory = index.family_dir(family)
+            with self._tree_shas_lock:
+                known = (base_sha, directory) in self._tree_shas
+                tree_sha = self._tree_shas.get((base_sha, directory))
+            if not known:
+                # Looked up outside the lock; PR workers racing on it get the same SHA
+                tree_sha = get_tree_sha(repo, directory, base_sha)
+                with self._tree_shas_lock:
+                    self._tree_shas[(base_sha, directory)] = tree_sha
+            paths = self.tree_cache.get(tree_sha) if tree_sha else None
+            if tree_sha and paths is None:
+                paths = get_tree_paths(repo, tree_sha)
+                self._store_tree(tree_sha, paths)
+            self._index_tree(index, family, tree_sha, paths)
+        index.add_pr_files(pr_files)
+        return index
+
+    def _store_tree(self, tree_sha: str, paths: Optional[List[str]]) -> None:
+        """Cache a tree fetched from the git tree API."""
+        if paths is not None:
+            self.tree_cache.put(tree_sha, paths)
+            self._incr('link_trees_fetched', self.metrics)
+
+    @staticmethod
+    def _index_tree(
+        index: LinkIndex,
+        family: str,
+        tree_sha: Optional[str],
+        paths: Optional[List[str]],
+    ) -> None:
+        """Add a family's tree to the index; without one, its links are not judged."""
+        if paths is None:
+            logger.warning(
+                f"No tree for {index.family_dir(family)} (tree {tree_sha}) — "
+                f"links into '{family}' are not resolved"
+            )
+            return
+        index.add_tree(family, tree_urls(family, paths))
+
+    def _worker_pool(self) -> ProcessPoolExecutor:
+        """The run's check worker processes (see check_pool()), started on first use."""
+        with self._check_pool_lock:
+            if self._check_pool is None:
+                self._check_pool = check_pool(self.checklist, self.check_workers, timed=self.check_timing)
+            return self._check_pool
+
+    def _check_profile(self, product: str) -> CheckProfile:
+        """The product's CheckProfile for this run, created on first use."""
+        with self._metrics_lock:
+            return self.check_profiles.setdefault(product, CheckProfile())
+
+    def _check_cache_key(self, file_info: Dict[str, Any]) -> Optional[str]:
+        """
+        Check-cache key of a file: its blob SHA, plus a hash of the patch
+        when the checklist has diff-aware checks.  None without a SHA.
+        """
+        sha = file_info.get('sha')
+        if not sha:
+            return None
+        if self._cache_by_patch:
+            patch = file_info.get('patch') or ''
+            return f"{sha}:{hashlib.sha1(patch.encode('utf-8')).hexdigest()}"
+        return sha
+
+    def _same_checklist(self, prior: Dict[str, Any]) -> bool:
+        """
+        True when a stored file result was checked under the current checklist;
+        records from before fingerprints were stored count as stale.
+        """
+        return prior.get('checklist') == self._checklist_key
+
+    def _reuse_trivial(
+        self,
+        product: str,
+        repo_url: str,
+        pr_number: int,
+        fresh: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Take files whose patch only changes a version stamp, whitespace or
+        frontmatter (see classify_patch()) and that an approved review of
+        another PR already judged under the current checklist: they keep
+        that verdict — static result and AI result — and are neither fetched
+        nor checked.  A reused AI result that was skipped is still evaluated
+        by the AI stage.
+
+        Returns:
+            Tuple of (results flagged 'trivial' with their kind, files still to check)
+        """
+        if not self.trivial_kinds or not fresh:
+            return [], fresh
+        kinds = {f['path']: classify_patch(f.get('patch'), self.trivial_kinds) for f in fresh}
+        candidates = [path for path, kind in kinds.items() if kind]
+        if not candidates:
+            return [], fresh
+        known = self.file_store.get_known_good(repo_url, candidates, exclude_pr=pr_number)
+
+        trivial: List[Dict[str, Any]] = []
+        remaining: List[Dict[str, Any]] = []
+        for file_info in fresh:
+            prior = known.get(file_info['path'])
+            if prior is None or not self._same_checklist(prior):
+                remaining.append(file_info)
+                continue
+            file_info.pop('patch', None)
+            trivial.append({
+                **prior,
+                'path': file_info['path'],
+                'sha': file_info.get('sha', ''),
+                'stratum': stratum_key(
+                    prior['stratum'].split('/')[0], file_info,
+                    self.sampling_cfg.get('diff_size_buckets', [20, 200]),
+                ),
+                'trivial': kinds[file_info['path']],
+            })
+
+        self._incr('files_trivial', self.metrics, n=len(trivial))
+        logger.info(
+            f"[{product}] PR #{pr_number}: {len(candidates)} of {len(fresh)} file(s) with "
+            f"trivial diffs, {len(trivial)} reusing their last approved verdict"
+        )
+        return trivial, remaining
+
+    def _cached_checks(
+        self,
+        product: str,
+        pr_number: int,
+        fresh: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Take files whose content was checked before, in any PR, from the
+        check cache.  Cached files are neither fetched nor checked; the AI
+        stage fetches them if they still need an AI evaluation.
+
+        Returns:
+            Tuple of (results from the cache, files still to fetch and check)
+        """
+        if self.check_cache is None or not fresh:
+            return [], fresh
+        keys = {f['path']: self._check_cache_key(f) for f in fresh}
+        lookups = [key for key in keys.values() if key]
+        found = self.check_cache.get_many(self._checklist_key, lookups)
+
+        cached: List[Dict[str, Any]] = []
+        remaining: List[Dict[str, Any]] = []
+        for file_info in fresh:
+            entry = found.get(keys[file_info['path']])
+            if entry is None:
+                remaining.append(file_info)
+                continue
+            file_info.pop('patch', None)
+            result = {
+                'path': file_info['path'],
+                'sha': file_info['sha'],
+                'stratum': stratum_key(
+                    entry['page_type'], file_info,
+                    self.sampling_cfg.get('diff_size_buckets', [20, 200]),
+                ),
+                'static_score': entry['static_score'],
+                'failed_checks': entry['failed_checks'],
+            }
+            if entry['skipped_checks']:
+                result['skipped_checks'] = entry['skipped_checks']
+            cached.append(result)
+
+        self._incr('check_cache_lookups', self.metrics, n=len(lookups))
+        self._incr('check_cache_hits', self.metrics, n=len(cached))
+        if cached:
+            logger.info(
+                f"[{product}] PR #{pr_number}: {len(cached)} of {len(fresh)} file(s) "
+                f"from the check cache"
+            )
+        return cached, remaining
+
+    @staticmethod
+    def _map_files(pool: Optional[ThreadPoolExecutor], fn, items: List[Any]) -> List[Any]:
+        """Apply ``fn`` to each item, on ``pool`` when fan-out is enabled; order is preserved."""
+        if pool is None:
+            return [fn(item) for item in items]
+        return list(pool.map(fn, items))
+
     # ── Summary ───────────────────────────────────────────────────────────────
 
     def _log_summary(self) -> None:
@@ -445,6 +1917,7 @@ class PRArbitrAgent:
         logger.info(f"  PRs found:       {self.metrics['prs_found']}")
         logger.info(f"  PRs skipped:     {self.metrics['prs_skipped']}")
         logger.info(f"  PRs reviewed:    {self.metrics['prs_reviewed']}")
+        logger.info(f"  PRs deferred:    {self.metrics['prs_deferred']}")
         logger.info(f"    Approved:      {self.metrics['approved']}")
         logger.info(f"    Req. changes:  {self.metrics['request_changes']}")
         logger.info(f"    Rejected:      {self.metrics['rejected']}")
@@ -452,8 +1925,55 @@ class PRArbitrAgent:
         logger.info(f"  Errors:          {self.metrics['errors']}")
         logger.info(f"  AI tokens used:  {self.ai_client.token_usage}")
         logger.info(f"  AI API calls:    {self.ai_client.api_calls}")
+        if self.ai_cache is not None:
+            logger.info(
+                f"  AI cache:        {self.ai_client.cache_hits} hit(s), "
+                f"{self.ai_client.tokens_saved} tokens saved"
+            )
+        logger.info(f"  Files reused:    {self.metrics['files_reused']} (unchanged since last review)")
+        logger.info(f"  Files resumed:   {self.metrics['files_resumed']} (checkpointed by an interrupted run)")
+        logger.info(f"  Files trivial:   {self.metrics['files_trivial']} (last approved verdict reused)")
+        lookups = self.metrics['check_cache_lookups']
+        hits = self.metrics['check_cache_hits']
+        logger.info(
+            f"  Check cache:     {hits}/{lookups} file(s) "
+            f"({hits / lookups if lookups else 0:.1%} hit rate)"
+        )
+        if self.tree_cache is not None:
+            logger.info(
+                f"  Link index:      {self.metrics['links_unresolved']} unresolved link(s), "
+                f"{self.metrics['link_trees_fetched']} tree(s) fetched"
+            )
+        if self.metrics['check_timeouts']:
+            logger.info(f"  Check timeouts:  {self.metrics['check_timeouts']} (check_timeout_ms exceeded)")
+        logger.info(f"  AI estimated:    {self.metrics['ai_files_estimated']} file(s) outside the AI sample")
+        logger.info(
+            f"  AI skipped:      {self.metrics['ai_files_skipped']} file(s) in "
+            f"{self.metrics['ai_prs_skipped']} PR(s) (decision fixed by static score)"
+        )
+        if self.check_timing:
+            CheckProfile.combined(self.check_profiles.values()).log(self.check_timing_show)
+        self._log_pipeline_stats()
         logger.info("=" * 70)
 
+    def _log_pipeline_stats(self) -> None:
+        """Per-stage queue depth and throughput of each staged-pipeline run."""
+        for run in self.pipeline_stats:
+            logger.info(
+                f"  Pipeline [{run['product']}]: {run['submitted']} PR(s) submitted, "
+                f"{run['blocked_s']:.1f}s blocked on backpressure"
+            )
+            logger.info(
+                f"    {'stage':<8} {'workers':>7} {'done':>5} {'dropped':>7} {'errors':>6} "
+                f"{'busy_s':>7} {'max_q':>5} {'avg_q':>5} {'items/s':>7}"
+            )
+            for row in run['stages']:
+                logger.info(
+                    f"    {row['stage']:<8} {row['workers']:>7} {row['processed']:>5} "
+                    f"{row['dropped']:>7} {row['errors']:>6} {row['busy_s']:>7.1f} "
+                    f"{row['max_queue']:>5} {row['avg_queue']:>5.1f} {row['throughput']:>7.2f}"
+                )
+
     # ── Weekly report ─────────────────────────────────────────────────────────
 
     def _maybe_send_weekly_report(self) -> None:
@@ -472,17 +1992,48 @@ class PRArbitrAgent:
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
+    def _incr(self, key: str, *counters: Dict, n: int = 1) -> None:
+        """Increment ``key`` in each of the given counter dicts under the metrics lock."""
+        with self._metrics_lock:
+            for counter in counters:
+                counter[key] += n
+
     def _reset_metrics(self) -> None:
         self.metrics: Dict[str, int] = {
             'prs_found': 0,
             'prs_skipped': 0,
             'prs_reviewed': 0,
+            'prs_deferred': 0,
             'approved': 0,
             'request_changes': 0,
             'rejected': 0,
             'merged': 0,
             'errors': 0,
+            # AI evaluation skipped because it could not change the decision
+            'ai_prs_skipped': 0,
+            'ai_files_skipped': 0,
+            # Files scored by their stratum's mean instead of an AI call
+            'ai_files_estimated': 0,
+            # Unchanged files whose earlier results an incremental re-review reused
+            'files_reused': 0,
+            # Files restored from the checkpoint of an interrupted review
+            'files_resumed': 0,
+            # Files with trivial diffs that took their last approved verdict
+            'files_trivial': 0,
+            # Files looked up in / served from the static-check cache
+            'check_cache_lookups': 0,
+            'check_cache_hits': 0,
+            # Checks stopped by the checklist's check_timeout_ms
+            'check_timeouts': 0,
+            # Family trees fetched for the link index (cache misses), and
+            # internal links that resolved to no page
+            'link_trees_fetched': 0,
+            'links_unresolved': 0,
         }
+        # One entry per staged-pipeline run (see _run_pipeline)
+        self.pipeline_stats: List[Dict[str, Any]] = []
+        # product → per-check timings of this run (review.check_timing)
+        self.check_profiles: Dict[str, CheckProfile] = {}
 
     @staticmethod
     def _blank_product_metrics() -> Dict:
@@ -514,6 +2065,8 @@ def main() -> None:
         python -m src.main                         # Review all products (unlimited)
         python -m src.main --product words         # Review only 'words'
         python -m src.main --product words --max-prs 1   # One PR, rotation mode
+        python -m src.main --async                 # Asyncio engine
+        python -m src.main --no-ai-cache           # Send every AI request to the model
         python -m src.main words                   # Legacy positional form
     """
     import argparse
@@ -536,21 +2089,47 @@ def main() -> None:
         dest='max_prs',
         help="Maximum number of PRs to review this run (default: unlimited).",
     )
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help="Time budget for this run; PRs that do not fit are deferred to the next run "
+             "(default: review.time_budget_s).",
+    )
+    parser.add_argument(
+        '--async',
+        action='store_true',
+        dest='use_async',
+        help="Run the asyncio engine (async GitHub, AI and metrics I/O on one event loop).",
+    )
+    parser.add_argument(
+        '--no-ai-cache',
+        action='store_false',
+        dest='ai_cache',
+        help="Neither read nor write the AI response cache this run (review.ai_cache).",
+    )
     # Legacy: positional product names without flags
     parser.add_argument('products_positional', nargs='*', help=argparse.SUPPRESS)
 
     args = parser.parse_args()
 
-    agent = PRArbitrAgent(config_path=args.config)
-
-    if args.product:
-        agent.run(product_filter=args.product, max_prs=args.max_prs)
-    elif args.products_positional:
-        for product in args.products_positional:
-            agent.run(product_filter=product, max_prs=args.max_prs)
+    if args.use_async:
+        from src.main_async import AsyncPRArbitrAgent
+        agent = AsyncPRArbitrAgent(config_path=args.config, ai_cache=args.ai_cache)
     else:
-        agent.run(product_filter=None, max_prs=args.max_prs)
-
+        agent = PRArbitrAgent(config_path=args.config, ai_cache=args.ai_cache)
+
+    try:
+        if args.product:
+            agent.run(product_filter=args.product, max_prs=args.max_prs, time_budget_s=args.deadline)
+        elif args.products_positional:
+            for product in args.products_positional:
+                agent.run(product_filter=product, max_prs=args.max_prs, time_budget_s=args.deadline)
+        else:
+            agent.run(product_filter=None, max_prs=args.max_prs, time_budget_s=args.deadline)
+    finally:
+        agent.close()
 
 if __name__ == '__main__':
     main()
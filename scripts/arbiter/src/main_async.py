@@ -0,0 +1,369 @@
+"""
+PR Arbiter — asyncio engine (``python -m src.main --async``)
+
+Same review pipeline as PRArbitrAgent, but every network call (GitHub REST,
+LLM, metrics endpoint) is a coroutine on one event loop.  PR and file
+concurrency is bounded by semaphores instead of thread pools, so thousands
+of content fetches can be in flight without a thread per request.
+
+The review stages and their steps (planning, scoring, aggregation, decision,
+comment building, state persistence) are shared with PRArbitrAgent; only the
+I/O differs.  Their blocking parts — state DB, SQLite caches, the static
+check pool — run in worker threads via asyncio.to_thread().
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional, Set
+
+from src.ai.client import AsyncAIClient
+from src.github.async_client import AsyncGitHubClient
+from src.main import _LABELS, _REVIEW_STAGES, PRArbitrAgent
+from src.review.evaluator import evaluate_batch_async
+from src.review.link_index import LinkIndex
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AsyncPRArbitrAgent(PRArbitrAgent):
+    """PRArbitrAgent whose GitHub, AI and metrics I/O runs on asyncio."""
+
+    def __init__(self, config_path: str = "config/config.yaml", ai_cache: bool = True):
+        super().__init__(config_path, ai_cache=ai_cache)
+        async_cfg = self.review_cfg.get('async_engine', {}) or {}
+        self.github_limit = max(1, int(async_cfg.get('github_limit', 64)))
+        self.ai_limit = max(1, int(async_cfg.get('ai_limit', 16)))
+
+    # ── Public entry point ────────────────────────────────────────────────────
+
+    def run(
+        self,
+        product_filter: Optional[str] = None,
+        max_prs: Optional[int] = None,
+        time_budget_s: Optional[float] = None,
+    ) -> None:
+        """Same contract as PRArbitrAgent.run(); drives the async engine to completion."""
+        self._start_run(time_budget_s)
+        asyncio.run(self._arun(product_filter, max_prs))
+
+    async def _arun(self, product_filter: Optional[str], max_prs: Optional[int]) -> None:
+        products = self._select_products(product_filter)
+        if not products:
+            return
+
+        # Clients are bound to this run's event loop, so they are created here
+        gpt_cfg = self.config['gpt_oss']
+        self.ai_client = AsyncAIClient(
+            base_url=gpt_cfg['endpoint'],
+            api_key=gpt_cfg['api_key'],
+            model=gpt_cfg['model'],
+            timeout=gpt_cfg.get('timeout', 120),
+            cache=self.ai_cache,
+        )
+        self.async_github = AsyncGitHubClient(
+            self.config['github']['token'],
+            max_connections=self.github_limit,
+        )
+        self._github_slots = asyncio.Semaphore(self.github_limit)
+        self._ai_slots = asyncio.Semaphore(self.ai_limit)
+
+        try:
+            for product_key, product_cfg in products.items():
+                product_start = datetime.now()
+                product_metrics = self._blank_product_metrics()
+
+                remaining = (
+                    max_prs - self.metrics['prs_reviewed']
+                    if max_prs is not None else None
+                )
+                if remaining is not None and remaining <= 0:
+                    logger.info(f"max_prs={max_prs} reached — stopping early")
+                    break
+
+                try:
+                    await self._aprocess_product(
+                        product_key, product_cfg, product_metrics,
+                        max_prs=remaining,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Unhandled error processing '{product_key}': {e}",
+                        exc_info=True,
+                    )
+                    self._incr('errors', self.metrics, product_metrics)
+
+                await self.metrics_logger.log_review_run_async(
+                    **self._product_run_metrics(product_key, product_metrics, product_start)
+                )
+        finally:
+            await self.async_github.close()
+            await self.ai_client.close()
+
+        self._finish_run()
+
+    # ── Per-product processing ────────────────────────────────────────────────
+
+    async def _aprocess_product(
+        self,
+        product: str,
+        cfg: Dict[str, Any],
+        product_metrics: Dict[str, int],
+        max_prs: Optional[int] = None,
+    ) -> None:
+        repo_url = cfg['content_repo']
+        logger.info(f"[{product}] Processing {repo_url} (async)")
+        full_name = AsyncGitHubClient.full_name(repo_url)
+
+        prs = await self.async_github.fetch_open_prs(
+            full_name,
+            branch_prefix=self.branch_prefix,
+            required_labels=self.pr_labels or None,
+        )
+        self._incr('prs_found', self.metrics, product_metrics, n=len(prs))
+        await asyncio.to_thread(self._prune_closed, repo_url, [pr['number'] for pr in prs])
+
+        estimates: Dict[int, float] = {}
+        if self.deadline is not None:
+            pending = await asyncio.to_thread(lambda: [
+                pr['number'] for pr in prs
+                if self._needs_review(repo_url, pr['number'], pr['head_sha'])
+            ])
+            counts = await asyncio.gather(*(
+                self._limited(
+                    self._github_slots,
+                    self.async_github.get_changed_file_count(full_name, number),
+                )
+                for number in pending
+            ))
+            file_counts = dict(zip(pending, counts))
+            prs, estimates = await asyncio.to_thread(
+                self._schedule_prs, prs, repo_url,
+                number_of=lambda pr: pr['number'],
+                file_count_of=lambda pr: file_counts.get(pr['number'], 0),
+                head_sha_of=lambda pr: pr['head_sha'],
+            )
+
+        # Same dispatch rule as the threaded engine: reviewed + in-flight never
+        # exceeds max_prs, and at most review.concurrency PRs run at once.
+        reviewed_this_product = 0
+        in_flight: Set[asyncio.Task] = set()
+
+        for pr in prs:
+            while in_flight and (
+                len(in_flight) >= self.concurrency
+                or (max_prs is not None
+                    and reviewed_this_product + len(in_flight) >= max_prs)
+            ):
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED,
+                )
+                reviewed_this_product += sum(1 for task in done if task.result())
+
+            if max_prs is not None and reviewed_this_product >= max_prs:
+                logger.info(f"[{product}] max_prs={max_prs} reached for this product — stopping")
+                break
+            if not await asyncio.to_thread(
+                self._fits_deadline, repo_url, pr['number'], estimates.get(pr['number'], 0.0),
+            ):
+                continue
+
+            in_flight.add(asyncio.create_task(
+                self._areview_pr_guarded(full_name, pr, product, repo_url, product_metrics)
+            ))
+
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            reviewed_this_product += sum(1 for task in done if task.result())
+
+    async def _areview_pr_guarded(
+        self,
+        full_name: str,
+        pr: Dict[str, Any],
+        product: str,
+        repo_url: str,
+        product_metrics: Dict,
+    ) -> bool:
+        try:
+            return await self._aprocess_pr(full_name, pr, product, repo_url, product_metrics)
+        except Exception as e:
+            logger.error(
+                f"[{product}] Error on PR #{pr['number']}: {e}",
+                exc_info=True,
+            )
+            self._incr('errors', self.metrics, product_metrics)
+            return False
+
+    # ── Per-PR processing ─────────────────────────────────────────────────────
+
+    async def _aprocess_pr(
+        self,
+        full_name: str,
+        pr: Dict[str, Any],
+        product: str,
+        repo_url: str,
+        product_metrics: Dict,
+    ) -> bool:
+        """Async counterpart of PRArbitrAgent._process_pr(); ``pr`` is an AsyncGitHubClient PR dict."""
+        job = self._new_async_job(full_name, pr, product, repo_url, product_metrics)
+        for stage in _REVIEW_STAGES:
+            job = await getattr(self, f"_astage_{stage}")(job)
+            if job is None:
+                return False
+        return True
+
+    @staticmethod
+    def _new_async_job(
+        full_name: str,
+        pr: Dict[str, Any],
+        product: str,
+        repo_url: str,
+        product_metrics: Dict,
+    ) -> Dict[str, Any]:
+        """PRArbitrAgent._new_job() for an AsyncGitHubClient PR dict; ``repo`` is the full name."""
+        return {
+            'repo': full_name,
+            'pr': pr,
+            'number': pr['number'],
+            'title': pr['title'],
+            'head_sha': pr['head_sha'],
+            'base_sha': pr['base_sha'],
+            'product': product,
+            'repo_url': repo_url,
+            'product_metrics': product_metrics,
+            'pr_updated_at': pr['updated_at'],
+        }
+
+    # ── Review stages ─────────────────────────────────────────────────────────
+    # Same stages and stage steps as PRArbitrAgent.  GitHub and LLM calls are
+    # awaited on the loop; state DB, cache and static-check work runs in a
+    # worker thread so it never blocks other PRs' I/O.
+
+    async def _astage_fetch(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Async counterpart of PRArbitrAgent._stage_fetch()."""
+        if not await asyncio.to_thread(self._open_review, job):
+            return None
+        pr_files = await self._limited(
+            self._github_slots, self.async_github.get_pr_files(job['repo'], job['number']),
+        )
+        if not await asyncio.to_thread(self._plan_files, job, pr_files):
+            return None
+        job['link_index'] = await self._abuild_link_index(job['repo'], job['base_sha'], pr_files)
+        return job
+
+    async def _astage_checks(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of PRArbitrAgent._stage_checks(): chunk contents are
+        fetched on the loop, one chunk ahead; checks run off the loop.
+        """
+        chunks = self._plan_chunks(job)
+        upcoming = self._afetch_chunk(job, chunks[0]) if chunks else None
+        for index, chunk in enumerate(chunks):
+            contents = await upcoming
+            if index + 1 < len(chunks):
+                upcoming = self._afetch_chunk(job, chunks[index + 1])
+            await asyncio.to_thread(self._check_chunk, job, chunk, contents)
+        await asyncio.to_thread(self._finish_checks, job)
+        return job
+
+    async def _astage_ai(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Async counterpart of PRArbitrAgent._stage_ai()."""
+        evaluated: List[Dict[str, Any]] = []
+        for batch in self._checkpoint_batches(await asyncio.to_thread(self._plan_ai, job)):
+            refetch = [r for r in batch if 'content' not in r]
+            batch = self._attach_contents(
+                batch, refetch,
+                await self._afetch_contents(job['repo'], job['head_sha'], [r['path'] for r in refetch]),
+            )
+            grouped = await asyncio.gather(*(
+                self._limited(
+                    self._ai_slots,
+                    evaluate_batch_async(
+                        documents=documents,
+                        ai_client=self.ai_client,
+                        prompt_path=self.prompt_path,
+                        batch_prompt_path=self.batch_prompt_path,
+                        checklist_config=self.checklist,
+                    ),
+                )
+                for documents in self._ai_requests(batch)
+            ))
+            await asyncio.to_thread(self._finish_ai_batch, job, batch, grouped)
+            evaluated += batch
+        self._finish_ai(job, evaluated)
+        return job
+
+    async def _astage_decide(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """PRArbitrAgent._stage_decide(), off the event loop."""
+        return await asyncio.to_thread(self._stage_decide, job)
+
+    async def _astage_publish(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Async counterpart of PRArbitrAgent._stage_publish()."""
+        verdict = job['verdict']
+        decision = verdict['decision']
+
+        await self.async_github.post_review(job['repo'], job['number'], decision, verdict['comment_body'])
+        await self.async_github.add_labels(job['repo'], job['number'], _LABELS.get(decision, []))
+
+        job['merged'] = False
+        if self.auto_merge and decision == 'APPROVE':
+            job['merged'] = await self.async_github.merge_pr(
+                job['repo'], job['number'],
+                commit_message=self._merge_message(job), merge_method='squash',
+            )
+        return job
+
+    async def _astage_persist(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """PRArbitrAgent._stage_persist(), off the event loop."""
+        return await asyncio.to_thread(self._stage_persist, job)
+
+    # ── Helpers ───────────────────────────────────────────────────────────────
+
+    def _afetch_chunk(self, job: Dict[str, Any], chunk) -> Awaitable[List[Optional[str]]]:
+        """Start fetching a chunk's contents (see PRArbitrAgent._chunk_paths()) as a task."""
+        return asyncio.ensure_future(
+            self._afetch_contents(job['repo'], job['head_sha'], self._chunk_paths(chunk)),
+        )
+
+    async def _afetch_contents(self, full_name: str, ref: str, paths: List[str]) -> List[Optional[str]]:
+        """Fetch file contents at ``ref`` concurrently, in ``paths`` order."""
+        return list(await asyncio.gather(*(
+            self._limited(
+                self._github_slots,
+                self.async_github.get_file_content(full_name, path, ref),
+            )
+            for path in paths
+        )))
+
+    async def _abuild_link_index(
+        self,
+        full_name: str,
+        base_sha: str,
+        pr_files: List[Dict[str, Any]],
+    ) -> Optional[LinkIndex]:
+        """Async counterpart of PRArbitrAgent._build_link_index()."""
+        index = self._new_link_index(pr_files)
+        if index is None:
+            return None
+        for family in index.families(pr_files):
+            directory = index.family_dir(family)
+            if (base_sha, directory) not in self._tree_shas:
+                self._tree_shas[(base_sha, directory)] = await self._limited(
+                    self._github_slots, self.async_github.get_tree_sha(full_name, directory, base_sha),
+                )
+            tree_sha = self._tree_shas[(base_sha, directory)]
+            paths = await asyncio.to_thread(self.tree_cache.get, tree_sha) if tree_sha else None
+            if tree_sha and paths is None:
+                paths = await self._limited(
+                    self._github_slots, self.async_github.get_tree_paths(full_name, tree_sha),
+                )
+                await asyncio.to_thread(self._store_tree, tree_sha, paths)
+            self._index_tree(index, family, tree_sha, paths)
+        index.add_pr_files(pr_files)
+        return index
+
+    @staticmethod
+    async def _limited(slots: asyncio.Semaphore, awaitable: Awaitable[Any]) -> Any:
+        """Await ``awaitable`` while holding one of ``slots``."""
+        async with slots:
+            return await awaitable
@@ -0,0 +1,223 @@
+"""
+Streaming aggregation of per-file review results into a compact PR summary.
+
+Files are fed one at a time.  Their check outcomes go into a files × checks
+bit matrix (see CheckMatrix), from which static scores and per-check counts
+are reduced; everything else is a running total — a bounded heavy-hitter
+table of issues, the first few failing files and per-stratum score sums —
+so memory stays small whether a PR touches ten files or five thousand.
+build_review_comment() renders the review from the resulting summary.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.review.check_matrix import CheckMatrix
+from src.review.sampling import sample_summary
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def compact_ai_result(ai_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only what aggregation and re-review need from an evaluator result:
+    score, weighted contribution, issues and the skipped/estimated flags.
+    """
+    compact = {
+        'score': ai_result.get('score', 0),
+        'weighted_contribution': ai_result.get('weighted_contribution', 0),
+        'issues': list(ai_result.get('issues', [])),
+    }
+    for flag in ('skipped', 'estimated'):
+        if ai_result.get(flag):
+            compact[flag] = True
+            compact['summary'] = ai_result.get('summary', '')
+    return compact
+
+
+class _TopIssues:
+    """
+    Approximate top-K counter over an unbounded stream (Space-Saving).
+
+    At most ``capacity`` distinct issues are tracked; a new issue arriving
+    when the table is full replaces the least frequent one and inherits its
+    count, which keeps every frequent issue with a count error bounded by
+    the evicted minimum.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.counts: Dict[str, int] = {}
+
+    def add(self, issue: str) -> None:
+        if issue in self.counts:
+            self.counts[issue] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[issue] = 1
+        else:
+            evicted = min(self.counts, key=self.counts.__getitem__)
+            self.counts[issue] = self.counts.pop(evicted) + 1
+
+    def most_common(self, k: int) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+
+class ReviewAggregator:
+    """
+    Running totals over a PR's file results.
+
+    Usage:
+        aggregator = ReviewAggregator(checklist['checks'], top_k=10, failing_files=25)
+        for result in results:
+            aggregator.add(result)
+        summary = aggregator.summary(confidence=0.95, stddev=15)
+    """
+
+    def __init__(
+        self,
+        checks: List[Dict[str, Any]],
+        top_k: int = 10,
+        failing_files: int = 25,
+        unresolved_links: int = 25,
+        ai_weight: int = 20,
+    ):
+        """
+        Args:
+            checks:           Checklist check definitions ('id', 'description', 'type')
+            top_k:            Issues listed in the summary, most frequent first
+            failing_files:    Failing files kept (in file order) with their issues
+            unresolved_links: Unresolved internal links kept (in file order)
+            ai_weight:        ai_evaluation.weight, recorded with the matrix
+        """
+        self.checks = checks
+        self._descriptions = {c['id']: c['description'] for c in checks}
+        self.top_k = top_k
+        self.failing_limit = failing_files
+        self.links_limit = unresolved_links
+
+        self.files = 0
+        # Static outcomes, one row per file: scores and check counts come from it
+        self.matrix = CheckMatrix(checks, ai_weight=ai_weight)
+        self.ai_score_total = 0.0
+        self.ai_contribution_total = 0.0
+        self.ai_skipped_files = 0
+        self.ai_summary = ''
+        self.failing_count = 0
+        # trivial-diff kind → files that reused their last approved verdict
+        self.trivial: Dict[str, int] = {}
+        self.failing_files: List[Dict[str, Any]] = []
+        # Internal links resolving to no page: exact totals, first few kept
+        self.link_count = 0
+        self.link_files = 0
+        self.links: List[Dict[str, Any]] = []
+        self._issues = _TopIssues(capacity=max(100, top_k * 20))
+        # stratum → [files, score_sum, sampled, sampled_sum, sampled_sum_sq]
+        self.strata: Dict[str, List[float]] = {}
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """
+        Fold one file result into the totals.
+
+        Args:
+            result: {'path', 'failed_checks', 'ai_result',
+                     'stratum', optional 'skipped_checks', 'timed_out_checks',
+                     'trivial' and 'unresolved_links'} — see
+                    PRArbitrAgent._check_files()
+        """
+        ai_result = result['ai_result']
+        failed = result['failed_checks']
+
+        self.files += 1
+        self.matrix.add(result)
+        self.ai_score_total += ai_result.get('score', 0)
+        self.ai_contribution_total += ai_result.get('weighted_contribution', 0)
+        if ai_result.get('skipped'):
+            self.ai_skipped_files += 1
+            self.ai_summary = ai_result.get('summary', '')
+
+        if result.get('trivial'):
+            self.trivial[result['trivial']] = self.trivial.get(result['trivial'], 0) + 1
+        if result.get('unresolved_links'):
+            self.link_count += result.get('unresolved_link_count', len(result['unresolved_links']))
+            self.link_files += 1
+            for link in result['unresolved_links'][:self.links_limit - len(self.links)]:
+                self.links.append({'path': result['path'], **link})
+
+        issues = [self._descriptions.get(c, c) for c in failed] + list(ai_result.get('issues', []))
+        for issue in issues:
+            self._issues.add(issue)
+        if issues:
+            self.failing_count += 1
+            if len(self.failing_files) < self.failing_limit:
+                self.failing_files.append({'path': result['path'], 'issues': issues})
+
+        stats = self.strata.setdefault(result.get('stratum', 'other/small'), [0, 0.0, 0, 0.0, 0.0])
+        score = ai_result.get('score', 0)
+        stats[0] += 1
+        stats[1] += score
+        if not ai_result.get('estimated'):
+            stats[2] += 1
+            stats[3] += score
+            stats[4] += score * score
+
+    def summary(self, confidence: float = 0.95, stddev: float = 15) -> Optional[Dict[str, Any]]:
+        """
+        Compact PR summary, or None if no file was added.
+
+        Returns:
+            {'files', 'avg_static', 'uncapped_static', 'required_failed',
+             'failed_checks', 'avg_ai_score',
+             'avg_ai_contribution', 'ai_skipped', 'ai_summary', 'checks',
+             'top_issues', 'failing_files', 'failing_count', 'sampling', 'trivial',
+             'unresolved_links'}
+            ``checks`` is [{'id', 'description', 'type', 'failed_files',
+            'skipped_files', 'timeout_files'}] in checklist order (timed-out
+            files are among the failed); ``failed_checks`` lists the ids of
+            those that failed in any file.  Static scores are recomputed
+            from the check outcomes under ``checks`` (see CheckMatrix);
+            ``avg_static`` already carries the required cap.
+            ``trivial`` is {kind: files} for files with trivial diffs.
+            ``unresolved_links`` is {'count', 'files', 'links': [{'path',
+            'line', 'link'}]}, or None when every link resolved.
+        """
+        if not self.files:
+            return None
+        n = self.files
+        # Required cap re-applied after averaging (see CheckMatrix.pr_static_score)
+        avg_static, uncapped_static, required_failed = self.matrix.pr_static_score()
+        failures = self.matrix.failure_counts()
+        skips = self.matrix.skip_counts()
+        timeouts = self.matrix.timeout_counts()
+
+        return {
+            'files': n,
+            'avg_static': avg_static,
+            'uncapped_static': uncapped_static,
+            'required_failed': required_failed,
+            'failed_checks': self.matrix.failed_anywhere(),
+            'avg_ai_score': round(self.ai_score_total / n),
+            'avg_ai_contribution': round(self.ai_contribution_total / n),
+            'ai_skipped': self.ai_skipped_files == n,
+            'ai_summary': self.ai_summary,
+            'checks': [
+                {
+                    'id': c['id'],
+                    'description': c['description'],
+                    'type': c['type'],
+                    'failed_files': int(failures[j]),
+                    'skipped_files': int(skips[j]),
+                    'timeout_files': int(timeouts[j]),
+                }
+                for j, c in enumerate(self.checks)
+            ],
+            'top_issues': self._issues.most_common(self.top_k),
+            'failing_files': list(self.failing_files),
+            'failing_count': self.failing_count,
+            'sampling': sample_summary(self.strata, confidence, stddev),
+            'trivial': dict(self.trivial),
+            'unresolved_links': {
+                'count': self.link_count,
+                'files': self.link_files,
+                'links': list(self.links),
+            } if self.link_count else None,
+        }
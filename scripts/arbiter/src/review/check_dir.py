@@ -0,0 +1,229 @@
+"""
+Static checklist over a local directory of Markdown files.
+
+Runs the arbiter's checklist on the DocFX output (e.g. workspace/docfx/api)
+before it is pushed, so broken frontmatter or tables stop the pipeline in
+seconds instead of coming back as a rejected PR:
+
+    python -m src.review.check_dir workspace/docfx/api \\
+        --checklist config/checklist.yaml --workers 4 \\
+        --json check-report.json --junit check-report.xml
+
+Files are checked on worker processes (see run_checks_batch()).  The exit
+status is 1 when a required check fails in any file, 2 when the directory
+does not exist, and 0 otherwise.
+"""
+
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.review.checklist import load_checklist, run_checks_batch
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def check_directory(
+    root: Path,
+    checklist: Dict[str, Any],
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run the static checklist over every ``*.md`` file under ``root``.
+
+    Args:
+        root:      Directory to scan recursively
+        checklist: Parsed checklist dict from load_checklist()
+        workers:   Worker processes (None = one per CPU core)
+
+    Returns:
+        One report per file, in path order:
+        {'path' (relative to root), 'score', 'failed_checks',
+         'required_failed', 'skipped_checks', 'timed_out_checks'}
+        Timed-out checks (check_timeout_ms) are also in ``failed_checks``.
+    """
+    paths = sorted(root.rglob('*.md'))
+    if not paths:
+        return []
+    required = {c['id'] for c in checklist.get('checks', []) if c['type'] == 'required'}
+    scored = run_checks_batch([(path, None) for path in paths], checklist, workers=workers)
+
+    reports: List[Dict[str, Any]] = []
+    for path, (score, check_results) in zip(paths, scored):
+        failed = [c['id'] for c in check_results if c['outcome'] in ('fail', 'timeout')]
+        reports.append({
+            'path': path.relative_to(root).as_posix(),
+            'score': score,
+            'failed_checks': failed,
+            'required_failed': [check_id for check_id in failed if check_id in required],
+            'skipped_checks': [c['id'] for c in check_results if c['outcome'] == 'skipped'],
+            'timed_out_checks': [c['id'] for c in check_results if c['outcome'] == 'timeout'],
+        })
+    return reports
+
+
+def summarize(
+    reports: List[Dict[str, Any]],
+    checklist: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Directory-level totals of check_directory() reports.
+
+    Returns:
+        {'files', 'average_score', 'required_failed_files', 'failed_files',
+         'timed_out_files', 'passed',
+         'checks': [{'id', 'type', 'description', 'failed_files'}]}
+        ``passed`` is False when a required check failed in any file.
+    """
+    failures: Dict[str, int] = {}
+    for report in reports:
+        for check_id in report['failed_checks']:
+            failures[check_id] = failures.get(check_id, 0) + 1
+    required_failed = sum(1 for r in reports if r['required_failed'])
+    return {
+        'files': len(reports),
+        'average_score': round(sum(r['score'] for r in reports) / len(reports), 1) if reports else 0,
+        'required_failed_files': required_failed,
+        'failed_files': sum(1 for r in reports if r['failed_checks']),
+        'timed_out_files': sum(1 for r in reports if r['timed_out_checks']),
+        'passed': required_failed == 0,
+        'checks': [
+            {
+                'id': c['id'],
+                'type': c['type'],
+                'description': c['description'],
+                'failed_files': failures.get(c['id'], 0),
+            }
+            for c in checklist.get('checks', [])
+        ],
+    }
+
+
+def write_json(path: Path, root: Path, summary: Dict[str, Any], reports: List[Dict[str, Any]]) -> None:
+    """Write the summary and every file report as one JSON document."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'directory': str(root), **summary, 'results': reports}, f, indent=2)
+
+
+def write_junit(
+    path: Path,
+    summary: Dict[str, Any],
+    reports: List[Dict[str, Any]],
+    checklist: Dict[str, Any],
+    elapsed_s: float,
+) -> None:
+    """
+    Write a JUnit XML report: one test case per file, failed when a
+    required check fails.  Failed recommended checks are listed in the
+    test case's system-out.
+    """
+    descriptions = {c['id']: c['description'] for c in checklist.get('checks', [])}
+    suites = ET.Element('testsuites')
+    suite = ET.SubElement(suites, 'testsuite', {
+        'name': 'checklist',
+        'tests': str(summary['files']),
+        'failures': str(summary['required_failed_files']),
+        'errors': '0',
+        'time': f"{elapsed_s:.3f}",
+    })
+    for report in reports:
+        directory, _, name = report['path'].rpartition('/')
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': directory.replace('/', '.') or '.',
+            'name': name,
+        })
+        if report['required_failed']:
+            failure = ET.SubElement(case, 'failure', {
+                'type': 'required',
+                'message': f"Required checks failed: {', '.join(report['required_failed'])}",
+            })
+            failure.text = '\n'.join(
+                f"{check_id}: {descriptions.get(check_id, check_id)}"
+                for check_id in report['required_failed']
+            )
+        recommended = [c for c in report['failed_checks'] if c not in report['required_failed']]
+        if recommended:
+            ET.SubElement(case, 'system-out').text = (
+                f"Score {report['score']}. Recommended checks failed:\n"
+                + '\n'.join(f"{c}: {descriptions.get(c, c)}" for c in recommended)
+            )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(suites).write(path, encoding='utf-8', xml_declaration=True)
+
+
+# ── CLI entry point ───────────────────────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Usage:
+        python -m src.review.check_dir workspace/docfx/api
+        python -m src.review.check_dir workspace/docfx/api --workers 4 --json report.json
+        python -m src.review.check_dir workspace/docfx/api --junit report.xml
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Run the arbiter's static checklist over a local directory of Markdown files.",
+    )
+    parser.add_argument('directory', help="Directory to check, e.g. workspace/docfx/api.")
+    parser.add_argument(
+        '--checklist',
+        default='config/checklist.yaml',
+        help="Path to checklist YAML (default: config/checklist.yaml).",
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=0,
+        help="Worker processes; 0 = one per CPU core (default: 0).",
+    )
+    parser.add_argument('--json', dest='json_path', metavar='PATH', help="Write a JSON report.")
+    parser.add_argument('--junit', dest='junit_path', metavar='PATH', help="Write a JUnit XML report.")
+    parser.add_argument(
+        '--show', type=int, default=20, metavar='N',
+        help="Files with required failures listed in the log (default: 20).",
+    )
+    args = parser.parse_args(argv)
+
+    root = Path(args.directory)
+    if not root.is_dir():
+        logger.error(f"Directory not found: {root}")
+        return 2
+    checklist = load_checklist(args.checklist)
+
+    started = time.monotonic()
+    reports = check_directory(root, checklist, workers=args.workers or None)
+    elapsed = time.monotonic() - started
+    summary = summarize(reports, checklist)
+
+    if not reports:
+        logger.warning(f"No Markdown files under {root}")
+    for report in [r for r in reports if r['required_failed']][:args.show]:
+        logger.error(f"  {report['path']}: {', '.join(report['required_failed'])}")
+    for check in summary['checks']:
+        if check['failed_files']:
+            logger.info(f"  {check['id']:<28} {check['type']:<12} failed in {check['failed_files']} file(s)")
+    logger.info(
+        f"Checked {summary['files']} file(s) in {elapsed:.1f}s — average score "
+        f"{summary['average_score']}, {summary['required_failed_files']} with required failures, "
+        f"{summary['failed_files']} with any failure"
+    )
+    if summary['timed_out_files']:
+        logger.warning(f"{summary['timed_out_files']} file(s) had a check time out (check_timeout_ms)")
+
+    if args.json_path:
+        write_json(Path(args.json_path), root, summary, reports)
+        logger.info(f"JSON report written to {args.json_path}")
+    if args.junit_path:
+        write_junit(Path(args.junit_path), summary, reports, checklist, elapsed)
+        logger.info(f"JUnit report written to {args.junit_path}")
+    return 0 if summary['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+A PR's static check outcomes as a files × checks matrix, with each file's
+AI score alongside.
+
+Each file is one row of boolean cells with one column per checklist check,
+and the checklist's weights and required flags are vectors over the same
+columns, so the PR-level figures are vectorised reductions instead of
+loops over per-file lists:
+
+    matrix = CheckMatrix(checklist['checks'])
+    for result in results:
+        matrix.add(result)              # a _check_files() result
+    matrix.static_scores()              # per file, required cap applied
+    matrix.failure_counts()             # per check
+    matrix.pack()                       # JSON-safe; CheckMatrix.unpack() reverses it
+
+Rows are built from a result's failed, skipped and timed-out check ids, so
+fresh, cached, reused and trivial-diff results all fit; ids the checklist
+does not have are ignored.  A result's 'ai_result', once it has one, fills
+the row's AI score and contribution — enough to replay the PR's decision
+under other weights and thresholds (see src/tools/rescore.py).
+"""
+
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Score ceiling of a file (and a PR) with a failed required check
+REQUIRED_CAP = 49
+
+# Cell matrix → the result key listing its check ids
+_OUTCOMES = {
+    'failed': 'failed_checks',
+    'skipped': 'skipped_checks',
+    'timed_out': 'timed_out_checks',
+}
+
+
+class CheckMatrix:
+    """
+    Check outcomes of a PR's files, in the order they were added.
+
+    Attributes:
+        ids:       Check ids, one per column, in checklist order
+        weights:   Weight of each check (int vector)
+        required:  True for each required check (bool vector)
+        ai_weight: ai_evaluation.weight the AI contributions were scaled by
+
+    ``failed``, ``skipped`` and ``timed_out`` are (files × checks) bool
+    matrices; a timed-out cell is also failed.  A cell in none of them
+    passed.  ``ai_scores``, ``ai_contributions`` and ``ai_estimated`` are
+    per-file vectors (0 and False for a file without an AI result).
+    Storage grows by doubling, so adding a file is amortised O(1).
+    """
+
+    def __init__(self, checks: List[Dict[str, Any]], capacity: int = 64, ai_weight: int = 20):
+        """
+        Args:
+            checks:    Checklist check definitions ('id', 'weight', 'type')
+            capacity:  Rows allocated up front
+            ai_weight: ai_evaluation.weight of the checklist the files were scored under
+        """
+        self.ids = [c['id'] for c in checks]
+        self._columns = {check_id: j for j, check_id in enumerate(self.ids)}
+        self.weights = np.array([c.get('weight', 0) for c in checks], dtype=np.int64)
+        self.required = np.array([c.get('type') == 'required' for c in checks], dtype=bool)
+        self.ai_weight = ai_weight
+        self.rows = 0
+        self.has_ai = False
+        shape = (max(1, capacity), len(self.ids))
+        self._cells = {name: np.zeros(shape, dtype=bool) for name in _OUTCOMES}
+        self._ai = {
+            'scores': np.zeros(shape[0], dtype=np.float64),
+            'contributions': np.zeros(shape[0], dtype=np.float64),
+            'estimated': np.zeros(shape[0], dtype=bool),
+        }
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """
+        Append a file's row from its result's 'failed_checks',
+        'skipped_checks' and 'timed_out_checks', and 'ai_result' if set.
+        """
+        if self.rows == len(self._cells['failed']):
+            for store in (self._cells, self._ai):
+                for name, values in store.items():
+                    store[name] = np.concatenate([values, np.zeros_like(values)])
+        for name, key in _OUTCOMES.items():
+            columns = [self._columns[c] for c in result.get(key, ()) if c in self._columns]
+            if columns:
+                self._cells[name][self.rows, columns] = True
+        ai_result = result.get('ai_result')
+        if ai_result is not None:
+            self.has_ai = True
+            self._ai['scores'][self.rows] = ai_result.get('score', 0)
+            self._ai['contributions'][self.rows] = ai_result.get('weighted_contribution', 0)
+            self._ai['estimated'][self.rows] = bool(ai_result.get('estimated'))
+        self.rows += 1
+
+    @property
+    def failed(self) -> np.ndarray:
+        return self._cells['failed'][:self.rows]
+
+    @property
+    def skipped(self) -> np.ndarray:
+        return self._cells['skipped'][:self.rows]
+
+    @property
+    def timed_out(self) -> np.ndarray:
+        return self._cells['timed_out'][:self.rows]
+
+    @property
+    def ai_scores(self) -> np.ndarray:
+        return self._ai['scores'][:self.rows]
+
+    @property
+    def ai_contributions(self) -> np.ndarray:
+        return self._ai['contributions'][:self.rows]
+
+    @property
+    def ai_estimated(self) -> np.ndarray:
+        return self._ai['estimated'][:self.rows]
+
+    # ── Reductions ────────────────────────────────────────────────────────────
+
+    def required_failed(self) -> np.ndarray:
+        """Per file: True if a required check failed (or timed out)."""
+        return (self.failed & self.required).any(axis=1)
+
+    def static_scores(self) -> np.ndarray:
+        """
+        Per file: the weight of its passed checks, capped at REQUIRED_CAP
+        when a required check failed — the score run_checks() gives it.
+        """
+        raw = (~(self.failed | self.skipped)).astype(np.int64) @ self.weights
+        return np.where(self.required_failed(), np.minimum(raw, REQUIRED_CAP), raw)
+
+    def failure_counts(self) -> np.ndarray:
+        """Per check: files it failed in (timeouts included)."""
+        return self.failed.sum(axis=0)
+
+    def skip_counts(self) -> np.ndarray:
+        """Per check: files it was not evaluated in (fast_fail)."""
+        return self.skipped.sum(axis=0)
+
+    def timeout_counts(self) -> np.ndarray:
+        """Per check: files in which it ran past check_timeout_ms."""
+        return self.timed_out.sum(axis=0)
+
+    def failed_anywhere(self) -> List[str]:
+        """Ids of the checks that failed in at least one file, in checklist order."""
+        return [self.ids[j] for j in np.flatnonzero(self.failed.any(axis=0))]
+
+    def pr_static_score(self) -> Tuple[int, int, bool]:
+        """
+        The PR's static score: the mean file score, with the required cap
+        re-applied after averaging — otherwise passing files could "rescue"
+        a failing one, e.g. (49 + 100 + 100) / 3 = 83.
+
+        Returns:
+            Tuple of (avg_static, avg_static before the PR-level cap,
+            any required failure); requires at least one row
+        """
+        uncapped = round(int(self.static_scores().sum()) / self.rows)
+        required_failed = bool(self.required_failed().any())
+        return (min(uncapped, REQUIRED_CAP) if required_failed else uncapped), uncapped, required_failed
+
+    def scaled_ai_contributions(self, ai_weight: int) -> np.ndarray:
+        """
+        Per file: the AI contribution under another ai_evaluation.weight.
+        An evaluated file's score is re-scaled as the evaluator scales it;
+        an estimated file's (a stratum mean) is scaled proportionally.
+        Files without an AI evaluation contribute 0 under any weight.
+        """
+        if ai_weight == self.ai_weight:
+            return self.ai_contributions
+        rescaled = np.round(np.clip(self.ai_scores, 0, 100) / 100.0 * ai_weight)
+        ratio = ai_weight / self.ai_weight if self.ai_weight else 0.0
+        return np.where(self.ai_estimated, self.ai_contributions * ratio, rescaled)
+
+    def pr_ai_contribution(self, ai_weight: Optional[int] = None) -> int:
+        """
+        The PR's mean AI contribution, as ReviewAggregator.summary() gives
+        it, under ``ai_weight`` (default: the weight it was scored under).
+        Requires at least one row.
+        """
+        contributions = self.scaled_ai_contributions(self.ai_weight if ai_weight is None else ai_weight)
+        # Summed in file order, as the aggregator does, so rounding agrees
+        return round(sum(contributions.tolist()) / self.rows)
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+
+    def pack(self) -> Dict[str, Any]:
+        """
+        Compact JSON-safe form: the column ids, the row count and each
+        non-empty cell matrix bit-packed (8 cells a byte) and base64-encoded;
+        once files have AI results, also 'ai': {'weight', 'scores',
+        'contributions', optional 'estimated' bits}.
+        """
+        packed: Dict[str, Any] = {'checks': list(self.ids), 'rows': self.rows}
+        for name in _OUTCOMES:
+            cells = self._cells[name][:self.rows]
+            if cells.any():
+                packed[name] = _pack_bits(cells)
+        if self.has_ai:
+            packed['ai'] = {
+                'weight': self.ai_weight,
+                'scores': [_number(v) for v in self.ai_scores.tolist()],
+                'contributions': [_number(v) for v in self.ai_contributions.tolist()],
+            }
+            if self.ai_estimated.any():
+                packed['ai']['estimated'] = _pack_bits(self.ai_estimated)
+        return packed
+
+    @classmethod
+    def unpack(cls, packed: Dict[str, Any], checks: List[Dict[str, Any]]) -> 'CheckMatrix':
+        """
+        Rebuild a pack()ed matrix under ``checks``, which may be a newer
+        checklist: columns follow ``checks``, weights and required flags
+        are theirs, checks the packed matrix lacks pass in every file and
+        packed columns the checklist dropped are ignored.
+        """
+        stored = packed['checks']
+        rows = packed['rows']
+        ai = packed.get('ai')
+        matrix = cls(checks, capacity=rows, ai_weight=ai['weight'] if ai else 20)
+        shared = [(j, matrix._columns[check_id]) for j, check_id in enumerate(stored) if check_id in matrix._columns]
+        old_columns = [j for j, _ in shared]
+        new_columns = [j for _, j in shared]
+        for name in _OUTCOMES:
+            if name not in packed:
+                continue
+            cells = _unpack_bits(packed[name], rows * len(stored)).reshape(rows, len(stored))
+            matrix._cells[name][:rows, new_columns] = cells[:, old_columns]
+        if ai:
+            matrix.has_ai = True
+            matrix._ai['scores'][:rows] = ai['scores']
+            matrix._ai['contributions'][:rows] = ai['contributions']
+            if 'estimated' in ai:
+                matrix._ai['estimated'][:rows] = _unpack_bits(ai['estimated'], rows)
+        matrix.rows = rows
+        return matrix
+
+
+def _pack_bits(cells: np.ndarray) -> str:
+    return base64.b64encode(np.packbits(cells, axis=None).tobytes()).decode('ascii')
+
+
+def _unpack_bits(text: str, count: int) -> np.ndarray:
+    bits = np.frombuffer(base64.b64decode(text), dtype=np.uint8)
+    return np.unpackbits(bits, count=count).astype(bool)
+
+
+def _number(value: float) -> Any:
+    """A whole float as an int, so most stored scores are short JSON."""
+    return int(value) if value.is_integer() else value
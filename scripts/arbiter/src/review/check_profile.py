@@ -0,0 +1,108 @@
+"""
+Run-wide timing of the static checkers.
+
+run_checks(timed=True) records each evaluated checker's wall time in its
+result; CheckProfile collects those results across every file of a run and
+reduces them to per-check call counts, pass/fail counts and p50/p95/max
+timings.  The summary is printed with the run summary and sent with the run
+metrics, so a checker that gets slower shows up run over run.
+"""
+
+import math
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class CheckProfile:
+    """
+    Per-check timings and outcomes, shared by the threads checking files.
+
+    Usage:
+        profile = CheckProfile()
+        score, results = run_checks(content, checklist, timed=True)
+        profile.add(results)
+        profile.summary()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # check id → wall times in seconds (compact: one double per call)
+        self._times: Dict[str, array] = {}
+        self._failed: Dict[str, int] = {}
+
+    def add(self, check_results: List[Dict[str, Any]]) -> None:
+        """Record the timed checks of one file's run_checks() results (others are ignored)."""
+        with self._lock:
+            for result in check_results:
+                if 'elapsed_s' not in result:
+                    continue
+                check_id = result['id']
+                self._times.setdefault(check_id, array('d')).append(result['elapsed_s'])
+                if result['outcome'] != 'pass':  # 'fail' or 'timeout'
+                    self._failed[check_id] = self._failed.get(check_id, 0) + 1
+
+    @classmethod
+    def combined(cls, profiles: Iterable['CheckProfile']) -> 'CheckProfile':
+        """One profile holding the records of all ``profiles``."""
+        total = cls()
+        for profile in profiles:
+            with profile._lock:
+                for check_id, times in profile._times.items():
+                    total._times.setdefault(check_id, array('d')).extend(times)
+                for check_id, failed in profile._failed.items():
+                    total._failed[check_id] = total._failed.get(check_id, 0) + failed
+        return total
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-check totals, slowest (by total time) first.
+
+        Returns:
+            {check_id: {'calls', 'passed', 'failed', 'total_ms', 'p50_ms',
+                        'p95_ms', 'max_ms'}}; percentiles are nearest-rank
+        """
+        with self._lock:
+            items = [(check_id, sorted(times)) for check_id, times in self._times.items()]
+            failed = dict(self._failed)
+
+        stats: Dict[str, Dict[str, Any]] = {}
+        for check_id, times in sorted(items, key=lambda item: -sum(item[1])):
+            calls = len(times)
+            stats[check_id] = {
+                'calls': calls,
+                'passed': calls - failed.get(check_id, 0),
+                'failed': failed.get(check_id, 0),
+                'total_ms': round(sum(times) * 1000, 3),
+                'p50_ms': round(_percentile(times, 0.50) * 1000, 4),
+                'p95_ms': round(_percentile(times, 0.95) * 1000, 4),
+                'max_ms': round(times[-1] * 1000, 4),
+            }
+        return stats
+
+    def log(self, limit: int = 15) -> None:
+        """Log the summary as a table of the ``limit`` slowest checks."""
+        stats = self.summary()
+        if not stats:
+            return
+        logger.info(
+            f"  Check timing ({len(stats)} checks, slowest {min(limit, len(stats))} by total time):"
+        )
+        logger.info(
+            f"    {'check':<28} {'calls':>7} {'fail%':>6} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'max ms':>8} {'total ms':>10}"
+        )
+        for check_id, s in list(stats.items())[:limit]:
+            logger.info(
+                f"    {check_id:<28} {s['calls']:>7} {s['failed'] / s['calls']:>6.1%} "
+                f"{s['p50_ms']:>8.3f} {s['p95_ms']:>8.3f} {s['max_ms']:>8.3f} {s['total_ms']:>10.1f}"
+            )
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
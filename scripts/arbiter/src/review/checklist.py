@@ -5,15 +5,65 @@ Each check in pr_merge_checklist.yaml is evaluated here without calling the AI.
 The AI evaluation lives in evaluator.py and contributes a separate score.
 """
 
+import hashlib
+import json
+import multiprocessing
+import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import signal
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 import yaml
 from pathlib import Path
+from src.review.link_index import LINK_CHECK_ID
 from src.utils.logger import setup_logger
 
+try:
+    import re2  # google-re2: linear-time matching for ``linear_regex: true``
+except ImportError:
+    re2 = None
+
 logger = setup_logger(__name__)
 
+# libyaml's C loader when PyYAML was built with it — same results, much faster
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n?(.*)', re.DOTALL)
+_FIELD_RE = re.compile(r'^[ \t]*([\w-]+)[ \t]*:(.*)$')
+
+# Checker code, part of checklist_fingerprint(): editing a check invalidates cached results
+_CHECKER_SOURCE = Path(__file__).read_bytes()
+
+# Body scans (see BodyScan).  Line starts: a table row, or a heading
+# (zero-width, so the line stays visible to the other alternatives), or a
+# raw DocFX ``uid:`` line.
+_LINE_RE = re.compile(
+    r'^(?:'
+    r'(?P<rows>\|.+\|(?:\n\|.+\|)*)$'  # a run of consecutive table rows
+    r'|(?=\#)(?=(?P<h2>\#\#\s)|)(?=\#{1,6}\s+(?P<heading>.+)|)'
+    r'|(?P<uid>\s*uid\s*:)'
+    r')',
+    re.MULTILINE,
+)
+_HTML_TAG_RE = re.compile(r'<(?:(?:xref|pre|code)[\s>]|/(?:xref|pre|code)\s*>)', re.IGNORECASE)
+_LINK_RE = re.compile(r'\[.*?\]\(((?!http)[^)]+)\)')
+_WRAP_RE = re.compile(r'\{\{<\s*(/?)blocks/products/pf/main-wrap-class\s*>\}\}', re.IGNORECASE)
+_CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+_SHORTCODE_RE = re.compile(r'\{\{<.*?>\}\}')
+# Any placeholder marker, in one pass over the file
+
+# Patterns RE2 can run (no lookarounds), swapped in by configure_matching().
+# _LINE_RE and _LINK_RE need lookarounds and stay on ``re`` under the time budget.
+_LINEAR_CAPABLE = ('_FRONTMATTER_RE', '_HTML_TAG_RE', '_WRAP_RE', '_CODE_BLOCK_RE', '_SHORTCODE_RE')
+_BACKTRACKING = {name: globals()[name] for name in _LINEAR_CAPABLE}
+_linear: Dict[str, Any] = {}
+
 
 def load_checklist(checklist_path: str) -> Dict[str, Any]:
     """
@@ -33,117 +83,731 @@ def load_checklist(checklist_path: str) -> Dict[str, Any]:
         checklist = yaml.safe_load(f)
 
     logger.info(f"Loaded checklist from {checklist_path}: {len(checklist.get('checks', []))} checks")
+    configure_matching(checklist)
+    pattern_checks(checklist)  # compile now: a bad pattern fails the load, not a run
     return checklist
 
 
+def configure_matching(checklist: Dict[str, Any]) -> bool:
+    """
+    Select the regex engine of the body and frontmatter scans.
+
+    With ``linear_regex: true`` in the checklist and google-re2 installed,
+    the patterns that need no lookarounds run on RE2, whose matching time
+    is linear in the input; otherwise (and for the rest) ``re`` is used.
+    Both engines give the same matches on these patterns.
+
+    Returns:
+        True if RE2 is in use
+    """
+    use_re2 = bool(checklist.get('linear_regex', False))
+    if use_re2 and re2 is None:
+        logger.warning("linear_regex is set but google-re2 is not installed — using re")
+        use_re2 = False
+    for name in _LINEAR_CAPABLE:
+        globals()[name] = _linear_pattern(name) if use_re2 else _BACKTRACKING[name]
+    return use_re2
+
+
+def _linear_pattern(name: str) -> Any:
+    """RE2 compilation of a _LINEAR_CAPABLE pattern (re flags become inline flags)."""
+    if name not in _linear:
+        pattern = _BACKTRACKING[name]
+        flags = ''.join(
+            letter for flag, letter in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+            if pattern.flags & flag
+        )
+        _linear[name] = re2.compile(f"(?{flags}){pattern.pattern}" if flags else pattern.pattern)
+    return _linear[name]
+
+
+# ── Parsed document ───────────────────────────────────────────────────────────
+
+class ParsedDocument:
+    """
+    A Markdown file split once for all checks.
+
+    Attributes:
+        content:     Full file text
+        frontmatter: Text between the ``---`` fences, or None without a block
+        body:        Text after the frontmatter (the whole file without one)
+
+    ``fields`` and ``data`` are computed on first use and then cached, so a
+    checklist without YAML checks never loads the YAML.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.frontmatter, self.body = _extract_frontmatter(content)
+        self._pattern_hits: Dict[Tuple[str, Optional[str]], FrozenSet[str]] = {}
+
+    def pattern_hits(self, patterns: 'PatternSet') -> FrozenSet[str]:
+        """Ids of the checks of ``patterns`` whose pattern occurs, scanned once per scope."""
+        hits = self._pattern_hits.get(patterns.key)
+        if hits is None:
+            hits = self._pattern_hits[patterns.key] = patterns.scan(self)
+        return hits
+
+    @cached_property
+    def scan(self) -> 'BodyScan':
+        """Structural facts about the body, scanned once (see BodyScan)."""
+        return BodyScan(self.body)
+
+    @cached_property
+    def fields(self) -> Dict[str, Optional[str]]:
+        """
+        Frontmatter ``key → raw value`` map, first occurrence of each key.
+
+        Values are the raw text after the colon.  An empty value takes the
+        next non-blank line (block lists and scalars); it is '' when only
+        whitespace follows and None when nothing does — as the per-field
+        regexes the checkers used before matched.  Values are not unquoted.
+        """
+        fields: Dict[str, Optional[str]] = {}
+        if not self.frontmatter:
+            return fields
+        lines = self.frontmatter.split('\n')
+        for index, line in enumerate(lines):
+            match = _FIELD_RE.match(line)
+            if not match or match.group(1) in fields:
+                continue
+            value = match.group(2).lstrip()
+            if not value:
+                following = lines[index + 1:]
+                value = next((l.lstrip() for l in following if l.strip()), None)
+                if value is None and (match.group(2) or any(following)):
+                    value = ''  # only whitespace follows: present but blank
+            fields[match.group(1)] = value
+        return fields
+
+    @cached_property
+    def _yaml(self) -> Tuple[Any, bool]:
+        if self.frontmatter is None:
+            return None, False
+        try:
+            return yaml.load(self.frontmatter, Loader=_YAML_LOADER), True
+        except yaml.YAMLError:
+            return None, False
+
+    @property
+    def data(self) -> Any:
+        """Frontmatter parsed as YAML; None without frontmatter or if it is invalid."""
+        return self._yaml[0]
+
+    @property
+    def yaml_valid(self) -> bool:
+        """True if a frontmatter block exists and parses as YAML."""
+        return self._yaml[1]
+
+
+class BodyScan:
+    """
+    Structural facts about a Markdown body, so structural checks are cheap
+    predicates instead of whole-body rescans.
+
+    Facts come in families, each gathered by one compiled scan the first
+    time any of its facts is read and then cached:
+
+        lines:  table_runs, headings, has_h2, has_uid_line
+        tags:   tag_opens, tag_closes — ``<xref>``/``<pre>``/``<code>``
+                openings and closings, all six patterns in one scan
+        links:  links — targets of non-http Markdown links
+        wrap:   wrap_open_start, wrap_close_end — first main-wrap-class
+                shortcode offset and end of the last closing one (or None)
+        text:   text_chars, non_ascii_chars — non-whitespace characters
+                outside code blocks and shortcodes
+
+    ``has_code_block`` and ``has_xref_uid`` are plain substring tests.
+    """
+
+    def __init__(self, body: str):
+        self.body = body
+
+    @cached_property
+    def has_code_block(self) -> bool:
+        return '```' in self.body
+
+    @cached_property
+    def has_xref_uid(self) -> bool:
+        return '<xref:' in self.body
+
+    @cached_property
+    def _lines(self) -> Tuple[List[List[int]], List[str], bool, bool]:
+        table_runs: List[List[int]] = []
+        headings: List[str] = []
+        has_h2 = has_uid_line = False
+        for rows, h2, heading, uid in _LINE_RE.findall(self.body):
+            if rows:
+                table_runs.append([row.count('|') - 1 for row in rows.split('\n')])
+            elif uid:
+                has_uid_line = True
+            else:
+                has_h2 = has_h2 or bool(h2)
+                if heading:
+                    headings.append(heading)
+        return table_runs, headings, has_h2, has_uid_line
+
+    @property
+    def table_runs(self) -> List[List[int]]:
+        """
+        Column count of each table row (``|...|`` line), one list per run of
+        consecutive rows (a table), in order.
+        """
+        return self._lines[0]
+
+    @property
+    def headings(self) -> List[str]:
+        """Text of each ``#``–``######`` heading."""
+        return self._lines[1]
+
+    @property
+    def has_h2(self) -> bool:
+        """True if a line starts with ``##`` and whitespace."""
+        return self._lines[2]
+
+    @property
+    def has_uid_line(self) -> bool:
+        """True if a raw DocFX ``uid:`` line appears in the body."""
+        return self._lines[3]
+
+    @cached_property
+    def _tags(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        opens = {'xref': 0, 'pre': 0, 'code': 0}
+        closes = {'xref': 0, 'pre': 0, 'code': 0}
+        # Matches are whole tags ('<code>', '</PRE >'); only a handful are distinct
+        for tag, count in Counter(_HTML_TAG_RE.findall(self.body)).items():
+            if tag[1] == '/':
+                closes[tag[2:-1].rstrip().lower()] += count
+            else:
+                opens[tag[1:-1].lower()] += count
+        return opens, closes
+
+    @property
+    def tag_opens(self) -> Dict[str, int]:
+        """{tag: count} of ``<xref``/``<pre``/``<code`` openings."""
+        return self._tags[0]
+
+    @property
+    def tag_closes(self) -> Dict[str, int]:
+        """{tag: count} of the matching closing tags."""
+        return self._tags[1]
+
+    @cached_property
+    def links(self) -> List[str]:
+        """Targets of non-http Markdown links, in order."""
+        return _LINK_RE.findall(self.body)
+
+    @cached_property
+    def _wrap(self) -> Tuple[Optional[int], Optional[int]]:
+        open_start = close_end = None
+        for match in _WRAP_RE.finditer(self.body):
+            if match.group(1):
+                close_end = match.end()
+            elif open_start is None:
+                open_start = match.start()
+        return open_start, close_end
+
+    @property
+    def wrap_open_start(self) -> Optional[int]:
+        """Offset of the first main-wrap-class shortcode, or None."""
+        return self._wrap[0]
+
+    @property
+    def wrap_close_end(self) -> Optional[int]:
+        """End offset of the last closing main-wrap-class shortcode, or None."""
+        return self._wrap[1]
+
+    @cached_property
+    def _text_stats(self) -> Tuple[int, int]:
+        # Counted on C-level string operations, not a per-character loop
+        clean = _SHORTCODE_RE.sub('', _CODE_BLOCK_RE.sub('', self.body))
+        text = ''.join(clean.split())
+        return len(text), len(text) - len(text.encode('ascii', 'ignore'))
+
+    @property
+    def text_chars(self) -> int:
+        """Non-whitespace characters outside code blocks and shortcodes."""
+        return self._text_stats[0]
+
+    @property
+    def non_ascii_chars(self) -> int:
+        """How many of ``text_chars`` are non-ASCII."""
+        return self._text_stats[1]
+
+
+def parse_document(content: Union[str, ParsedDocument]) -> ParsedDocument:
+    """Return ``content`` parsed, reusing it if it already is a ParsedDocument."""
+    if isinstance(content, ParsedDocument):
+        return content
+    return ParsedDocument(content)
+
+
+# ── Declarative pattern checks ────────────────────────────────────────────────
+
+# Text a pattern check's scope matches against; None (no frontmatter, field
+# absent) holds no match
+_SCOPES = {
+    'content':     lambda doc, field: doc.content,
+    'frontmatter': lambda doc, field: doc.frontmatter,
+    'body':        lambda doc, field: doc.body,
+    'field':       lambda doc, field: doc.fields.get(field),
+}
+# Built-in pattern checks: a checklist entry with one of these ids and no
+# ``pattern`` of its own takes this definition (see pattern_checks())
+_BUILTIN_PATTERNS: Dict[str, Dict[str, Any]] = {
+    'no_placeholder_text': {
+        'pattern': [r'\bTODO\b', r'\bFIXME\b', r'\[PLACEHOLDER\]', 'Lorem ipsum', r'\[INSERT\b'],
+        'must_not_match': True,
+        'ignore_case': True,
+    },
+}
+# Backreferences and named groups would clash once patterns are combined
+_UNCOMBINABLE_RE = re.compile(r'\\[1-9]|\(\?P[<=]')
+
+
+class PatternSet:
+    """
+    The declarative pattern checks of one scope, combined into a single
+    alternation with a named group per check, so one scan of the scope's
+    text answers all of them.
+
+    No check can match before the alternation's leftmost match, so after
+    one the checks still unanswered are searched on their own from that
+    offset; a pattern whose match overlaps another's is still found, and
+    each check is answered exactly as its own ``re.search`` would.  When
+    nothing matches — the common case — the text is read once.  Both the
+    alternation and the per-check patterns are compiled once, here.
+    """
+
+    def __init__(self, scope: str, field: Optional[str], checks: List[Dict[str, Any]]):
+        self.key = (scope, field)
+        self.ids = [check['id'] for check in checks]
+        self.must_match = {check['id']: not check.get('must_not_match', False) for check in checks}
+        sources = [_pattern_source(check) for check in checks]
+        self._combined = re.compile('|'.join(f"(?P<p{i}>{source})" for i, source in enumerate(sources)))
+        self._single = [re.compile(source) for source in sources]
+
+    def passes(self, check_id: str, doc: ParsedDocument) -> bool:
+        return (check_id in doc.pattern_hits(self)) == self.must_match[check_id]
+
+    def scan(self, doc: ParsedDocument) -> FrozenSet[str]:
+        """Ids of the checks whose pattern occurs in the document's scope text."""
+        text = _SCOPES[self.key[0]](doc, self.key[1])
+        if text is None:
+            return frozenset()
+        match = self._combined.search(text)
+        if match is None:
+            return frozenset()
+        first = int(match.lastgroup[1:])
+        pos = match.start()
+        return frozenset(
+            check_id for i, check_id in enumerate(self.ids)
+            if i == first or self._single[i].search(text, pos)
+        )
+
+
+def pattern_checks(checklist: Dict[str, Any]) -> Dict[str, PatternSet]:
+    """
+    Compile the checklist's declarative pattern checks — those with a
+    ``pattern`` — into one PatternSet per scope.
+
+    A pattern check needs no Python checker:
+
+        - id: no_lorem_ipsum
+          pattern: 'Lorem ipsum'        # or a list of alternatives
+          must_not_match: true          # default: must_match
+          scope: body                   # content | frontmatter | body | field
+          field: title                  # scope: field only
+          ignore_case: true             # also: multiline
+
+    A check with a built-in definition (_BUILTIN_PATTERNS, e.g.
+    no_placeholder_text) needs only its id; its own keys override the
+    definition's.
+
+    The result is kept in the checklist under ``_patterns``, so it is
+    compiled once, by load_checklist(), and reaches batch workers with it.
+
+    Returns:
+        {check id: PatternSet holding it}
+
+    Raises:
+        ValueError: On an unknown scope, a missing field or a pattern that
+                    does not compile or cannot be combined
+    """
+    compiled = checklist.get('_patterns')
+    if compiled is None:
+        groups: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {}
+        for check in checklist.get('checks', []):
+            check = {**_BUILTIN_PATTERNS.get(check['id'], {}), **check}
+            if 'pattern' not in check:
+                continue
+            scope = check.get('scope', 'content')
+            field = check.get('field')
+            if scope not in _SCOPES:
+                raise ValueError(f"Check '{check['id']}': unknown scope '{scope}' (one of {', '.join(_SCOPES)})")
+            if (scope == 'field') != bool(field):
+                raise ValueError(f"Check '{check['id']}': 'field' goes with scope: field, and only with it")
+            if check.get('must_match') and check.get('must_not_match'):
+                raise ValueError(f"Check '{check['id']}': set must_match or must_not_match, not both")
+            groups.setdefault((scope, field), []).append(check)
+        compiled = {}
+        for (scope, field), checks in groups.items():
+            patterns = PatternSet(scope, field, checks)
+            compiled.update((check_id, patterns) for check_id in patterns.ids)
+        checklist['_patterns'] = compiled
+        if compiled:
+            logger.debug(f"Compiled {len(compiled)} pattern checks into {len(groups)} scope scans")
+    return compiled
+
+
+def _pattern_source(check: Dict[str, Any]) -> str:
+    """A check's pattern as one non-capturing group, its flags inline."""
+    pattern = check['pattern']
+    alternatives = pattern if isinstance(pattern, list) else [pattern]
+    source = '|'.join(f"(?:{p})" for p in alternatives)
+    if _UNCOMBINABLE_RE.search(source):
+        raise ValueError(f"Check '{check['id']}': pattern checks cannot use backreferences or named groups")
+    try:
+        re.compile(source)
+    except re.error as e:
+        raise ValueError(f"Check '{check['id']}': invalid pattern: {e}") from e
+    flags = ('i' if check.get('ignore_case') else '') + ('m' if check.get('multiline') else '')
+    return f"(?{flags}:{source})" if flags else f"(?:{source})"
+
+
+# ── Checklist evaluation ──────────────────────────────────────────────────────
+
 def run_checks(
-    content: str,
+    content: Union[str, ParsedDocument],
     checklist: Dict[str, Any],
     context: Optional[Dict[str, Any]] = None,
+    timed: bool = False,
 ) -> Tuple[int, List[Dict[str, Any]]]:
     """
     Apply every static check to a single Markdown file's content.
 
+    The file is parsed once (frontmatter, body, fields, YAML) and the
+    resulting ParsedDocument is shared by every checker.
+
+    With ``fast_fail: true`` in the checklist, required checks run first
+    and every group runs cheapest first (see check_cost()).  Once a
+    required check has failed and the passing weight already reaches the
+    cap, the score is fixed at 49, so the remaining recommended checks are
+    skipped — reported with outcome 'skipped', never as failures.  The
+    score is the same as without fast_fail.
+
+    With ``check_timeout_ms`` in the checklist, each checker runs under that
+    wall-time budget (see check_budget()).  A checker that exceeds it is
+    stopped and reported with outcome 'timeout': it earns no weight and, if
+    required, caps the score like a failure.
+
     Args:
-        content:   Full Markdown file text
+        content:   Full Markdown file text, or a ParsedDocument of it
         checklist: Parsed checklist dict from load_checklist()
         context:   Optional extra data for diff-aware checks (e.g. {'patch': '...'})
+        timed:     Also time each checker (see CheckProfile)
 
     Returns:
         Tuple of (score, results) where:
           score   - Integer 0..80 (static checks contribute up to 80 pts;
                     the remaining 20 come from AI evaluation)
-          results - List of result dicts per check:
-                    {'id', 'description', 'passed', 'weight', 'type'}
+          results - List of result dicts per check, in checklist order:
+                    {'id', 'description', 'passed', 'outcome', 'weight', 'type'}
+                    outcome is 'pass', 'fail', 'timeout' (check_timeout_ms
+                    only) or 'skipped' (fast_fail only); 'passed' is True
+                    only for 'pass'.  With ``timed``,
+                    evaluated checks also carry 'elapsed_s', the checker's
+                    wall time — including any document facts (YAML, body
+                    scan) it was the first to need.
     """
+    doc = parse_document(content)
     checks = checklist.get('checks', [])
-    results: List[Dict[str, Any]] = []
+    fast_fail = checklist.get('fast_fail', False)
+    order = range(len(checks))
+    if fast_fail:
+        order = sorted(order, key=lambda i: (checks[i]['type'] != 'required', check_cost(checks[i])))
+
+    outcomes: Dict[int, str] = {}
+    elapsed: Dict[int, float] = {}
     has_required_failure = False
     raw_score = 0
+    budget = _TimeBudget(check_budget(checklist))
+    patterns = pattern_checks(checklist)
 
-    for check in checks:
-        passed = _evaluate_check(check['id'], content, context)
-        results.append({
-            'id': check['id'],
-            'description': check['description'],
-            'passed': passed,
-            'weight': check['weight'],
-            'type': check['type'],
-        })
+    for i in order:
+        check = checks[i]
+        if fast_fail and check['type'] != 'required' and has_required_failure and raw_score >= 49:
+            outcomes[i] = 'skipped'  # score already fixed at the cap
+            continue
 
+        started = time.perf_counter()
+        try:
+            with budget:
+                passed = _evaluate_check(check['id'], doc, context, patterns)
+        except CheckTimeout:
+            logger.warning(f"Check '{check['id']}' exceeded its {budget.seconds * 1000:.0f} ms budget")
+            passed = None
+        if timed:
+            elapsed[i] = time.perf_counter() - started
+        outcomes[i] = 'timeout' if passed is None else 'pass' if passed else 'fail'
         if passed:
             raw_score += check['weight']
         elif check['type'] == 'required':
             has_required_failure = True
             logger.debug(f"Required check failed: {check['id']}")
 
+    results: List[Dict[str, Any]] = [
+        {
+            'id': check['id'],
+            'description': check['description'],
+            'passed': outcomes[i] == 'pass',
+            'outcome': outcomes[i],
+            'weight': check['weight'],
+            'type': check['type'],
+        }
+        for i, check in enumerate(checks)
+    ]
+    for i, seconds in elapsed.items():
+        results[i]['elapsed_s'] = seconds
+
     # Cap score at 49 if any required check failed (prevents approval)
     score = min(raw_score, 49) if has_required_failure else raw_score
     logger.debug(f"Static checklist score: {score} (raw: {raw_score})")
     return score, results
 
 
+def checklist_fingerprint(checklist: Dict[str, Any]) -> str:
+    """
+    Hash of everything besides the file that run_checks() results depend
+    on: the checks, fast_fail, linear_regex and the checker code in this
+    module.
+    Results cached under one fingerprint are invalid under another.
+    """
+    payload = json.dumps(
+        [checklist.get('checks', []), checklist.get('fast_fail', False),
+         checklist.get('linear_regex', False)],
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8') + _CHECKER_SOURCE).hexdigest()[:16]
+
+
+def uses_context(checklist: Dict[str, Any]) -> bool:
+    """True if some check also reads the run_checks() context (the diff)."""
+    return any(check['id'] in _CONTEXT_CHECKERS for check in checklist.get('checks', []))
+
+
+def check_cost(check: Dict[str, Any]) -> int:
+    """
+    Relative cost of a check: its ``cost`` in the checklist if set,
+    otherwise 2 for a pattern check (one scope scan, shared) or the
+    checker's entry in _CHECK_COSTS (1 when unknown).
+    """
+    if 'pattern' in check or check['id'] in _BUILTIN_PATTERNS:
+        return check.get('cost') or 2
+    return check.get('cost') or _CHECK_COSTS.get(check['id'], 1)
+
+
+# ── Check time budget ─────────────────────────────────────────────────────────
+
+class CheckTimeout(Exception):
+    """A checker ran past the checklist's check_timeout_ms."""
+
+
+def check_budget(checklist: Dict[str, Any]) -> float:
+    """Per-check wall-time budget in seconds from ``check_timeout_ms`` (0 = none)."""
+    return max(0, checklist.get('check_timeout_ms') or 0) / 1000
+
+
+def budget_needs_worker(checklist: Dict[str, Any]) -> bool:
+    """
+    True if the checklist sets a time budget that this thread cannot
+    enforce.  The budget is an interval timer signal, which Python only
+    delivers to the main thread; checks run from another thread must go
+    to worker processes (run_checks_batch()) to be bounded.
+    """
+    return (
+        check_budget(checklist) > 0
+        and hasattr(signal, 'setitimer')
+        and threading.current_thread() is not threading.main_thread()
+    )
+
+
+class _TimeBudget:
+    """
+    Context manager raising CheckTimeout in its block after ``seconds``.
+
+    A no-op when ``seconds`` is 0, off the main thread, or where there is
+    no setitimer (Windows).  Python's regex engine checks for signals while
+    matching, so a catastrophic backtrack is interrupted too.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.active = (
+            seconds > 0
+            and hasattr(signal, 'setitimer')
+            and threading.current_thread() is threading.main_thread()
+        )
+        self._previous = None
+
+    def __enter__(self) -> '_TimeBudget':
+        if self.active:
+            self._previous = signal.signal(signal.SIGALRM, self._expire)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous)
+        return False
+
+    @staticmethod
+    def _expire(signum, frame):
+        raise CheckTimeout()
+
+
+# ── Batch checking on worker processes ───────────────────────────────────────
+
+# Checklist (and timing flag) of a batch worker process, set once by _init_batch_worker()
+_worker_checklist: Optional[Dict[str, Any]] = None
+_worker_timed = False
+
+
+def check_pool(
+    checklist: Dict[str, Any],
+    workers: Optional[int] = None,
+    timed: bool = False,
+) -> ProcessPoolExecutor:
+    """
+    Worker processes for run_checks_batch(), meant to be reused across
+    batches and shut down by the caller.
+
+    Workers are started by a fork server (or spawned where there is none),
+    never forked from the caller: a multi-threaded process may be holding
+    locks (HTTP connection pools, SQLite) that a forked child would inherit
+    locked.  Each worker receives ``checklist`` and ``timed`` once, when it
+    starts, so they are fixed for the life of the pool.
+
+    Args:
+        checklist: Parsed checklist dict from load_checklist()
+        workers:   Worker processes (None = one per CPU core)
+        timed:     Time each checker, as run_checks(timed=True)
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context(method),
+        initializer=_init_batch_worker,
+        initargs=(checklist, timed),
+    )
+
+
+def run_checks_batch(
+    files: Sequence[Tuple[Union[str, Path], Optional[Dict[str, Any]]]],
+    checklist: Dict[str, Any],
+    workers: Optional[int] = None,
+    timed: bool = False,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    run_checks() over many files on a pool of worker processes.
+
+    Static checks are pure CPU work, so a large batch is spread over
+    processes rather than threads.  The checklist is sent to each worker
+    once, when it starts; files are dispatched in chunks (about four per
+    worker) to keep inter-process traffic low.  A file given as a Path is
+    read by the worker that checks it, so a directory tree never has to be
+    held in memory.  If worker processes cannot be started the batch is
+    checked in this process instead.
+
+    Without ``pool`` a check_pool() is started for this batch alone, and a
+    single worker checks in-process, unless the checklist's time budget
+    needs a worker (budget_needs_worker()).
+
+    Args:
+        files:     (content or Path, context) pairs — context as for run_checks()
+        checklist: Parsed checklist dict from load_checklist()
+        workers:   Worker processes (None = one per CPU core); with ``pool``,
+                   its size, used to size the chunks
+        timed:     Time each checker, as run_checks(timed=True)
+        pool:      A check_pool() for ``checklist`` and ``timed`` to run on
+
+    Returns:
+        run_checks() results, in the order of ``files``
+    """
+    if not files:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    if pool is None and workers <= 1 and not budget_needs_worker(checklist):
+        return [run_checks(_read_item(content), checklist, context, timed) for content, context in files]
+
+    chunksize = -(-len(files) // (workers * 4))
+    try:
+        if pool is not None:
+            return list(pool.map(_run_batch_item, files, chunksize=chunksize))
+        with check_pool(checklist, workers, timed) as batch_pool:
+            return list(batch_pool.map(_run_batch_item, files, chunksize=chunksize))
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"Check workers unavailable ({e}) — checking {len(files)} files in-process")
+        return [run_checks(_read_item(content), checklist, context, timed) for content, context in files]
+
+
+def _init_batch_worker(checklist: Dict[str, Any], timed: bool = False) -> None:
+    global _worker_checklist, _worker_timed
+    _worker_checklist = checklist
+    _worker_timed = timed
+    configure_matching(checklist)
+
+
+def _run_batch_item(
+    item: Tuple[Union[str, Path], Optional[Dict[str, Any]]],
+) -> Tuple[int, List[Dict[str, Any]]]:
+    content, context = item
+    return run_checks(_read_item(content), _worker_checklist, context, _worker_timed)
+
+
+def _read_item(content: Union[str, Path]) -> str:
+    if isinstance(content, Path):
+        return content.read_text(encoding='utf-8', errors='replace')
+    return content
+
+
 # ── Individual check implementations ─────────────────────────────────────────
 
-def _evaluate_check(check_id: str, content: str, context: Optional[Dict[str, Any]] = None) -> bool:
+def _evaluate_check(
+    check_id: str,
+    doc: ParsedDocument,
+    context: Optional[Dict[str, Any]] = None,
+    patterns: Optional[Dict[str, PatternSet]] = None,
+) -> bool:
     """Dispatch to the appropriate checker function."""
-    # Checks that need context (diff data) in addition to content
-    _context_checks = {
-        'body_unchanged': _check_body_unchanged,
-    }
-
-    dispatcher = {
-        'frontmatter_present':        _check_frontmatter_present,
-        'frontmatter_has_title':      _check_frontmatter_has_title,
-        'frontmatter_has_description':_check_frontmatter_has_description,
-        'no_placeholder_text':        _check_no_placeholder_text,
-        'content_not_empty':          _check_content_not_empty,
-        'hugo_shortcodes_closed':     _check_hugo_shortcodes_closed,
-        'no_translation_artifacts':   _check_no_translation_artifacts,
-        'headings_translated':        _check_headings_translated,
-        'frontmatter_values_safe':    _check_frontmatter_values_safe,
-        'frontmatter_has_url':        _check_frontmatter_has_url,
-        'adequate_word_count':        _check_adequate_word_count,
-        'proper_heading_structure':   _check_proper_heading_structure,
-        'seo_keywords_in_title':      _check_seo_keywords_in_title,
-        'seo_keywords_in_description':_check_seo_keywords_in_description,
-        'code_examples_present':      _check_code_examples_present,
-        'internal_links_valid_format':_check_internal_links_valid_format,
-        # API docs checks
-        'frontmatter_has_layout':     _check_frontmatter_has_layout,
-        'frontmatter_has_categories': _check_frontmatter_has_categories,
-        'no_broken_html_tags':        _check_no_broken_html_tags,
-        'tables_well_formed':         _check_tables_well_formed,
-        'no_raw_docfx_artifacts':     _check_no_raw_docfx_artifacts,
-        'frontmatter_has_summary':    _check_frontmatter_has_summary,
-        'assembly_version_present':   _check_assembly_version_present,
-        'internal_links_format':      _check_internal_links_format,
-        # SEO checks
-        'frontmatter_yaml_valid':     _check_frontmatter_yaml_valid,
-        'seo_title_length':           _check_seo_title_length,
-        'description_length':         _check_description_length,
-        'no_keyword_stuffing':        _check_no_keyword_stuffing,
-        'tags_format_valid':          _check_tags_format_valid,
-        'tags_relevance':             _check_tags_relevance,
-        'seo_title_has_brand':        _check_seo_title_has_brand,
-        'description_has_call_to_action': _check_description_has_call_to_action,
-    }
+    # Declarative pattern checks (see pattern_checks())
+    if patterns and check_id in patterns:
+        return patterns[check_id].passes(check_id, doc)
 
     # Context-aware checks
-    if check_id in _context_checks:
+    if check_id in _CONTEXT_CHECKERS:
         try:
-            return _context_checks[check_id](content, context or {})
+            return _CONTEXT_CHECKERS[check_id](doc, context or {})
+        except CheckTimeout:
+            raise
         except Exception as e:
             logger.error(f"Check '{check_id}' raised an error: {e}")
             return False
 
-    checker = dispatcher.get(check_id)
+    if check_id in PR_WIDE_CHECKS:
+        return True  # judged across the PR's files by the caller
+
+    checker = _CHECKERS.get(check_id)
     if checker is None:
         logger.warning(f"No checker implemented for: {check_id}")
         return True  # Unknown checks default to pass
 
     try:
-        return checker(content)
+        return checker(doc)
+    except CheckTimeout:
+        raise
     except Exception as e:
         logger.error(f"Check '{check_id}' raised an error: {e}")
         return False
@@ -154,75 +818,61 @@ def _extract_frontmatter(content: str):
     Split content into (frontmatter_text, body_text).
     Returns (None, content) if no frontmatter block is found.
     """
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n?(.*)', content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if match:
         return match.group(1), match.group(2)
     return None, content
 
 
-def _check_frontmatter_present(content: str) -> bool:
-    fm, _ = _extract_frontmatter(content)
-    return fm is not None
+def _check_frontmatter_present(doc: ParsedDocument) -> bool:
+    return doc.frontmatter is not None
 
 
-def _check_frontmatter_has_title(content: str) -> bool:
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+def _check_frontmatter_has_title(doc: ParsedDocument) -> bool:
+    if not doc.frontmatter:
         return False
-    return bool(re.search(r'^\s*title\s*:\s*.+', fm, re.MULTILINE))
+    return doc.fields.get('title') is not None
 
 
-def _check_frontmatter_has_description(content: str) -> bool:
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+def _check_frontmatter_has_description(doc: ParsedDocument) -> bool:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*description\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    desc = doc.fields.get('description')
+    if desc is None:
         return False
-    return len(match.group(1).strip().strip('"\'')) >= 50
+    return len(desc.strip().strip('"\'')) >= 50
 
 
-def _check_no_placeholder_text(content: str) -> bool:
-    patterns = [
-        r'\bTODO\b', r'\bFIXME\b', r'\[PLACEHOLDER\]',
-        r'Lorem ipsum', r'\[INSERT\b',
-    ]
-    return not any(re.search(p, content, re.IGNORECASE) for p in patterns)
-
-
-def _check_content_not_empty(content: str) -> bool:
-    _, body = _extract_frontmatter(content)
+def _check_content_not_empty(doc: ParsedDocument) -> bool:
+    body = doc.body
     return len(body.strip()) >= 100
 
 
-def _check_frontmatter_has_url(content: str) -> bool:
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+def _check_frontmatter_has_url(doc: ParsedDocument) -> bool:
+    if not doc.frontmatter:
         return False
-    return bool(re.search(r'^\s*(url|linktitle)\s*:\s*.+', fm, re.MULTILINE))
+    return doc.fields.get('url') is not None or doc.fields.get('linktitle') is not None
 
 
-def _check_adequate_word_count(content: str) -> bool:
-    _, body = _extract_frontmatter(content)
+def _check_adequate_word_count(doc: ParsedDocument) -> bool:
+    body = doc.body
     # Strip Markdown syntax before counting
     plain = re.sub(r'[#*`\[\]()>_~]', ' ', body)
     words = plain.split()
     return len(words) >= 200
 
 
-def _check_proper_heading_structure(content: str) -> bool:
-    _, body = _extract_frontmatter(content)
-    return bool(re.search(r'^##\s+', body, re.MULTILINE))
+def _check_proper_heading_structure(doc: ParsedDocument) -> bool:
+    return doc.scan.has_h2
 
 
-def _check_seo_keywords_in_title(content: str) -> bool:
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+def _check_seo_keywords_in_title(doc: ParsedDocument) -> bool:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*title\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    title = doc.fields.get('title')
+    if title is None:
         return False
-    title = match.group(1).lower()
+    title = title.lower()
     # Title should contain at least one action verb or format keyword
     action_patterns = [
         r'\b(convert|create|merge|split|extract|edit|add|remove|insert|format|'
@@ -232,14 +882,13 @@ def _check_seo_keywords_in_title(content: str) -> bool:
     return any(re.search(p, title) for p in action_patterns)
 
 
-def _check_seo_keywords_in_description(content: str) -> bool:
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+def _check_seo_keywords_in_description(doc: ParsedDocument) -> bool:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*description\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    desc = doc.fields.get('description')
+    if desc is None:
         return False
-    desc = match.group(1).lower()
+    desc = desc.lower()
     # Description should mention at least one product or format
     product_patterns = [
         r'\baspose\b', r'\bgroupdocs\b',
@@ -249,28 +898,22 @@ def _check_seo_keywords_in_description(content: str) -> bool:
     return any(re.search(p, desc, re.IGNORECASE) for p in product_patterns)
 
 
-def _check_code_examples_present(content: str) -> bool:
-    _, body = _extract_frontmatter(content)
-    return bool(re.search(r'```', body))
+def _check_code_examples_present(doc: ParsedDocument) -> bool:
+    return doc.scan.has_code_block
 
 
-def _check_hugo_shortcodes_closed(content: str) -> bool:
+def _check_hugo_shortcodes_closed(doc: ParsedDocument) -> bool:
     """
     Ensure no meaningful content appears after the last closing
     {{< /blocks/products/pf/main-wrap-class >}} tag.
     Content leaking outside the tag breaks the Hugo page layout.
     The back-to-top button shortcode is allowed after the closing tag.
     """
-    _, body = _extract_frontmatter(content)
-
-    close_re = re.compile(
-        r'\{\{<\s*/blocks/products/pf/main-wrap-class\s*>\}\}', re.IGNORECASE
-    )
-    matches = list(close_re.finditer(body))
-    if not matches:
+    close_end = doc.scan.wrap_close_end
+    if close_end is None:
         return True  # No shortcodes used — not applicable
 
-    after = body[matches[-1].end():]
+    after = doc.body[close_end:]
     # Strip the back-to-top button shortcode and any whitespace
     after = re.sub(
         r'\{\{<\s*blocks/products/products-backtop-button\s*>\}\}', '', after
@@ -278,26 +921,21 @@ def _check_hugo_shortcodes_closed(content: str) -> bool:
     return len(after.strip()) == 0
 
 
-def _check_no_translation_artifacts(content: str) -> bool:
+def _check_no_translation_artifacts(doc: ParsedDocument) -> bool:
     """
     Ensure no LLM reasoning text or draft notes appear before the first
     Hugo shortcode tag ({{< blocks/products/pf/main-wrap-class >}}).
     Translators sometimes leave internal monologue in the output.
     """
-    _, body = _extract_frontmatter(content)
-
-    open_re = re.compile(
-        r'\{\{<\s*blocks/products/pf/main-wrap-class\s*>\}\}', re.IGNORECASE
-    )
-    first = open_re.search(body)
-    if not first:
+    open_start = doc.scan.wrap_open_start
+    if open_start is None:
         return True  # No shortcodes — not applicable
 
-    before = body[:first.start()].strip()
+    before = doc.body[:open_start].strip()
     return len(before) == 0
 
 
-def _check_headings_translated(content: str) -> bool:
+def _check_headings_translated(doc: ParsedDocument) -> bool:
     """
     For translated files (detected by significant non-ASCII body text),
     verify that headings are also translated and not left in English.
@@ -305,40 +943,32 @@ def _check_headings_translated(content: str) -> bool:
     characters are non-ASCII.  All-ASCII headings in such a file signal
     that the translator forgot to translate the section titles.
     """
-    _, body = _extract_frontmatter(content)
+    scan = doc.scan
 
-    # Strip code blocks and shortcodes before measuring language
-    clean = re.sub(r'```.*?```', '', body, flags=re.DOTALL)
-    clean = re.sub(r'\{\{<.*?>\}\}', '', clean)
-
-    non_ws = [c for c in clean if not c.isspace()]
-    if not non_ws:
+    # Language is measured without code blocks and shortcodes
+    if not scan.text_chars:
         return True
-
-    non_ascii = sum(1 for c in non_ws if ord(c) > 127)
-    if non_ascii / len(non_ws) < 0.05:
+    if scan.non_ascii_chars / scan.text_chars < 0.05:
         return True  # Likely an English file — check not applicable
 
     # File is a translation: at least some headings must contain non-ASCII
-    headings = re.findall(r'^#{1,6}\s+(.+)', body, re.MULTILINE)
-    if not headings:
+    if not scan.headings:
         return True
 
-    heading_text = ' '.join(headings)
+    heading_text = ' '.join(scan.headings)
     return any(ord(c) > 127 for c in heading_text)
 
 
-def _check_frontmatter_values_safe(content: str) -> bool:
+def _check_frontmatter_values_safe(doc: ParsedDocument) -> bool:
     """
     Detect unquoted frontmatter values that contain a colon.
     An unquoted colon in a YAML value (e.g.  title: Guide: Part 2)
     breaks the Hugo build process.  Values must be wrapped in quotes.
     """
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return True
 
-    for line in fm.splitlines():
+    for line in doc.frontmatter.splitlines():
         # Match  key: value  lines (skip blank / comment / continuation lines)
         m = re.match(r'^\s*[\w][\w-]*\s*:\s*(.+)$', line)
         if not m:
@@ -354,14 +984,13 @@ def _check_frontmatter_values_safe(content: str) -> bool:
     return True
 
 
-def _check_internal_links_valid_format(content: str) -> bool:
-    _, body = _extract_frontmatter(content)
+def _check_internal_links_valid_format(doc: ParsedDocument) -> bool:
     # If no internal links exist, pass by default
-    raw_links = re.findall(r'\[.*?\]\(((?!http)[^)]+)\)', body)
+    raw_links = doc.scan.links
     if not raw_links:
         return True
     # Links should be relative paths or Hugo relref shortcodes
-    hugo_relref = re.search(r'\{\{<\s*relref\s+', body)
+    hugo_relref = re.search(r'\{\{<\s*relref\s+', doc.body)
     return hugo_relref is not None or all(
         link.startswith('/') or link.startswith('../') or link.endswith('.md')
         for link in raw_links
@@ -370,82 +999,49 @@ def _check_internal_links_valid_format(content: str) -> bool:
 
 # ── API docs checks ──────────────────────────────────────────────────────────
 
-def _check_frontmatter_has_layout(content: str) -> bool:
+def _check_frontmatter_has_layout(doc: ParsedDocument) -> bool:
     """Frontmatter must contain a ``layout`` field."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    return bool(re.search(r'^\s*layout\s*:\s*.+', fm, re.MULTILINE))
+    return doc.fields.get('layout') is not None
 
 
-def _check_frontmatter_has_categories(content: str) -> bool:
+def _check_frontmatter_has_categories(doc: ParsedDocument) -> bool:
     """Frontmatter must contain a ``categories`` field."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    return bool(re.search(r'^\s*categories\s*:', fm, re.MULTILINE))
+    return 'categories' in doc.fields
 
 
-def _check_no_broken_html_tags(content: str) -> bool:
+def _check_no_broken_html_tags(doc: ParsedDocument) -> bool:
     """No unclosed HTML tags (``<xref>``, ``<pre>``, ``<code>``) in the body."""
-    _, body = _extract_frontmatter(content)
-    for tag in ('xref', 'pre', 'code'):
-        opens = len(re.findall(rf'<{tag}[\s>]', body, re.IGNORECASE))
-        closes = len(re.findall(rf'</{tag}\s*>', body, re.IGNORECASE))
-        if opens > closes:
-            return False
-    return True
+    scan = doc.scan
+    return all(scan.tag_opens[tag] <= scan.tag_closes[tag] for tag in ('xref', 'pre', 'code'))
 
 
-def _check_tables_well_formed(content: str) -> bool:
+def _check_tables_well_formed(doc: ParsedDocument) -> bool:
     """Markdown tables must have consistent column counts across rows."""
-    _, body = _extract_frontmatter(content)
-    table_rows = re.findall(r'^\|.+\|$', body, re.MULTILINE)
-    if not table_rows:
-        return True  # No tables — pass
-    # Group consecutive table rows
-    i = 0
-    while i < len(table_rows):
-        first_cols = table_rows[i].count('|') - 1
-        i += 1
-        while i < len(table_rows):
-            cols = table_rows[i].count('|') - 1
-            if cols != first_cols:
-                return False
-            i += 1
-    return True
+    # Every row of a table must have its first row's column count (no tables — pass)
+    return all(len(set(run)) == 1 for run in doc.scan.table_runs)
 
 
-def _check_no_raw_docfx_artifacts(content: str) -> bool:
+def _check_no_raw_docfx_artifacts(doc: ParsedDocument) -> bool:
     """No raw DocFX artifacts (``<xref:...>``, ``uid:`` references) in the body."""
-    _, body = _extract_frontmatter(content)
-    if re.search(r'<xref:', body):
-        return False
-    # Raw uid: lines outside frontmatter
-    if re.search(r'^\s*uid\s*:', body, re.MULTILINE):
-        return False
-    return True
+    # Raw uid: lines outside frontmatter count too
+    return not (doc.scan.has_xref_uid or doc.scan.has_uid_line)
 
 
-def _check_frontmatter_has_summary(content: str) -> bool:
+def _check_frontmatter_has_summary(doc: ParsedDocument) -> bool:
     """Frontmatter must contain a non-empty ``summary`` field."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*summary\s*:\s*(.+)', fm, re.MULTILINE)
-    return bool(match and match.group(1).strip())
-
+    summary = doc.fields.get('summary')
+    return bool(summary and summary.strip())
 
-def _check_assembly_version_present(content: str) -> bool:
-    """Body should reference an assembly version (e.g. ``Assembly: Aspose.Words.dll``)."""
-    _, body = _extract_frontmatter(content)
-    return bool(re.search(r'Assembly\s*:.*\.dll', body, re.IGNORECASE))
 
-
-def _check_internal_links_format(content: str) -> bool:
+def _check_internal_links_format(doc: ParsedDocument) -> bool:
     """Internal links should use path format (``/family/...``), not ``.md`` extensions."""
-    _, body = _extract_frontmatter(content)
-    internal_links = re.findall(r'\[.*?\]\(((?!http)[^)]+)\)', body)
+    internal_links = doc.scan.links
     if not internal_links:
         return True
     # Fail if any internal link ends with .md (should use clean URLs)
@@ -454,43 +1050,34 @@ def _check_internal_links_format(content: str) -> bool:
 
 # ── SEO checks ────────────────────────────────────────────────────────────────
 
-def _check_frontmatter_yaml_valid(content: str) -> bool:
+def _check_frontmatter_yaml_valid(doc: ParsedDocument) -> bool:
     """Frontmatter YAML must parse without errors."""
-    fm, _ = _extract_frontmatter(content)
-    if fm is None:
-        return False
-    try:
-        yaml.safe_load(fm)
-        return True
-    except yaml.YAMLError:
-        return False
+    return doc.yaml_valid
 
 
-def _check_seo_title_length(content: str) -> bool:
+def _check_seo_title_length(doc: ParsedDocument) -> bool:
     """``seoTitle`` field must be 30-60 characters."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*seoTitle\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    title = doc.fields.get('seoTitle')
+    if title is None:
         return False
-    title = match.group(1).strip().strip('"\'')
+    title = title.strip().strip('"\'')
     return 30 <= len(title) <= 60
 
 
-def _check_description_length(content: str) -> bool:
+def _check_description_length(doc: ParsedDocument) -> bool:
     """``description`` field must be 50-160 characters (optimal for meta descriptions)."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*description\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    desc = doc.fields.get('description')
+    if desc is None:
         return False
-    desc = match.group(1).strip().strip('"\'')
+    desc = desc.strip().strip('"\'')
     return 50 <= len(desc) <= 160
 
 
-def _check_body_unchanged(content: str, context: Dict[str, Any]) -> bool:
+def _check_body_unchanged(doc: ParsedDocument, context: Dict[str, Any]) -> bool:
     """Only frontmatter should be modified — body content must remain untouched.
 
     Uses the unified diff (patch) from context to verify that all changed
@@ -501,7 +1088,7 @@ def _check_body_unchanged(content: str, context: Dict[str, Any]) -> bool:
         return True  # No diff available — assume pass
 
     # Find the closing --- line number in the content
-    lines = content.splitlines()
+    lines = doc.content.splitlines()
     fm_end_line = None
     in_frontmatter = False
     for i, line in enumerate(lines, start=1):
@@ -526,17 +1113,16 @@ def _check_body_unchanged(content: str, context: Dict[str, Any]) -> bool:
     return True
 
 
-def _check_no_keyword_stuffing(content: str) -> bool:
+def _check_no_keyword_stuffing(doc: ParsedDocument) -> bool:
     """``seoTitle`` and ``description`` should not repeat any word more than twice."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return True
     # Combine seoTitle and description text
     texts = []
     for field in ('seoTitle', 'description'):
-        match = re.search(rf'^\s*{field}\s*:\s*(.+)', fm, re.MULTILINE)
-        if match:
-            texts.append(match.group(1).strip().strip('"\'').lower())
+        value = doc.fields.get(field)
+        if value is not None:
+            texts.append(value.strip().strip('"\'').lower())
     combined = ' '.join(texts)
     # Tokenize and count (skip short stop words)
     words = re.findall(r'\b[a-z]{4,}\b', combined)
@@ -546,15 +1132,13 @@ def _check_no_keyword_stuffing(content: str) -> bool:
     return all(c <= 2 for c in counts.values())
 
 
-def _check_tags_format_valid(content: str) -> bool:
+def _check_tags_format_valid(doc: ParsedDocument) -> bool:
     """``tags`` field must be a YAML list of 3-10 lowercase hyphenated entries."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return True  # No frontmatter — not applicable
-    try:
-        data = yaml.safe_load(fm)
-    except yaml.YAMLError:
+    if not doc.yaml_valid:
         return False
+    data = doc.data
     if not isinstance(data, dict):
         return True
     tags = data.get('tags')
@@ -570,15 +1154,11 @@ def _check_tags_format_valid(content: str) -> bool:
     )
 
 
-def _check_tags_relevance(content: str) -> bool:
+def _check_tags_relevance(doc: ParsedDocument) -> bool:
     """Tags should include at least one product name and one action/format keyword."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
-        return True
-    try:
-        data = yaml.safe_load(fm)
-    except yaml.YAMLError:
+    if not doc.frontmatter:
         return True
+    data = doc.data  # None when the YAML is invalid — not applicable
     if not isinstance(data, dict):
         return True
     tags = data.get('tags')
@@ -593,29 +1173,98 @@ def _check_tags_relevance(content: str) -> bool:
     return has_product and has_action
 
 
-def _check_seo_title_has_brand(content: str) -> bool:
+def _check_seo_title_has_brand(doc: ParsedDocument) -> bool:
     """``seoTitle`` should mention the product name (Aspose.*, GroupDocs.*)."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*seoTitle\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    title = doc.fields.get('seoTitle')
+    if title is None:
         return False
-    title = match.group(1).strip().lower()
+    title = title.strip().lower()
     return bool(re.search(r'aspose|groupdocs', title))
 
 
-def _check_description_has_call_to_action(content: str) -> bool:
+def _check_description_has_call_to_action(doc: ParsedDocument) -> bool:
     """``description`` should contain an action verb (learn, discover, convert, etc.)."""
-    fm, _ = _extract_frontmatter(content)
-    if not fm:
+    if not doc.frontmatter:
         return False
-    match = re.search(r'^\s*description\s*:\s*(.+)', fm, re.MULTILINE)
-    if not match:
+    desc = doc.fields.get('description')
+    if desc is None:
         return False
-    desc = match.group(1).strip().lower()
+    desc = desc.strip().lower()
     return bool(re.search(
         r'\b(learn|discover|convert|create|merge|split|edit|manage|generate|'
         r'extract|process|automate|optimize|explore|master|implement|build|'
         r'add|remove|read|write|parse|render|export|import)\b', desc
     ))
+
+
+# ── Dispatch table ────────────────────────────────────────────────────────────
+# Built once at import; _evaluate_check() looks checkers up by check id.
+
+_CHECKERS = {
+    'frontmatter_present':        _check_frontmatter_present,
+    'frontmatter_has_title':      _check_frontmatter_has_title,
+    'frontmatter_has_description':_check_frontmatter_has_description,
+    'content_not_empty':          _check_content_not_empty,
+    'hugo_shortcodes_closed':     _check_hugo_shortcodes_closed,
+    'no_translation_artifacts':   _check_no_translation_artifacts,
+    'headings_translated':        _check_headings_translated,
+    'frontmatter_values_safe':    _check_frontmatter_values_safe,
+    'frontmatter_has_url':        _check_frontmatter_has_url,
+    'adequate_word_count':        _check_adequate_word_count,
+    'proper_heading_structure':   _check_proper_heading_structure,
+    'seo_keywords_in_title':      _check_seo_keywords_in_title,
+    'seo_keywords_in_description':_check_seo_keywords_in_description,
+    'code_examples_present':      _check_code_examples_present,
+    'internal_links_valid_format':_check_internal_links_valid_format,
+    # API docs checks
+    'frontmatter_has_layout':     _check_frontmatter_has_layout,
+    'frontmatter_has_categories': _check_frontmatter_has_categories,
+    'no_broken_html_tags':        _check_no_broken_html_tags,
+    'tables_well_formed':         _check_tables_well_formed,
+    'no_raw_docfx_artifacts':     _check_no_raw_docfx_artifacts,
+    'frontmatter_has_summary':    _check_frontmatter_has_summary,
+    'internal_links_format':      _check_internal_links_format,
+    # SEO checks
+    'frontmatter_yaml_valid':     _check_frontmatter_yaml_valid,
+    'seo_title_length':           _check_seo_title_length,
+    'description_length':         _check_description_length,
+    'no_keyword_stuffing':        _check_no_keyword_stuffing,
+    'tags_format_valid':          _check_tags_format_valid,
+    'tags_relevance':             _check_tags_relevance,
+    'seo_title_has_brand':        _check_seo_title_has_brand,
+    'description_has_call_to_action': _check_description_has_call_to_action,
+}
+
+# Checks that need context (diff data) in addition to the document
+_CONTEXT_CHECKERS = {
+    'body_unchanged': _check_body_unchanged,
+}
+
+# Checks that depend on other files (see link_index.LinkIndex): every file
+# passes them here, and the arbiter fails the files its PR-wide pass flags.
+# Cached results therefore never carry their failures.
+PR_WIDE_CHECKS = frozenset({LINK_CHECK_ID})
+
+# Relative cost of each checker, for fast_fail ordering (measured on a
+# 200 KB DocFX page): 1 frontmatter field or substring test, 2 YAML load,
+# shortcode, placeholder or patch scan, 3 one BodyScan family, 5 several body
+# passes.
+# Checkers not listed cost 1.
+_CHECK_COSTS = {
+    'frontmatter_yaml_valid':     2,
+    'tags_format_valid':          2,
+    'tags_relevance':             2,
+    'hugo_shortcodes_closed':     2,
+    'no_translation_artifacts':   2,
+    'body_unchanged':             2,
+    'proper_heading_structure':   3,
+    'internal_links_valid_format':3,
+    'internal_links_format':      3,
+    'no_broken_html_tags':        3,
+    'tables_well_formed':         3,
+    'no_raw_docfx_artifacts':     3,
+    'headings_translated':        3,
+    'adequate_word_count':        5,
+}
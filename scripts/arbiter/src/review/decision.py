@@ -3,12 +3,15 @@ Combine static checklist scores + AI evaluation into a final decision
 and generate the GitHub PR review comment body.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# GitHub rejects review and comment bodies longer than this
+MAX_COMMENT_CHARS = 65536
+
 
 # ── Decision logic ────────────────────────────────────────────────────────────
 
@@ -35,16 +38,7 @@ def make_decision(
     """
     ai_contribution = ai_result.get('weighted_contribution', 0)
     total = min(100, static_score + ai_contribution)
-
-    approve_threshold = thresholds.get('approve', 80)
-    request_threshold = thresholds.get('request_changes', 50)
-
-    if total >= approve_threshold:
-        decision = 'APPROVE'
-    elif total >= request_threshold:
-        decision = 'REQUEST_CHANGES'
-    else:
-        decision = 'REJECT'
+    decision = score_to_decision(total, thresholds)
 
     logger.info(
         f"Decision: {decision} | score={total} "
@@ -53,44 +47,90 @@ def make_decision(
     return decision, total
 
 
+def score_to_decision(total: int, thresholds: Dict[str, int]) -> str:
+    """Map a 0-100 score onto 'APPROVE' | 'REQUEST_CHANGES' | 'REJECT'."""
+    if total >= thresholds.get('approve', 80):
+        return 'APPROVE'
+    if total >= thresholds.get('request_changes', 50):
+        return 'REQUEST_CHANGES'
+    return 'REJECT'
+
+
+def decision_if_fixed(
+    static_score: int,
+    max_ai_contribution: int,
+    thresholds: Dict[str, int],
+) -> Optional[str]:
+    """
+    Return the decision if it no longer depends on the AI evaluation.
+
+    The AI adds 0..max_ai_contribution points to the static score, so the
+    reachable totals form the interval [static, static + max].  Decisions are
+    monotonic in the score: if both ends agree, every AI result does.
+
+    Args:
+        static_score:        Static points (already capped on required failure)
+        max_ai_contribution: ai_evaluation.weight from the checklist
+        thresholds:          Dict with keys 'approve' and 'request_changes'
+
+    Returns:
+        The fixed decision string, or None if the AI result could change it
+    """
+    lowest = score_to_decision(min(100, static_score), thresholds)
+    highest = score_to_decision(min(100, static_score + max_ai_contribution), thresholds)
+    return lowest if lowest == highest else None
+
+
 # ── Review comment builder ────────────────────────────────────────────────────
 
 def build_review_comment(
     decision: str,
     total_score: int,
-    static_score: int,
-    ai_result: Dict[str, Any],
-    check_results: List[Dict[str, Any]],
-    file_summaries: List[Dict[str, Any]],
+    summary: Dict[str, Any],
     thresholds: Dict[str, int],
-    required_cap_applied: bool = False,
 ) -> str:
     """
     Build the Markdown body for the GitHub PR review comment.
 
+    Rendered from the compact PR summary, so the size depends on the
+    configured top-K and failing-file sample rather than on the PR's file
+    count.  If the body would still exceed GitHub's comment limit, fewer
+    failing files are listed until it fits.
+
     Args:
-        decision:       'APPROVE' | 'REQUEST_CHANGES' | 'REJECT'
-        total_score:    Final composite score 0-100
-        static_score:   Points from static checklist only
-        ai_result:      Dict from evaluator.evaluate_content()
-        check_results:  List of per-check result dicts from checklist.run_checks()
-        file_summaries: List of {'path': str, 'score': int, 'issues': [str]}
-                        for each reviewed file
-        thresholds:     Score threshold dict from config
+        decision:    'APPROVE' | 'REQUEST_CHANGES' | 'REJECT'
+        total_score: Final composite score 0-100
+        summary:     ReviewAggregator.summary() output
+        thresholds:  Score threshold dict from config
 
     Returns:
         Markdown string ready to post as a GitHub review comment
     """
-    header = _decision_header(decision, total_score, thresholds)
-    cap_notice = _cap_notice() if required_cap_applied else ''
-    score_breakdown = _score_breakdown(static_score, ai_result)
-    checklist_table = _checklist_table(check_results)
-    ai_section = _ai_section(ai_result)
-    files_section = _files_section(file_summaries)
+    head = [
+        _decision_header(decision, total_score, thresholds),
+        _cap_notice() if summary['required_failed'] else '',
+        _ai_skipped_notice(summary['ai_summary']) if summary['ai_skipped'] else '',
+        _score_breakdown(summary),
+        _sampling_notice(summary['sampling']) if summary['sampling'] else '',
+        _trivial_notice(summary['trivial'], summary['files']) if summary['trivial'] else '',
+        _checklist_table(summary),
+        _links_section(summary['unresolved_links']) if summary.get('unresolved_links') else '',
+        _ai_section(summary),
+        _issues_section(summary),
+    ]
     footer = _footer(decision)
 
-    parts = [header, cap_notice, score_breakdown, checklist_table, ai_section, files_section, footer]
-    return '\n\n'.join(p for p in parts if p)
+    shown = len(summary['failing_files'])
+    while True:
+        parts = head + [_files_section(summary, shown), footer]
+        body = '\n\n'.join(p for p in parts if p)
+        if len(body) <= MAX_COMMENT_CHARS:
+            return body
+        if shown == 0:
+            logger.warning(f"Review comment truncated to {MAX_COMMENT_CHARS} characters")
+            notice = '\n\n*…comment truncated to fit GitHub\'s size limit.*'
+            return body[:MAX_COMMENT_CHARS - len(notice)] + notice
+        shown //= 2
 
 
 # ── Private helpers ───────────────────────────────────────────────────────────
@@ -129,75 +169,161 @@ def _cap_notice() -> str:
     )
 
 
-def _score_breakdown(static_score: int, ai_result: Dict[str, Any]) -> str:
-    ai_contrib = ai_result.get('weighted_contribution', 0)
+def _ai_skipped_notice(reason: str) -> str:
+    return (
+        f"> ℹ️ **AI evaluation skipped** — {reason} "
+        f"No AI calls were made for this PR."
+    )
+
+
+def _sampling_notice(sampling: Dict[str, Any]) -> str:
+    return (
+        f"> 📊 **AI evaluation sampled** — {sampling['sampled']} of {sampling['population']} "
+        f"files ({sampling['rate']:.1%}) across {sampling['strata']} strata "
+        f"(page type × diff size). Averaged AI score: **{sampling['mean']:.1f} "
+        f"± {sampling['half_width']:.1f}** ({sampling['confidence']:.0%} confidence)."
+    )
+
+
+_TRIVIAL_LABELS = {
+    'version_stamp': 'version stamp',
+    'whitespace':    'whitespace',
+    'frontmatter':   'frontmatter',
+}
+
+
+def _trivial_notice(trivial: Dict[str, int], files: int) -> str:
+    kinds = ', '.join(
+        f"{label}: {trivial[kind]}" for kind, label in _TRIVIAL_LABELS.items() if kind in trivial
+    )
+    return (
+        f"> 🪶 **Trivial changes** — {sum(trivial.values())} of {files} files change only "
+        f"a version stamp, whitespace or frontmatter ({kinds}). They kept the verdict of "
+        f"their last approved review and were not re-checked."
+    )
+
+
+def _score_breakdown(summary: Dict[str, Any]) -> str:
+    static_score = summary['avg_static']
+    ai_contrib = summary['avg_ai_contribution']
     total = static_score + ai_contrib
+    ai_points = 'skipped' if summary['ai_skipped'] else ai_contrib
     return (
         f"### Score Breakdown\n\n"
         f"| Component | Points |\n"
         f"|-----------|--------|\n"
         f"| Static checklist (max 80) | {static_score} |\n"
-        f"| AI evaluation (max 20) | {ai_contrib} |\n"
+        f"| AI evaluation (max 20) | {ai_points} |\n"
         f"| **Total** | **{total}** |"
     )
 
 
-def _checklist_table(check_results: List[Dict[str, Any]]) -> str:
-    if not check_results:
+def _checklist_table(summary: Dict[str, Any]) -> str:
+    if not summary['checks']:
         return ''
 
+    n = summary['files']
     rows = ['### Checklist Results\n', '| # | Check | Type | Result |', '|---|-------|------|--------|']
-    for i, r in enumerate(check_results, 1):
-        icon = '✅' if r['passed'] else ('❌' if r['type'] == 'required' else '⚠️')
+    any_skipped = any_timeout = False
+    for i, check in enumerate(summary['checks'], 1):
+        failed = check['failed_files']
+        skipped = check.get('skipped_files', 0)
+        timed_out = check.get('timeout_files', 0)
+        if failed:
+            icon = '❌' if check['type'] == 'required' else '⚠️'
+            result = f"{icon} {failed}/{n} files" if n > 1 else icon
+            if timed_out:
+                result += f" (⏱️ {timed_out} timed out)"
+                any_timeout = True
+        elif skipped == n:
+            result = '⏭️ Not evaluated'
+        else:
+            result = '✅'
+        if 0 < skipped < n:
+            result += f" ({skipped}/{n} not evaluated)"
+        any_skipped = any_skipped or skipped > 0
+        rows.append(
+            f"| {i} | {check['description']} | {check['type'].title()} | {result} |"
+        )
+    if any_skipped:
         rows.append(
-            f"| {i} | {r['description']} | {r['type'].title()} | {icon} |"
+            '\n⏭️ *Not evaluated: skipped (fast-fail) in files whose static score '
+            'was already fixed at the cap by a failing required check.*'
+        )
+    if any_timeout:
+        rows.append(
+            '\n⏱️ *Timed out: the check ran past its time budget and counts as failed. '
+            'The file may hold pathological input (e.g. an unbalanced, very long line).*'
         )
     return '\n'.join(rows)
 
 
-def _ai_section(ai_result: Dict[str, Any]) -> str:
-    if not ai_result.get('summary'):
+def _ai_section(summary: Dict[str, Any]) -> str:
+    if summary['ai_skipped']:
         return ''
 
-    lines = [
+    n = summary['files']
+    sampling = summary['sampling']
+    if sampling:
+        text = (
+            f"Estimated from a stratified sample of {sampling['sampled']} "
+            f"of {n} English Markdown file(s)."
+        )
+    else:
+        text = f"Averaged over {n} English Markdown file(s)."
+
+    return '\n'.join([
         '### AI Content Evaluation',
         '',
-        f"**Summary:** {ai_result['summary']}",
+        f"**Summary:** {text}",
+        '',
+        f"**Average AI score:** {summary['avg_ai_score']}/100",
+    ])
+
+
+def _links_section(unresolved: Dict[str, Any]) -> str:
+    links = unresolved['links']
+    shown = f"; the first {len(links)} are listed" if len(links) < unresolved['count'] else ''
+    lines = [
+        '### Unresolved Internal Links',
         '',
-        f"| Criterion | Score |",
-        f"|-----------|-------|",
-        f"| Technical accuracy (max 25) | {ai_result.get('technical_accuracy', 0)} |",
-        f"| Clarity & readability (max 20) | {ai_result.get('clarity', 0)} |",
-        f"| SEO quality (max 20) | {ai_result.get('seo_quality', 0)} |",
-        f"| Actionability (max 20) | {ai_result.get('actionability', 0)} |",
-        f"| Content uniqueness (max 15) | {ai_result.get('uniqueness', 0)} |",
+        f"{unresolved['count']} link(s) in {unresolved['files']} file(s) point at no page "
+        f"in this PR or the target branch{shown}.",
+        '',
+        '| File | Line | Link |',
+        '|------|------|------|',
     ]
+    for link in links:
+        lines.append(f"| `{link['path']}` | {link['line']} | `{link['link'].replace('|', '%7C')}` |")
+    return '\n'.join(lines)
 
-    strengths = ai_result.get('strengths', [])
-    if strengths:
-        lines += ['', '**Strengths:**']
-        lines += [f"- {s}" for s in strengths]
 
-    issues = ai_result.get('issues', [])
-    if issues:
-        lines += ['', '**Issues:**']
-        lines += [f"- {iss}" for iss in issues]
+def _issues_section(summary: Dict[str, Any]) -> str:
+    if not summary['top_issues']:
+        return ''
 
+    lines = ['### Most Frequent Issues', '']
+    for issue, count in summary['top_issues']:
+        lines.append(f"- {issue} — {count} file(s)")
     return '\n'.join(lines)
 
 
-def _files_section(file_summaries: List[Dict[str, Any]]) -> str:
-    if not file_summaries:
-        return ''
+def _files_section(summary: Dict[str, Any], shown: int) -> str:
+    n = summary['files']
+    failing = summary['failing_count']
+
+    lines = ['### Files Reviewed', '']
+    if not failing:
+        lines.append(f"All {n} file(s) pass every check with no issues found.")
+        return '\n'.join(lines)
 
-    lines = ['### Files Reviewed']
-    for fs in file_summaries:
+    listed = summary['failing_files'][:shown]
+    note = f"; showing the first {len(listed)}" if len(listed) < failing else ''
+    lines.append(f"{failing} of {n} file(s) have issues{note}.")
+    for fs in listed:
         lines.append(f"\n**`{fs['path']}`**")
-        if fs.get('issues'):
-            for issue in fs['issues']:
-                lines.append(f"  - {issue}")
-        else:
-            lines.append("  - No issues found")
+        for issue in fs['issues']:
+            lines.append(f"  - {issue}")
 
     return '\n'.join(lines)
 
@@ -0,0 +1,136 @@
+"""
+Classification of a file's unified diff as trivial or structural.
+
+Most pages of a DocFX regeneration PR differ from the base branch only by
+the ``Assembly: X.dll (version)`` stamp the postprocessor writes, by
+whitespace, or by regenerated frontmatter fields.  classify_patch() reads
+the ``patch`` GitHub returns for each PR file and names the kind of such a
+change, so those files can take the verdict of their last approved review
+instead of being fetched, checked and AI-evaluated again.
+"""
+
+import re
+from typing import List, Optional, Sequence, Tuple
+
+# Least to most significant; a file is as trivial as its least trivial change
+TRIVIAL_KINDS = ('version_stamp', 'whitespace', 'frontmatter')
+
+_HUNK_RE = re.compile(r'@@ -(\d+)(?:,\d+)? \+\d+(?:,\d+)? @@')
+# Written by scripts/reference/postprocessor.py add_assembly_version()
+_STAMP_RE = re.compile(r'(Assembly: [^\s()]+\.dll)(?: \([^)]*\))?')
+# A frontmatter line: ``key: value`` or a block-list item
+_YAML_LINE_RE = re.compile(r'[A-Za-z_][\w.-]*:(?:\s|$)|\s*- ')
+
+# (tag, text) with tag ' ' (context), '-' (removed) or '+' (added)
+_Line = Tuple[str, str]
+
+
+def classify_patch(patch: Optional[str], kinds: Sequence[str] = TRIVIAL_KINDS) -> Optional[str]:
+    """
+    Kind of trivial change a unified diff makes, or None if it is structural.
+
+    Each change block (consecutive removed/added lines) is matched against
+    ``kinds`` in TRIVIAL_KINDS order:
+
+    - ``version_stamp``: removed and added lines are equal once the
+      ``(version)`` after ``Assembly: X.dll`` is dropped
+    - ``whitespace``:    removed and added lines are equal once all
+      whitespace is dropped (blank lines included)
+    - ``frontmatter``:   the block lies inside the frontmatter and adds or
+      removes no ``---`` — the hunk shows the opening ``---`` on line 1
+      above it, or the closing ``---`` below it with only ``key: value``
+      and list lines from the hunk start down to that fence, or it starts
+      on line 2 (below the opening fence of a generated page) with only
+      such lines down to the block
+
+    Args:
+        patch: Unified diff of one file, as in get_pr_files()
+        kinds: Trivial kinds to recognise
+
+    Returns:
+        The most significant kind any block needed, or None when a block
+        matches none of ``kinds`` or there is no patch (binary, too large)
+    """
+    if not patch:
+        return None
+    rank = -1
+    for old_start, lines in _hunks(patch):
+        for start, end in _blocks(lines):
+            kind = next(
+                (k for k in TRIVIAL_KINDS if k in kinds and _MATCHERS[k](old_start, lines, start, end)),
+                None,
+            )
+            if kind is None:
+                return None
+            rank = max(rank, TRIVIAL_KINDS.index(kind))
+    return TRIVIAL_KINDS[rank] if rank >= 0 else None
+
+
+# ── Private helpers ───────────────────────────────────────────────────────────
+
+def _hunks(patch: str) -> List[Tuple[int, List[_Line]]]:
+    """Split a unified diff into (old start line, lines) per hunk."""
+    hunks: List[Tuple[int, List[_Line]]] = []
+    for line in patch.split('\n'):
+        match = _HUNK_RE.match(line)
+        if match:
+            hunks.append((int(match.group(1)), []))
+        elif hunks and line[:1] in (' ', '-', '+'):
+            hunks[-1][1].append((line[0], line[1:].rstrip('\r')))
+        elif hunks and line == '':
+            hunks[-1][1].append((' ', ''))  # context blank line without its leading space
+    return hunks
+
+
+def _blocks(lines: List[_Line]) -> List[Tuple[int, int]]:
+    """[start, end) index ranges of the runs of changed lines in a hunk."""
+    blocks: List[Tuple[int, int]] = []
+    start = None
+    for index, (tag, _) in enumerate(lines + [(' ', '')]):
+        if tag != ' ' and start is None:
+            start = index
+        elif tag == ' ' and start is not None:
+            blocks.append((start, index))
+            start = None
+    return blocks
+
+
+def _sides(lines: List[_Line], start: int, end: int) -> Tuple[List[str], List[str]]:
+    block = lines[start:end]
+    return [t for tag, t in block if tag == '-'], [t for tag, t in block if tag == '+']
+
+
+def _is_version_stamp(old_start: int, lines: List[_Line], start: int, end: int) -> bool:
+    removed, added = _sides(lines, start, end)
+    return [_STAMP_RE.sub(r'\1', t) for t in removed] == [_STAMP_RE.sub(r'\1', t) for t in added]
+
+
+def _is_whitespace(old_start: int, lines: List[_Line], start: int, end: int) -> bool:
+    removed, added = _sides(lines, start, end)
+    return ''.join(''.join(removed).split()) == ''.join(''.join(added).split())
+
+
+def _is_fence(text: str) -> bool:
+    return text.strip() == '---'
+
+
+def _is_frontmatter(old_start: int, lines: List[_Line], start: int, end: int) -> bool:
+    if any(_is_fence(t) for _, t in lines[start:end]):
+        return False
+    # Opening fence shown on line 1, no fence between it and the block
+    if old_start == 1 and lines and lines[0] == (' ', '---'):
+        return not any(_is_fence(t) for _, t in lines[1:start])
+    # Closing fence shown below the block, frontmatter-shaped lines above it
+    for index in range(end, len(lines)):
+        tag, text = lines[index]
+        if _is_fence(text):
+            return tag == ' ' and all(_YAML_LINE_RE.match(t) for _, t in lines[:index])
+    # Hunk right below the opening fence, frontmatter-shaped down to the block
+    return old_start == 2 and all(_YAML_LINE_RE.match(t) for _, t in lines[:end])
+
+
+_MATCHERS = {
+    'version_stamp': _is_version_stamp,
+    'whitespace':    _is_whitespace,
+    'frontmatter':   _is_frontmatter,
+}
@@ -1,14 +1,22 @@
 """AI-powered content evaluation for PR review."""
 
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.ai.client import AIClient
+from src.ai.client import AIClient, AsyncAIClient
 from src.config.loader import load_prompt
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Characters kept of an article sent for evaluation (~4000 chars ≈ 1000 tokens)
+_MAX_CHARS = 4000
+
+# Rough prompt-size estimate used to pack batches, and the per-document
+# overhead of the <document> wrapper
+_CHARS_PER_TOKEN = 4
+_DOCUMENT_OVERHEAD_TOKENS = 30
+
 # Fallback result when AI evaluation is unavailable
 _FALLBACK_RESULT: Dict[str, Any] = {
     'score': 0,
@@ -47,36 +55,293 @@ def evaluate_content(
         actionability, uniqueness, summary, strengths, issues, recommendation
         Plus 'weighted_contribution' (int) ready to add to the static score.
     """
+    prompt = _build_prompt(content, prompt_path, checklist_config)
+    if prompt is None:
+        return _fallback_result()
+
+    temperature = checklist_config.get('ai_evaluation', {}).get('temperature', 0.2)
+    try:
+        raw = ai_client.complete_json(prompt, temperature=temperature)
+    except Exception as e:
+        logger.error(f"AI evaluation failed: {e}")
+        return _fallback_result()
+
+    return _score_ai_result(raw, checklist_config)
+
+
+async def evaluate_content_async(
+    content: str,
+    ai_client: AsyncAIClient,
+    prompt_path: str,
+    checklist_config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Asyncio counterpart of evaluate_content() for the --async engine.
+
+    Same arguments and return shape; ``ai_client`` is an AsyncAIClient.
+    """
+    prompt = _build_prompt(content, prompt_path, checklist_config)
+    if prompt is None:
+        return _fallback_result()
+
+    temperature = checklist_config.get('ai_evaluation', {}).get('temperature', 0.2)
+    try:
+        raw = await ai_client.complete_json(prompt, temperature=temperature)
+    except Exception as e:
+        logger.error(f"AI evaluation failed: {e}")
+        return _fallback_result()
+
+    return _score_ai_result(raw, checklist_config)
+
+
+def _build_prompt(
+    content: str,
+    prompt_path: str,
+    checklist_config: Dict[str, Any],
+) -> Optional[str]:
+    """
+    Render the review prompt for one article.
+
+    Returns None when AI evaluation is disabled or the prompt template is
+    missing; callers then use the fallback result.
+    """
     ai_cfg = checklist_config.get('ai_evaluation', {})
     if not ai_cfg.get('enabled', True):
         logger.info("AI evaluation is disabled in checklist config")
-        result = dict(_FALLBACK_RESULT)
-        result['weighted_contribution'] = 0
-        return result
-
-    weight = ai_cfg.get('weight', 20)
-    temperature = ai_cfg.get('temperature', 0.2)
-
-    # Truncate very long articles to avoid token limits (~4000 chars ≈ 1000 tokens)
-    truncated = content[:4000] + '\n...[truncated]' if len(content) > 4000 else content
+        return None
 
     try:
         prompt_template = load_prompt(prompt_path)
     except FileNotFoundError as e:
         logger.error(f"Review prompt not found: {e}")
-        result = dict(_FALLBACK_RESULT)
-        result['weighted_contribution'] = 0
-        return result
+        return None
+
+    return prompt_template.format(content=_truncate(content))
+
+
+def _truncate(content: str) -> str:
+    """Truncate very long articles to avoid token limits."""
+    return content[:_MAX_CHARS] + '\n...[truncated]' if len(content) > _MAX_CHARS else content
+
+
+# ── Batched evaluation ────────────────────────────────────────────────────────
+
+def plan_batches(
+    documents: List[Tuple[str, str]],
+    max_tokens: int,
+    max_files: int,
+) -> List[List[Tuple[str, str]]]:
+    """
+    Pack (path, content) documents, in order, into consecutive groups that
+    each fit one request: at most ``max_files`` documents whose estimated
+    tokens (of the truncated content) sum to at most ``max_tokens``.  A
+    document over the budget on its own gets a group of its own.
+
+    Returns:
+        The groups; concatenated, they are ``documents`` in order
+    """
+    groups: List[List[Tuple[str, str]]] = []
+    group: List[Tuple[str, str]] = []
+    group_tokens = 0
+    for document in documents:
+        tokens = _estimate_tokens(document[1])
+        if group and (len(group) >= max_files or group_tokens + tokens > max_tokens):
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(document)
+        group_tokens += tokens
+    if group:
+        groups.append(group)
+    return groups
+
+
+def evaluate_batch(
+    documents: List[Tuple[str, str]],
+    ai_client: AIClient,
+    prompt_path: str,
+    batch_prompt_path: str,
+    checklist_config: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate several articles with one request, so the instructions are sent
+    once instead of once per file.
+
+    The batch prompt asks for one result per document, keyed by path; each
+    goes through the same normalisation and weighting as evaluate_content().
+    Files the response leaves out — or all of them, if the request fails or
+    the response is malformed — are evaluated individually.  A single
+    document is evaluated with the single-file prompt directly.
+
+    Args:
+        documents:         (path, full Markdown content) of each file
+        ai_client:         Initialised AIClient instance
+        prompt_path:       Single-file prompt template (retries)
+        batch_prompt_path: Batch prompt template (``{count}``, ``{documents}``)
+        checklist_config:  Parsed checklist dict (for ai_evaluation settings)
+
+    Returns:
+        One evaluate_content() result per document, in ``documents`` order
+    """
+    found: Dict[str, Dict[str, Any]] = {}
+    prompt = _build_batch_prompt(documents, batch_prompt_path, checklist_config) if len(documents) > 1 else None
+    if prompt is not None:
+        temperature = checklist_config.get('ai_evaluation', {}).get('temperature', 0.2)
+        try:
+            raw = ai_client.complete_json(prompt, temperature=temperature)
+            found = _split_batch_result(raw, documents, checklist_config)
+        except Exception as e:
+            logger.error(f"Batched AI evaluation of {len(documents)} files failed: {e}")
+    return [
+        found[path] if path in found
+        else evaluate_content(content, ai_client, prompt_path, checklist_config)
+        for path, content in documents
+    ]
+
+
+async def evaluate_batch_async(
+    documents: List[Tuple[str, str]],
+    ai_client: AsyncAIClient,
+    prompt_path: str,
+    batch_prompt_path: str,
+    checklist_config: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Asyncio counterpart of evaluate_batch() for the --async engine.
 
-    prompt = prompt_template.format(content=truncated)
+    Same arguments and return shape; ``ai_client`` is an AsyncAIClient.
+    Individual retries run one after another, inside the caller's AI slot.
+    """
+    found: Dict[str, Dict[str, Any]] = {}
+    prompt = _build_batch_prompt(documents, batch_prompt_path, checklist_config) if len(documents) > 1 else None
+    if prompt is not None:
+        temperature = checklist_config.get('ai_evaluation', {}).get('temperature', 0.2)
+        try:
+            raw = await ai_client.complete_json(prompt, temperature=temperature)
+            found = _split_batch_result(raw, documents, checklist_config)
+        except Exception as e:
+            logger.error(f"Batched AI evaluation of {len(documents)} files failed: {e}")
+    results = []
+    for path, content in documents:
+        if path not in found:
+            found[path] = await evaluate_content_async(content, ai_client, prompt_path, checklist_config)
+        results.append(found[path])
+    return results
+
+
+def _estimate_tokens(content: str) -> int:
+    return len(_truncate(content)) // _CHARS_PER_TOKEN + _DOCUMENT_OVERHEAD_TOKENS
 
+
+def _build_batch_prompt(
+    documents: List[Tuple[str, str]],
+    batch_prompt_path: str,
+    checklist_config: Dict[str, Any],
+) -> Optional[str]:
+    """
+    Render the batch prompt, each article truncated and wrapped in a
+    ``<document path="...">`` element.
+
+    Returns None when AI evaluation is disabled or the batch template is
+    missing; the documents are then evaluated one by one.
+    """
+    if not checklist_config.get('ai_evaluation', {}).get('enabled', True):
+        return None
     try:
-        raw = ai_client.complete_json(prompt, temperature=temperature)
-    except Exception as e:
-        logger.error(f"AI evaluation failed: {e}")
-        result = dict(_FALLBACK_RESULT)
-        result['weighted_contribution'] = 0
-        return result
+        prompt_template = load_prompt(batch_prompt_path)
+    except FileNotFoundError as e:
+        logger.error(f"Batch review prompt not found: {e}")
+        return None
+
+    wrapped = '\n\n'.join(
+        f'<document path="{path}">\n{_truncate(content)}\n</document>' for path, content in documents
+    )
+    return prompt_template.format(count=len(documents), documents=wrapped)
+
+
+def _split_batch_result(
+    raw: Any,
+    documents: List[Tuple[str, str]],
+    checklist_config: Dict[str, Any],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Scored results of a batch response, by path.
+
+    Accepts ``{"results": [...]}`` or a bare array.  Elements for paths not
+    in the batch, repeated paths and elements without a score are dropped,
+    so those files count as missing.
+    """
+    items = raw.get('results') if isinstance(raw, dict) else raw
+    if not isinstance(items, list):
+        logger.warning(f"Batched AI response has no result array — retrying {len(documents)} file(s) individually")
+        return {}
+
+    wanted = {path for path, _ in documents}
+    found: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if not isinstance(item, dict) or 'score' not in item:
+            continue
+        path = item.get('path')
+        if path in wanted and path not in found:
+            found[path] = _score_ai_result(item, checklist_config)
+    if len(found) < len(wanted):
+        logger.warning(
+            f"Batched AI response covered {len(found)}/{len(wanted)} file(s) — "
+            f"retrying {len(wanted) - len(found)} individually"
+        )
+    return found
+
+
+def _fallback_result() -> Dict[str, Any]:
+    """Result used whenever AI evaluation is disabled or fails."""
+    result = dict(_FALLBACK_RESULT)
+    result['weighted_contribution'] = 0
+    return result
+
+
+def skipped_result(reason: str) -> Dict[str, Any]:
+    """
+    Result recorded for a file whose AI evaluation was skipped on purpose
+    (no LLM call): zero contribution, no issues, ``skipped`` set.
+
+    Args:
+        reason: Why the call was skipped; shown in the review comment
+    """
+    result = _fallback_result()
+    result.update(summary=reason, issues=[], skipped=True)
+    return result
+
+
+def disabled_result() -> Dict[str, Any]:
+    """
+    The result evaluate_content() returns for any file while
+    ai_evaluation is disabled; lets callers skip fetching the content.
+    """
+    return _fallback_result()
+
+
+def estimated_result(score: float, weighted_contribution: float) -> Dict[str, Any]:
+    """
+    Result for a file left out of the AI sample: its stratum's mean score and
+    contribution, no issues, ``estimated`` set.
+
+    Args:
+        score:                 Mean AI score (0-100) of the sampled files in the stratum
+        weighted_contribution: Mean weighted contribution of those files
+    """
+    result = _fallback_result()
+    result.update(
+        score=round(score),
+        weighted_contribution=weighted_contribution,
+        summary='AI score estimated from a stratified sample.',
+        issues=[],
+        estimated=True,
+    )
+    return result
+
+
+def _score_ai_result(raw: Dict[str, Any], checklist_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalise a raw AI response and add its weighted score contribution."""
+    weight = checklist_config.get('ai_evaluation', {}).get('weight', 20)
 
     # Validate and normalise the response
     result = _normalise_ai_result(raw)
@@ -0,0 +1,209 @@
+"""
+PR-wide resolution of internal links against an index of page URLs.
+
+The link-format checks only look at a link's syntax, so a link to a page
+that does not exist passes them.  A LinkIndex holds every URL a reference
+family serves — the target repo's tree under
+``<content_root>/<family>/<language>/`` at the PR's base, plus the pages the
+PR adds, minus those it removes — so each link is resolved with one set
+lookup and no API call:
+
+    index = LinkIndex()
+    index.add_tree('words', tree_paths)     # paths relative to the family dir
+    index.add_pr_files(pr_files)            # get_pr_files() output
+    index.unresolved(content, path)         # (1, [{'line': 12, 'link': '/words/x/'}])
+
+URLs follow the site's layout: ``<family>/<language>/Aspose.Words.Document.md``
+is served at ``/words/aspose.words.document/``, an ``_index.md`` at its
+directory, and any other file at its lower-cased path.
+"""
+
+import posixpath
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+# [text](target) or [text](target "title"); link text holds no '[', so a
+# line of unbalanced brackets is scanned in linear time
+_LINK_RE = re.compile(r'\[[^\[\]\n]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"\n]*")?\s*\)')
+_FENCE_RE = re.compile(r'^\s*(```|~~~)')
+# Absolute URL (scheme: or //host) — never internal
+_EXTERNAL_RE = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//)', re.IGNORECASE)
+
+# Checklist id of the check this index decides (see checklist.PR_WIDE_CHECKS)
+LINK_CHECK_ID = 'internal_links_resolve'
+
+# Unresolved links kept per file; the count is exact regardless
+MAX_LINKS_PER_FILE = 20
+
+
+class LinkIndex:
+    """
+    URLs served by the reference families a PR touches.
+
+    The tree of each family (shared by every PR against the same base) is
+    kept as given; the PR's own additions and removals sit on top of it,
+    so building a PR's index never copies a tree.
+    """
+
+    def __init__(self, content_root: str = 'content/reference.aspose.net', language: str = 'en'):
+        """
+        Args:
+            content_root: Repository directory holding one folder per family
+            language:     Language folder under each family (its URLs carry no prefix)
+        """
+        self.content_root = content_root.strip('/')
+        self.language = language
+        self._trees: Dict[str, FrozenSet[str]] = {}
+        self._added: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    # ── Building ──────────────────────────────────────────────────────────────
+
+    def family_dir(self, family: str) -> str:
+        """Repository directory of a family's pages, e.g. content/reference.aspose.net/words/en."""
+        return f"{self.content_root}/{family}/{self.language}"
+
+    def locate(self, path: str) -> Optional[Tuple[str, str]]:
+        """(family, path relative to the family dir) of a repository path, or None outside it."""
+        prefix = self.content_root + '/'
+        if not path.startswith(prefix):
+            return None
+        family, _, rest = path[len(prefix):].partition('/')
+        language, _, relative = rest.partition('/')
+        if not family or language != self.language or not relative:
+            return None
+        return family, relative
+
+    def families(self, pr_files: Iterable[Dict[str, Any]]) -> List[str]:
+        """Families with a file in the PR, in first-seen order."""
+        seen: Dict[str, None] = {}
+        for f in pr_files:
+            located = self.locate(f['path'])
+            if located:
+                seen.setdefault(located[0], None)
+        return list(seen)
+
+    def add_tree(self, family: str, urls: FrozenSet[str]) -> None:
+        """Index a family's tree, as tree_urls() of it."""
+        self._trees[family] = urls
+
+    def add_pr_files(self, pr_files: Iterable[Dict[str, Any]]) -> None:
+        """Overlay the PR: pages it adds or modifies exist, pages it removes do not."""
+        for f in pr_files:
+            located = self.locate(f['path'])
+            if located is None:
+                continue
+            url = page_url(*located)
+            if f.get('status') == 'removed':
+                self._removed.add(url)
+                self._added.discard(url)
+            else:
+                self._added.add(url)
+                self._removed.discard(url)
+
+    # ── Lookup ────────────────────────────────────────────────────────────────
+
+    def __contains__(self, url: str) -> bool:
+        if url in self._added:
+            return True
+        if url in self._removed:
+            return False
+        family = url[1:].partition('/')[0]
+        return url in self._trees.get(family, ())
+
+    def resolve(self, link: str, source_path: str) -> Optional[bool]:
+        """
+        Whether an internal link points at an indexed page.
+
+        Args:
+            link:        Link target as written, e.g. ``/words/aspose.words/``,
+                         ``../aspose.words.document/`` or ``Document.md#ctor``
+            source_path: Repository path of the file holding the link
+
+        Returns:
+            True or False, or None when the link is out of scope: external,
+            an anchor or shortcode, or into a family without an indexed tree
+        """
+        url = self._target_url(link, source_path)
+        if url is None or url[1:].partition('/')[0] not in self._trees:
+            return None
+        if url in self:
+            return True
+        # Pages are served with a trailing slash, other files without
+        return url.rstrip('/') + '/' in self if not url.endswith('/') else url.rstrip('/') in self
+
+    def unresolved(self, content: str, source_path: str) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Internal links of a file that resolve to no indexed page.  Links in
+        fenced code blocks are ignored.
+
+        Returns:
+            Tuple of (number of unresolved links, the first MAX_LINKS_PER_FILE
+            of them as {'line' (1-based, in the whole file), 'link'})
+        """
+        count = 0
+        found: List[Dict[str, Any]] = []
+        in_code = False
+        for number, line in enumerate(content.split('\n'), 1):
+            if _FENCE_RE.match(line):
+                in_code = not in_code
+                continue
+            if in_code or '](' not in line:
+                continue
+            for link in _LINK_RE.findall(line):
+                if self.resolve(link, source_path) is False:
+                    count += 1
+                    if len(found) < MAX_LINKS_PER_FILE:
+                        found.append({'line': number, 'link': link})
+        return count, found
+
+    def _target_url(self, link: str, source_path: str) -> Optional[str]:
+        """Site URL a link points at (lower-cased, normalised), or None if out of scope."""
+        if not link or link.startswith('#') or '{{' in link or _EXTERNAL_RE.match(link):
+            return None
+        target = unquote(link.split('#', 1)[0].split('?', 1)[0]).lower()
+        if not target:
+            return None
+        if target.startswith('/'):
+            base = '/'
+        else:
+            located = self.locate(source_path)
+            if located is None:
+                return None  # relative to a page outside the index
+            family, relative = located
+            if target.endswith('.md'):
+                # A file link: relative to the linking file's directory
+                base = '/' + posixpath.join(family, posixpath.dirname(relative).lower()) + '/'
+            else:
+                base = page_url(family, relative)
+        if target.endswith('.md'):
+            parent, name = posixpath.split(target[:-3])
+            target = (parent.rstrip('/') or '.') + '/' if name == '_index' else target[:-3] + '/'
+        url = posixpath.normpath(posixpath.join(base, target))
+        return url + '/' if target.endswith('/') and url != '/' else url
+
+
+def page_url(family: str, relative: str) -> str:
+    """
+    URL a file of a family is served at.
+
+    Args:
+        family:   Family folder, e.g. ``words``
+        relative: Path relative to the family's language dir
+
+    Returns:
+        ``/words/aspose.words.document/`` for a page (``_index.md`` maps to
+        its directory), ``/words/images/x.png`` for any other file
+    """
+    relative = relative.lower()
+    if not relative.endswith('.md'):
+        return f"/{family}/{relative}"
+    parent, name = posixpath.split(relative[:-3])
+    path = parent if name == '_index' else relative[:-3]
+    return f"/{family}/{path}/" if path else f"/{family}/"
+
+
+def tree_urls(family: str, paths: Iterable[str]) -> FrozenSet[str]:
+    """URLs served by a family's tree (blob paths relative to its language dir)."""
+    return frozenset(page_url(family, path) for path in paths)
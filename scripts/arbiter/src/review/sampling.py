@@ -0,0 +1,233 @@
+"""
+Stratified sampling of files for AI evaluation of very large PRs.
+
+A DocFX regeneration PR can touch thousands of pages.  Static checks still
+run on every file, but only a stratified sample is sent to the LLM: files
+are grouped by page type (from the ``layout``/``categories`` frontmatter)
+and diff size, the sample size comes from a confidence target, and every
+stratum gets its proportional share.  Files outside the sample are scored
+with their stratum's mean, which makes the plain per-file average the
+stratified estimate.  The confidence interval on that estimate is reported
+in the review comment.
+"""
+
+import hashlib
+import math
+import re
+from statistics import NormalDist, mean
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.review.checklist import ParsedDocument, parse_document
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# DocFX `categories` value → page type
+_PAGE_TYPES = {
+    'namespace':   'namespace',
+    'class':       'type',
+    'struct':      'type',
+    'interface':   'type',
+    'enum':        'type',
+    'delegate':    'type',
+    'method':      'member',
+    'constructor': 'member',
+    'property':    'member',
+    'field':       'member',
+    'event':       'member',
+    'operator':    'member',
+}
+
+_LAYOUT_RE = re.compile(r'^\s*layout\s*:\s*["\']?([\w-]+)', re.MULTILINE)
+_CATEGORY_RE = re.compile(r'^\s*categories\s*:\s*(?:\[\s*["\']?(\w+)|\n\s*-\s*["\']?(\w+))', re.MULTILINE)
+
+
+# ── Strata ────────────────────────────────────────────────────────────────────
+
+def page_type(content: Union[str, ParsedDocument]) -> str:
+    """
+    Classify an API reference page: 'home' | 'namespace' | 'type' | 'member' | 'other'.
+
+    Args:
+        content: Full Markdown file text, or a ParsedDocument of it
+    """
+    fm = parse_document(content).frontmatter
+    if fm is None:
+        return 'other'
+
+    layout = _LAYOUT_RE.search(fm)
+    if layout and layout.group(1) == 'reference-home':
+        return 'home'
+
+    category = _CATEGORY_RE.search(fm)
+    if category:
+        return _PAGE_TYPES.get((category.group(1) or category.group(2)).lower(), 'other')
+    return 'other'
+
+
+def stratum_of(
+    content: Union[str, ParsedDocument],
+    file_info: Dict[str, Any],
+    size_buckets: Sequence[int],
+) -> str:
+    """
+    Stratum key for a file: page type and diff-size bucket, e.g. 'member/small'.
+
+    Args:
+        content:      Full Markdown file text, or a ParsedDocument of it
+        file_info:    File dict from get_pr_files() (additions / deletions)
+        size_buckets: Upper bounds of changed lines for the 'small' and
+                      'medium' buckets; larger diffs are 'large'
+    """
+    return stratum_key(page_type(content), file_info, size_buckets)
+
+
+def stratum_key(page: str, file_info: Dict[str, Any], size_buckets: Sequence[int]) -> str:
+    """stratum_of() for a file whose page type is already known (e.g. cached)."""
+    changed = file_info.get('additions', 0) + file_info.get('deletions', 0)
+    names = ('small', 'medium')
+    size = 'large'
+    for index, bound in enumerate(size_buckets[:len(names)]):
+        if changed <= bound:
+            size = names[index]
+            break
+    return f"{page}/{size}"
+
+
+# ── Sample planning ───────────────────────────────────────────────────────────
+
+def sample_size(population: int, confidence: float, margin: float, stddev: float) -> int:
+    """
+    Files needed to estimate the mean AI score within ±margin points.
+
+    n0 = (z·σ / margin)², reduced by the finite population correction.
+
+    Args:
+        population: Files eligible for AI evaluation
+        confidence: Confidence level, e.g. 0.95
+        margin:     Target half-width of the interval, in AI score points (0-100)
+        stddev:     Assumed per-file AI score standard deviation
+
+    Returns:
+        Sample size between 1 and population
+    """
+    if population <= 0:
+        return 0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    n0 = (z * stddev / margin) ** 2
+    n = n0 / (1 + (n0 - 1) / population)
+    return max(1, min(population, math.ceil(n)))
+
+
+def plan_sample(
+    items: List[Dict[str, Any]],
+    target: int,
+    min_per_stratum: int,
+) -> List[bool]:
+    """
+    Choose which items to evaluate, allocating ``target`` proportionally
+    across strata (at least ``min_per_stratum`` each, never more than the
+    stratum holds).  Within a stratum the choice is deterministic — items
+    are ranked by a hash of their path — so re-running picks the same files.
+
+    Args:
+        items:           Dicts with 'path' and 'stratum'
+        target:          Overall sample size
+        min_per_stratum: Floor per stratum
+
+    Returns:
+        One flag per item, True if it is in the sample
+    """
+    strata: Dict[str, List[int]] = {}
+    for index, item in enumerate(items):
+        strata.setdefault(item['stratum'], []).append(index)
+
+    population = len(items)
+    chosen = [False] * population
+    for members in strata.values():
+        share = round(target * len(members) / population) if population else 0
+        take = min(len(members), max(min_per_stratum, share))
+        ranked = sorted(
+            members,
+            key=lambda i: hashlib.sha1(items[i]['path'].encode('utf-8')).hexdigest(),
+        )
+        for index in ranked[:take]:
+            chosen[index] = True
+    return chosen
+
+
+# ── Estimate ──────────────────────────────────────────────────────────────────
+
+def stratum_means(sampled: List[Dict[str, Any]]) -> Dict[str, Tuple[float, float]]:
+    """
+    Mean AI score and weighted contribution per stratum over evaluated results.
+
+    Args:
+        sampled: Results with 'stratum' and an evaluated 'ai_result'
+
+    Returns:
+        {stratum: (mean_score, mean_weighted_contribution)}
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for result in sampled:
+        groups.setdefault(result['stratum'], []).append(result['ai_result'])
+    return {
+        stratum: (
+            mean(r.get('score', 0) for r in ai_results),
+            mean(r.get('weighted_contribution', 0) for r in ai_results),
+        )
+        for stratum, ai_results in groups.items()
+    }
+
+
+def sample_summary(
+    strata: Dict[str, List[float]],
+    confidence: float,
+    stddev: float,
+) -> Optional[Dict[str, Any]]:
+    """
+    Sampling rate and confidence interval for a PR whose AI scores were
+    partly estimated.
+
+    Stratified variance: Σ W_h² (1 − n_h/N_h) s_h² / n_h, with s_h the
+    sample standard deviation of the stratum (``stddev`` when n_h < 2).
+
+    Args:
+        strata:     {stratum: [files, score_sum, sampled, sampled_sum,
+                    sampled_sum_sq]} as kept by ReviewAggregator
+        confidence: Confidence level for the interval
+        stddev:     Fallback per-file standard deviation
+
+    Returns:
+        {'sampled', 'population', 'rate', 'strata', 'mean', 'half_width',
+         'confidence'} or None when no AI score was estimated
+    """
+    population = int(sum(stats[0] for stats in strata.values()))
+    sampled = int(sum(stats[2] for stats in strata.values()))
+    if not population or sampled == population:
+        return None
+
+    estimate = 0.0
+    variance = 0.0
+    for big_n, score_sum, n_h, sampled_sum, sampled_sq in strata.values():
+        weight = big_n / population
+        estimate += weight * score_sum / big_n
+        if n_h == 0:
+            variance += weight ** 2 * stddev ** 2  # stratum left unsampled
+            continue
+        if n_h >= 2:
+            s_h = math.sqrt(max(0.0, (sampled_sq - sampled_sum ** 2 / n_h) / (n_h - 1)))
+        else:
+            s_h = stddev
+        variance += weight ** 2 * (1 - n_h / big_n) * s_h ** 2 / n_h
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return {
+        'sampled': sampled,
+        'population': population,
+        'rate': sampled / population,
+        'strata': len(strata),
+        'mean': estimate,
+        'half_width': z * math.sqrt(variance),
+        'confidence': confidence,
+    }
@@ -0,0 +1,79 @@
+"""
+Deadline-aware PR scheduling.
+
+The workflow job is killed at a hard timeout, and a PR cut off mid-review
+loses all its work.  Given a time budget, these helpers estimate what each
+PR will cost (file count × observed per-file latency + a fixed per-PR
+overhead) and pick the PRs that fit, so the run ends cleanly instead.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def estimate_pr_cost(file_count: int, per_file_s: float, per_pr_overhead_s: float) -> float:
+    """
+    Estimated wall-clock seconds to review one PR.
+
+    Args:
+        file_count:        Number of changed files in the PR
+        per_file_s:        Average seconds per file observed in past reviews
+        per_pr_overhead_s: Fixed cost per PR (file listing, posting, labels)
+
+    Returns:
+        Estimated seconds
+    """
+    return per_pr_overhead_s + max(0, file_count) * per_file_s
+
+
+def plan_within_budget(
+    candidates: List[Dict[str, Any]],
+    budget_s: float,
+    concurrency: int = 1,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Choose and order PRs so their estimated cost fits the time budget.
+
+    PRs deferred by an earlier run go first (oldest deferral first), then the
+    rest in their original order.  PRs are taken greedily in that order; one
+    that does not fit is deferred, but smaller PRs after it may still fit.
+    With ``concurrency`` workers, the budget is spread over that many lanes.
+
+    Args:
+        candidates:  [{'number': int, 'estimate_s': float,
+                       'deferred_at': str | None}, ...] in discovery order
+        budget_s:    Seconds available for reviewing
+        concurrency: PRs reviewed in parallel
+
+    Returns:
+        Tuple of (selected, deferred), each a list of candidate dicts;
+        ``selected`` is in review order.
+    """
+    previously_deferred = sorted(
+        (c for c in candidates if c.get('deferred_at')),
+        key=lambda c: c['deferred_at'],
+    )
+    fresh = [c for c in candidates if not c.get('deferred_at')]
+
+    capacity = budget_s * max(1, concurrency)
+    used = 0.0
+    selected: List[Dict[str, Any]] = []
+    deferred: List[Dict[str, Any]] = []
+
+    for candidate in previously_deferred + fresh:
+        cost = candidate['estimate_s']
+        # A single PR longer than the whole budget would be cut off anyway
+        if cost <= budget_s and used + cost <= capacity:
+            selected.append(candidate)
+            used += cost
+        else:
+            deferred.append(candidate)
+
+    logger.info(
+        f"Schedule: {len(selected)} PR(s) fit the {budget_s:.0f}s budget "
+        f"(~{used / max(1, concurrency):.0f}s estimated), {len(deferred)} deferred"
+    )
+    return selected, deferred
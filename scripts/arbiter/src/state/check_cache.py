@@ -0,0 +1,130 @@
+"""Content-addressed cache of static-check results, stored in SQLite."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+class CheckCache:
+    """
+    Static-check results of file contents already checked, so byte-identical
+    pages — across DocFX regenerations and across open PRs — are not
+    fetched and checked again.
+
+    Schema (table: 'check_results'):
+        checklist     : str   - checklist_fingerprint() of the loaded checklist
+        file_key      : str   - Blob SHA (plus patch hash for diff-aware checklists)
+        static_score  : int   - run_checks() score
+        failed_checks : str   - JSON list of failed check ids
+        skipped_checks: str   - JSON list of checks not evaluated (fast_fail)
+        page_type     : str   - sampling.page_type() of the content
+        used_at       : float - Unix time of the last write or hit
+
+    The table holds at most ``max_entries`` rows; the least recently used
+    are evicted first.  One connection is shared by PR worker threads
+    behind a lock.
+    """
+
+    def __init__(self, db_path: str = "data/check_cache.sqlite", max_entries: int = 50000):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS check_results ("
+                " checklist TEXT NOT NULL, file_key TEXT NOT NULL,"
+                " static_score INTEGER NOT NULL, failed_checks TEXT NOT NULL,"
+                " skipped_checks TEXT NOT NULL, page_type TEXT NOT NULL,"
+                " used_at REAL NOT NULL,"
+                " PRIMARY KEY (checklist, file_key))"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS check_results_used_at ON check_results (used_at)"
+            )
+        logger.info(f"CheckCache initialised at {db_path}")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def get_many(self, checklist: str, file_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached results and mark them as recently used.
+
+        Args:
+            checklist: checklist_fingerprint() of the loaded checklist
+            file_keys: Keys of the files to look up
+
+        Returns:
+            {file_key: {'static_score', 'failed_checks', 'skipped_checks',
+            'page_type'}} for the keys found
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock, self.conn:
+            for start in range(0, len(file_keys), _LOOKUP_CHUNK):
+                chunk = file_keys[start:start + _LOOKUP_CHUNK]
+                marks = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    "SELECT file_key, static_score, failed_checks, skipped_checks, page_type"
+                    f" FROM check_results WHERE checklist = ? AND file_key IN ({marks})",
+                    [checklist, *chunk],
+                ).fetchall()
+                for file_key, score, failed, skipped, page in rows:
+                    found[file_key] = {
+                        'static_score': score,
+                        'failed_checks': json.loads(failed),
+                        'skipped_checks': json.loads(skipped),
+                        'page_type': page,
+                    }
+                if rows:
+                    self.conn.execute(
+                        "UPDATE check_results SET used_at = ? WHERE checklist = ?"
+                        f" AND file_key IN ({','.join('?' * len(rows))})",
+                        [time.time(), checklist, *[row[0] for row in rows]],
+                    )
+        return found
+
+    def put_many(self, checklist: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store results, then evict the least recently used rows over the limit.
+
+        Args:
+            checklist: checklist_fingerprint() of the loaded checklist
+            entries:   {file_key: {'static_score', 'failed_checks',
+                       'skipped_checks', 'page_type'}}
+        """
+        if not entries:
+            return
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO check_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        checklist, file_key, entry['static_score'],
+                        json.dumps(entry['failed_checks']),
+                        json.dumps(entry.get('skipped_checks', [])),
+                        entry['page_type'], now,
+                    )
+                    for file_key, entry in entries.items()
+                ],
+            )
+            excess = self.conn.execute("SELECT COUNT(*) FROM check_results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.conn.execute(
+                    "DELETE FROM check_results WHERE rowid IN"
+                    " (SELECT rowid FROM check_results ORDER BY used_at LIMIT ?)",
+                    (excess,),
+                )
+                logger.debug(f"CheckCache evicted {excess} least recently used entries")
@@ -0,0 +1,239 @@
+"""Per-file results of each PR's latest review and of reviews under way, stored in SQLite."""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+class FileResultStore:
+    """
+    The outcome of every file of each PR's latest review: incremental
+    re-review reuses it for unchanged files, and the results of approved
+    reviews are the known-good verdicts trivial diffs take.
+
+    Schema (table: 'file_results'):
+        repo_url   : str - Repository URL
+        pr_number  : int - PR number
+        path       : str - File path
+        approved   : int - 1 if the review approved the PR
+        reviewed_at: str - ISO timestamp of the review
+        record     : str - JSON {'sha', 'checklist', 'stratum', 'static_score',
+                           'failed_checks', 'ai_result'} (PRArbitrAgent._file_record())
+
+    'checklist' is the checklist_fingerprint() the file was checked under;
+    results under another checklist are re-checked, not reused.
+
+    A PR's rows are replaced as a whole by each review.  Rows of PRs that are
+    no longer open are pruned, except each path's latest approved verdict, so
+    the table grows with the open PRs and the pages of the repository rather
+    than with review history.  Known-good lookups use the (repo_url, path)
+    index.
+
+    Table 'checkpoints' holds the progress of a review still under way, one
+    row per file, so a crashed or timed-out run can resume at the same head:
+        repo_url, pr_number, path, head_sha,
+        record: JSON file result as above, 'ai_result' only once evaluated
+
+    Each checkpoint write upserts only the files completed since the last
+    one, so checkpointing a PR costs time linear in its file count.
+
+    One connection is shared by PR worker threads behind a lock.
+    """
+
+    def __init__(self, db_path: str = "data/file_results.sqlite"):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS file_results ("
+                " repo_url TEXT NOT NULL, pr_number INTEGER NOT NULL, path TEXT NOT NULL,"
+                " approved INTEGER NOT NULL, reviewed_at TEXT NOT NULL, record TEXT NOT NULL,"
+                " PRIMARY KEY (repo_url, pr_number, path))"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS file_results_path ON file_results (repo_url, path)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                " repo_url TEXT NOT NULL, pr_number INTEGER NOT NULL, path TEXT NOT NULL,"
+                " head_sha TEXT NOT NULL, record TEXT NOT NULL,"
+                " PRIMARY KEY (repo_url, pr_number, path))"
+            )
+        logger.info(f"FileResultStore initialised at {db_path}")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def get(self, repo_url: str, pr_number: int) -> Dict[str, Dict]:
+        """
+        Return the per-file results stored with a PR's latest review.
+
+        Returns:
+            {path: {'sha', 'checklist', 'stratum', 'static_score', 'failed_checks',
+            'ai_result'}}, empty if none were stored
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT path, record FROM file_results WHERE repo_url = ? AND pr_number = ?",
+                (repo_url, pr_number),
+            ).fetchall()
+        return {path: json.loads(record) for path, record in rows}
+
+    def save(
+        self,
+        repo_url: str,
+        pr_number: int,
+        files: Dict[str, Dict],
+        approved: bool,
+    ) -> None:
+        """
+        Replace the per-file results stored for a PR.
+
+        Args:
+            repo_url:  Repository URL
+            pr_number: PR number
+            files:     {path: file result} for every file of the latest review
+            approved:  Whether the review approved the PR (known-good verdicts)
+        """
+        reviewed_at = datetime.now().isoformat()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM file_results WHERE repo_url = ? AND pr_number = ?",
+                (repo_url, pr_number),
+            )
+            self.conn.executemany(
+                "INSERT INTO file_results VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (repo_url, pr_number, path, int(approved), reviewed_at, json.dumps(record))
+                    for path, record in files.items()
+                ],
+            )
+
+    def get_known_good(
+        self,
+        repo_url: str,
+        paths: List[str],
+        exclude_pr: Optional[int] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Return each path's result from the latest approved review that
+        stored one — the last verdict the repository accepted for the page.
+
+        Args:
+            repo_url:   Repository URL
+            paths:      Paths to look up
+            exclude_pr: PR whose own results are skipped (the one under review)
+
+        Returns:
+            {path: file result} as in get() for the paths found
+        """
+        found: Dict[str, Dict] = {}
+        with self._lock:
+            for start in range(0, len(paths), _LOOKUP_CHUNK):
+                chunk = paths[start:start + _LOOKUP_CHUNK]
+                rows = self.conn.execute(
+                    "SELECT path, record FROM file_results"
+                    " WHERE repo_url = ? AND approved = 1 AND pr_number IS NOT ?"
+                    f" AND path IN ({','.join('?' * len(chunk))})"
+                    " ORDER BY reviewed_at",
+                    [repo_url, exclude_pr, *chunk],
+                ).fetchall()
+                # Oldest first, so each path ends up with its latest verdict
+                for path, record in rows:
+                    found[path] = json.loads(record)
+        return found
+
+    def prune(self, repo_url: str, open_numbers: List[int]) -> int:
+        """
+        Drop the results of PRs merged or closed since their review, keeping
+        each path's latest approved verdict for trivial-diff reuse.
+
+        Args:
+            repo_url:     Repository URL
+            open_numbers: Numbers of all of the repository's open PRs
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM file_results"
+                " WHERE repo_url = ?"
+                " AND pr_number NOT IN (SELECT value FROM json_each(?))"
+                " AND (approved = 0 OR EXISTS ("
+                "  SELECT 1 FROM file_results AS newer"
+                "  WHERE newer.repo_url = file_results.repo_url"
+                "  AND newer.path = file_results.path AND newer.approved = 1"
+                "  AND newer.reviewed_at > file_results.reviewed_at))",
+                (repo_url, json.dumps(list(open_numbers))),
+            )
+        return cursor.rowcount
+
+    # ── Checkpoints ───────────────────────────────────────────────────────────
+
+    def get_checkpoint(self, repo_url: str, pr_number: int, head_sha: str) -> Dict[str, Dict]:
+        """
+        Return the per-file progress checkpointed for a PR at ``head_sha``.
+
+        Returns:
+            {path: file result} as in get() ('ai_result' only for files already
+            evaluated); empty if there is no checkpoint or it was taken at
+            another head
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT path, record FROM checkpoints"
+                " WHERE repo_url = ? AND pr_number = ? AND head_sha = ?",
+                (repo_url, pr_number, head_sha),
+            ).fetchall()
+        return {path: json.loads(record) for path, record in rows}
+
+    def save_checkpoint(
+        self,
+        repo_url: str,
+        pr_number: int,
+        head_sha: str,
+        files: Dict[str, Dict],
+    ) -> None:
+        """
+        Merge per-file progress into a PR's checkpoint.  A checkpoint taken
+        at another head is replaced.
+
+        Args:
+            repo_url:  Repository URL
+            pr_number: PR number
+            head_sha:  PR head commit under review
+            files:     {path: file result} completed since the last checkpoint
+        """
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM checkpoints WHERE repo_url = ? AND pr_number = ? AND head_sha != ?",
+                (repo_url, pr_number, head_sha),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?)",
+                [
+                    (repo_url, pr_number, path, head_sha, json.dumps(record))
+                    for path, record in files.items()
+                ],
+            )
+
+    def clear_checkpoint(self, repo_url: str, pr_number: int) -> None:
+        """Remove a PR's checkpoint once its review has been persisted."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM checkpoints WHERE repo_url = ? AND pr_number = ?",
+                (repo_url, pr_number),
+            )
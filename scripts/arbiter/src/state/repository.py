@@ -1,8 +1,9 @@
 """State persistence for reviewed PRs using TinyDB."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from tinydb import Query, TinyDB
 from src.utils.logger import setup_logger
@@ -23,16 +24,40 @@ class StateRepository:
         reviewed_at : str   - ISO timestamp of when the review was posted
         pr_updated_at: str  - PR updated_at timestamp at time of review
                               (used to detect if PR changed since last review)
+        duration_s  : float - Wall-clock seconds the review took (optional)
+        files       : int   - Files evaluated in the review (optional)
+        checked_files: int  - Of those, files checked or AI-evaluated in
+                              this review rather than reused (optional)
+        head_sha    : str   - PR head commit reviewed (optional; drives
+                              incremental re-review)
+        check_matrix: dict  - The review's static check outcomes as
+                              CheckMatrix.pack(), rows in file order
+                              (optional; re-aggregates without re-checking)
+
+    Per-file results of each PR's latest review and the checkpoints of
+    reviews under way live in FileResultStore (SQLite); the 'file_results'
+    and 'checkpoints' tables earlier versions kept here are dropped on open.
+
+    Table 'deferred' holds PRs a deadline-limited run could not fit:
+        repo_url, pr_number, estimate_s, deferred_at (ISO timestamp)
+
+    TinyDB is not thread-safe, so every read and write goes through one
+    re-entrant lock; PR worker threads can share a single repository.
     """
 
     def __init__(self, db_path: str = "data/state.json"):
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.db = TinyDB(db_path)
         self.reviews = self.db.table('reviews')
+        self.deferred = self.db.table('deferred')
+        self.db.drop_table('file_results')
+        self.db.drop_table('checkpoints')
+        self._lock = threading.RLock()
         logger.info(f"StateRepository initialised at {db_path}")
 
     def close(self) -> None:
-        self.db.close()
+        with self._lock:
+            self.db.close()
 
     # ── Read ──────────────────────────────────────────────────────────────────
 
@@ -48,9 +73,10 @@ class StateRepository:
             Review record dict or None
         """
         Q = Query()
-        return self.reviews.get(
-            (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
-        )
+        with self._lock:
+            return self.reviews.get(
+                (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
+            )
 
     def was_reviewed(self, repo_url: str, pr_number: int) -> bool:
         """Return True if this PR has already been reviewed."""
@@ -60,7 +86,8 @@ class StateRepository:
         self,
         repo_url: str,
         pr_number: int,
-        pr_updated_at: str,
+        pr_updated_at: Optional[str] = None,
+        head_sha: Optional[str] = None,
     ) -> bool:
         """
         Return True when the PR was reviewed before but has since been updated.
@@ -69,18 +96,26 @@ class StateRepository:
             repo_url:       Repository URL
             pr_number:      PR number
             pr_updated_at:  Current PR updated_at ISO timestamp from GitHub
+            head_sha:       Current PR head commit SHA.  When given, only new
+                            commits count as an update — label, comment and
+                            review activity (including the arbiter's own)
+                            also bump updated_at.
 
         Returns:
-            True if the PR's updated_at changed since the last review
+            True if the PR's head SHA (or updated_at) changed since the last review
         """
         record = self.get_review(repo_url, pr_number)
         if not record:
             return False  # Never reviewed → not a *re*-review
+        if head_sha is not None:
+            # Records saved before head SHAs were stored are left alone
+            return record.get('head_sha') not in (None, head_sha)
         return record.get('pr_updated_at') != pr_updated_at
 
     def get_all_reviews(self) -> List[Dict]:
         """Return all stored review records."""
-        return self.reviews.all()
+        with self._lock:
+            return self.reviews.all()
 
     def get_reviews_since(self, since_iso: str) -> List[Dict]:
         """
@@ -93,10 +128,48 @@ class StateRepository:
             List of matching review records
         """
         return [
-            r for r in self.reviews.all()
+            r for r in self.get_all_reviews()
             if r.get('reviewed_at', '') >= since_iso
         ]
 
+    def per_file_latency(self, default: float, window: int = 50) -> float:
+        """
+        Average seconds per checked or AI-evaluated file over the most recent
+        reviews.  Files reused from an earlier review, the check cache or a
+        known-good trivial diff cost next to nothing, so they are left out.
+
+        Args:
+            default: Value returned when no timed reviews exist yet
+            window:  Number of most recent timed reviews to average over
+
+        Returns:
+            Seconds per file
+        """
+        timed = [
+            r for r in self.get_all_reviews()
+            if r.get('duration_s') and self._worked_files(r)
+        ]
+        timed.sort(key=lambda r: r.get('reviewed_at', ''))
+        timed = timed[-window:]
+        total_files = sum(self._worked_files(r) for r in timed)
+        if not total_files:
+            return default
+        return sum(r['duration_s'] for r in timed) / total_files
+
+    @staticmethod
+    def _worked_files(review: Dict) -> int:
+        """
+        Files a review actually checked or AI-evaluated; reviews saved before
+        'checked_files' was recorded fall back to their total file count.
+        """
+        return review.get('checked_files', review.get('files')) or 0
+
+    def get_deferred(self, repo_url: str) -> Dict[int, Dict]:
+        """Return deferred PR records for a repository, keyed by PR number."""
+        Q = Query()
+        with self._lock:
+            return {r['pr_number']: r for r in self.deferred.search(Q.repo_url == repo_url)}
+
     # ── Write ─────────────────────────────────────────────────────────────────
 
     def save_review(
@@ -107,6 +180,11 @@ class StateRepository:
         decision: str,
         score: int,
         pr_updated_at: str,
+        duration_s: Optional[float] = None,
+        files: Optional[int] = None,
+        head_sha: Optional[str] = None,
+        check_matrix: Optional[Dict] = None,
+        checked_files: Optional[int] = None,
     ) -> None:
         """
         Persist a review decision.  Upserts (inserts or replaces).
@@ -118,6 +196,12 @@ class StateRepository:
             decision:       'APPROVE' | 'REQUEST_CHANGES' | 'REJECT'
             score:          Final composite score 0-100
             pr_updated_at:  PR updated_at timestamp from GitHub
+            duration_s:     Seconds the review took (feeds per_file_latency)
+            files:          Number of files evaluated
+            head_sha:       PR head commit the review was made at
+            check_matrix:   Packed files × checks outcomes (CheckMatrix.pack())
+            checked_files:  Number of those files checked or AI-evaluated in
+                            this review (feeds per_file_latency)
         """
         Q = Query()
         record = {
@@ -129,38 +213,112 @@ class StateRepository:
             'reviewed_at': datetime.now().isoformat(),
             'pr_updated_at': pr_updated_at,
         }
+        if duration_s is not None:
+            record['duration_s'] = round(duration_s, 3)
+        if files is not None:
+            record['files'] = files
+        if checked_files is not None:
+            record['checked_files'] = checked_files
+        if head_sha is not None:
+            record['head_sha'] = head_sha
+        if check_matrix is not None:
+            record['check_matrix'] = check_matrix
+
+        # Lookup and upsert must be atomic, otherwise two workers saving the
+        # same PR could both miss the existing record and insert twice.
+        with self._lock:
+            existing = self.reviews.get(
+                (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
+            )
 
-        existing = self.reviews.get(
-            (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
-        )
+            if existing:
+                self.reviews.update(
+                    record,
+                    (Q.repo_url == repo_url) & (Q.pr_number == pr_number),
+                )
+                logger.info(
+                    f"Updated review record: {repo_url}#{pr_number} -> {decision} ({score})"
+                )
+            else:
+                self.reviews.insert(record)
+                logger.info(
+                    f"Saved review: {repo_url}#{pr_number} -> {decision} ({score})"
+                )
 
-        if existing:
+    def update_review_head(
+        self,
+        repo_url: str,
+        pr_number: int,
+        head_sha: str,
+        pr_updated_at: str,
+    ) -> None:
+        """Move a review record to a new head commit without changing its decision."""
+        Q = Query()
+        with self._lock:
             self.reviews.update(
-                record,
+                {'head_sha': head_sha, 'pr_updated_at': pr_updated_at},
                 (Q.repo_url == repo_url) & (Q.pr_number == pr_number),
             )
-            logger.info(
-                f"Updated review record: {repo_url}#{pr_number} -> {decision} ({score})"
-            )
-        else:
-            self.reviews.insert(record)
-            logger.info(
-                f"Saved review: {repo_url}#{pr_number} -> {decision} ({score})"
-            )
 
     def clear_review(self, repo_url: str, pr_number: int) -> None:
         """Remove a review record (useful for re-triggering a review)."""
         Q = Query()
-        self.reviews.remove(
-            (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
-        )
+        with self._lock:
+            self.reviews.remove(
+                (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
+            )
         logger.info(f"Cleared review record: {repo_url}#{pr_number}")
 
+    def defer_pr(self, repo_url: str, pr_number: int, estimate_s: float) -> None:
+        """
+        Record a PR that did not fit this run's time budget.
+
+        The original deferral time is kept, so a PR deferred again keeps its
+        place at the front of the next run's schedule.
+        """
+        Q = Query()
+        with self._lock:
+            cond = (Q.repo_url == repo_url) & (Q.pr_number == pr_number)
+            if self.deferred.get(cond):
+                self.deferred.update({'estimate_s': round(estimate_s, 1)}, cond)
+            else:
+                self.deferred.insert({
+                    'repo_url': repo_url,
+                    'pr_number': pr_number,
+                    'estimate_s': round(estimate_s, 1),
+                    'deferred_at': datetime.now().isoformat(),
+                })
+        logger.info(f"Deferred PR {repo_url}#{pr_number} (estimate {estimate_s:.0f}s)")
+
+    def clear_deferred(self, repo_url: str, pr_number: int) -> None:
+        """Drop a PR from the deferred table (it was reviewed or is no longer pending)."""
+        Q = Query()
+        with self._lock:
+            self.deferred.remove((Q.repo_url == repo_url) & (Q.pr_number == pr_number))
+
+    def prune_deferred(self, repo_url: str, open_numbers: Iterable[int]) -> int:
+        """
+        Drop the deferred records of a repository's PRs that are no longer
+        open (merged, closed, or no longer matching the PR filters).
+
+        Returns:
+            Number of records removed
+        """
+        Q = Query()
+        open_numbers = set(open_numbers)
+        with self._lock:
+            removed = self.deferred.remove(
+                (Q.repo_url == repo_url) & Q.pr_number.test(lambda n: n not in open_numbers)
+            )
+        if removed:
+            logger.info(f"Dropped {len(removed)} deferred PR(s) of {repo_url} no longer open")
+        return len(removed)
+
     # ── Stats ─────────────────────────────────────────────────────────────────
 
     def get_stats(self) -> Dict[str, int]:
         """Return review counts grouped by decision."""
-        all_records = self.reviews.all()
+        all_records = self.get_all_reviews()
         stats: Dict[str, int] = {'APPROVE': 0, 'REQUEST_CHANGES': 0, 'REJECT': 0, 'total': 0}
         for record in all_records:
             decision = record.get('decision', '')
@@ -0,0 +1,94 @@
+"""Git trees (blob path lists) keyed by tree SHA, stored in SQLite."""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TreeCache:
+    """
+    Blob paths of git trees already listed, so a family's tree is fetched
+    from the git tree API once — not once per PR or per run.  A tree SHA
+    names its content, so an entry never goes stale.
+
+    Schema (table: 'trees'):
+        tree_sha : str   - Git tree SHA
+        paths    : str   - Newline-separated blob paths, relative to the tree
+        used_at  : float - Unix time of the last write or hit
+
+    The table holds at most ``max_entries`` trees; the least recently used
+    are evicted first.  The last ``memory_entries`` trees read are also
+    kept in memory.  One connection is shared by PR worker threads behind
+    a lock.
+    """
+
+    def __init__(self, db_path: str = "data/tree_cache.sqlite", max_entries: int = 50, memory_entries: int = 8):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, max_entries)
+        self.memory_entries = max(0, memory_entries)
+        self._memory: 'OrderedDict[str, List[str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS trees ("
+                " tree_sha TEXT PRIMARY KEY, paths TEXT NOT NULL, used_at REAL NOT NULL)"
+            )
+        logger.info(f"TreeCache initialised at {db_path}")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def get(self, tree_sha: str) -> Optional[List[str]]:
+        """Blob paths of a cached tree (marked as recently used), or None."""
+        with self._lock:
+            paths = self._memory.get(tree_sha)
+            if paths is not None:
+                self._memory.move_to_end(tree_sha)
+                return paths
+            with self.conn:
+                row = self.conn.execute(
+                    "SELECT paths FROM trees WHERE tree_sha = ?", (tree_sha,),
+                ).fetchone()
+                if row is None:
+                    return None
+                self.conn.execute(
+                    "UPDATE trees SET used_at = ? WHERE tree_sha = ?", (time.time(), tree_sha),
+                )
+            paths = row[0].split('\n') if row[0] else []
+            self._remember(tree_sha, paths)
+            return paths
+
+    def put(self, tree_sha: str, paths: List[str]) -> None:
+        """Store a tree's blob paths, then evict the least recently used trees over the limit."""
+        with self._lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO trees VALUES (?, ?, ?)",
+                    (tree_sha, '\n'.join(paths), time.time()),
+                )
+                excess = self.conn.execute("SELECT COUNT(*) FROM trees").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    self.conn.execute(
+                        "DELETE FROM trees WHERE rowid IN"
+                        " (SELECT rowid FROM trees ORDER BY used_at LIMIT ?)",
+                        (excess,),
+                    )
+                    logger.debug(f"TreeCache evicted {excess} least recently used trees")
+            self._remember(tree_sha, paths)
+
+    def _remember(self, tree_sha: str, paths: List[str]) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[tree_sha] = paths
+        self._memory.move_to_end(tree_sha)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
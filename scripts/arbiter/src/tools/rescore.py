@@ -0,0 +1,203 @@
+"""
+What-if replay of the review history under candidate thresholds and weights.
+
+Every saved review stores its files' check outcomes and AI scores (the
+'check_matrix' field, see CheckMatrix).  This replays make_decision() over
+all of them under a candidate config.yaml and checklist.yaml — offline, no
+GitHub or LLM calls — and reports the decisions that would flip:
+
+    python -m src.tools.rescore --config candidate/config.yaml \\
+        --checklist candidate/checklist.yaml --json rescore.json
+    python -m src.tools.rescore --approve 75 --ai-weight 30
+
+Static scores are recomputed from the stored outcomes under the candidate
+checks' weights and required flags; checks the candidate adds pass in every
+file.  AI contributions are re-scaled to the candidate ai_evaluation.weight.
+Reviews saved before outcomes were stored are counted but not replayed.
+"""
+
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.config.loader import load_config
+from src.review.check_matrix import CheckMatrix
+from src.review.checklist import load_checklist
+from src.review.decision import make_decision
+from src.state.repository import StateRepository
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def replay_review(
+    review: Dict[str, Any],
+    checks: List[Dict[str, Any]],
+    thresholds: Dict[str, int],
+    ai_weight: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Decide a stored review again under candidate settings.
+
+    Args:
+        review:     Record from StateRepository.get_all_reviews()
+        checks:     Candidate checklist checks
+        thresholds: Candidate review.score_thresholds
+        ai_weight:  Candidate ai_evaluation.weight
+
+    Returns:
+        {'repo_url', 'pr_number', 'product', 'files', 'old_decision',
+         'old_score', 'decision', 'score', 'static', 'ai'}, or None when the
+        review has no stored outcomes
+    """
+    packed = review.get('check_matrix')
+    if not packed or not packed.get('rows'):
+        return None
+    matrix = CheckMatrix.unpack(packed, checks)
+    avg_static, _, _ = matrix.pr_static_score()
+    ai_contribution = matrix.pr_ai_contribution(ai_weight)
+    decision, total = make_decision(avg_static, {'weighted_contribution': ai_contribution}, thresholds)
+    return {
+        'repo_url': review['repo_url'],
+        'pr_number': review['pr_number'],
+        'product': review.get('product', ''),
+        'files': matrix.rows,
+        'old_decision': review['decision'],
+        'old_score': review['score'],
+        'decision': decision,
+        'score': total,
+        'static': avg_static,
+        'ai': ai_contribution,
+    }
+
+
+def rescore(
+    reviews: List[Dict[str, Any]],
+    checks: List[Dict[str, Any]],
+    thresholds: Dict[str, int],
+    ai_weight: int,
+) -> Dict[str, Any]:
+    """
+    Replay every review and tally the flips.
+
+    Returns:
+        {'reviews', 'replayed', 'without_outcomes', 'flipped',
+         'transitions': {'OLD -> NEW': count}, 'decisions': {decision: count},
+         'flips': [replay_review() results whose decision changed]}
+        ``flips`` is ordered by score change, largest first.
+    """
+    replays = [replay_review(review, checks, thresholds, ai_weight) for review in reviews]
+    replayed = [r for r in replays if r is not None]
+    flips = [r for r in replayed if r['decision'] != r['old_decision']]
+    flips.sort(key=lambda r: (-abs(r['score'] - r['old_score']), r['repo_url'], r['pr_number']))
+    return {
+        'reviews': len(reviews),
+        'replayed': len(replayed),
+        'without_outcomes': len(reviews) - len(replayed),
+        'flipped': len(flips),
+        'transitions': dict(Counter(f"{r['old_decision']} -> {r['decision']}" for r in flips)),
+        'decisions': dict(Counter(r['decision'] for r in replayed)),
+        'flips': flips,
+    }
+
+
+# ── CLI entry point ───────────────────────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Usage:
+        python -m src.tools.rescore
+        python -m src.tools.rescore --config candidate.yaml --checklist candidate-checklist.yaml
+        python -m src.tools.rescore --approve 75 --request-changes 45 --json rescore.json
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Replay the stored review history under candidate thresholds and weights.",
+    )
+    parser.add_argument(
+        '--config',
+        default='config/config.yaml',
+        help="Candidate config YAML for review.score_thresholds (default: config/config.yaml).",
+    )
+    parser.add_argument(
+        '--checklist',
+        default='config/checklist.yaml',
+        help="Candidate checklist YAML for weights and required checks (default: config/checklist.yaml).",
+    )
+    parser.add_argument(
+        '--state',
+        default='data/state.json',
+        help="State DB holding the review history (default: data/state.json).",
+    )
+    parser.add_argument('--approve', type=int, help="Override the approve threshold.")
+    parser.add_argument('--request-changes', type=int, help="Override the request_changes threshold.")
+    parser.add_argument('--ai-weight', type=int, help="Override ai_evaluation.weight.")
+    parser.add_argument('--product', help="Only replay reviews of this product.")
+    parser.add_argument('--json', dest='json_path', metavar='PATH', help="Write the full report as JSON.")
+    parser.add_argument(
+        '--show', type=int, default=20, metavar='N',
+        help="Flipped reviews listed in the log, largest score change first (default: 20).",
+    )
+    args = parser.parse_args(argv)
+
+    if not Path(args.state).exists():
+        logger.error(f"State DB not found: {args.state}")
+        return 2
+    thresholds = dict(load_config(args.config).get('review', {}).get('score_thresholds', {}))
+    if args.approve is not None:
+        thresholds['approve'] = args.approve
+    if args.request_changes is not None:
+        thresholds['request_changes'] = args.request_changes
+    checklist = load_checklist(args.checklist)
+    ai_weight = args.ai_weight
+    if ai_weight is None:
+        ai_weight = checklist.get('ai_evaluation', {}).get('weight', 20)
+
+    repo = StateRepository(args.state)
+    try:
+        reviews = repo.get_all_reviews()
+    finally:
+        repo.close()
+    if args.product:
+        reviews = [r for r in reviews if r.get('product') == args.product]
+
+    # make_decision() logs every decision; thousands of replays would drown the report
+    logging.getLogger('src.review.decision').setLevel(logging.WARNING)
+    started = time.monotonic()
+    report = rescore(reviews, checklist.get('checks', []), thresholds, ai_weight)
+    elapsed = time.monotonic() - started
+
+    logger.info(
+        f"Replayed {report['replayed']} of {report['reviews']} review(s) in {elapsed:.2f}s "
+        f"(approve >= {thresholds.get('approve', 80)}, request_changes >= "
+        f"{thresholds.get('request_changes', 50)}, AI weight {ai_weight})"
+    )
+    if report['without_outcomes']:
+        logger.info(f"  {report['without_outcomes']} review(s) predate stored outcomes and were not replayed")
+    for decision, count in sorted(report['decisions'].items()):
+        logger.info(f"  {decision:<16} {count}")
+    logger.info(f"Decisions that would flip: {report['flipped']}")
+    for transition, count in sorted(report['transitions'].items(), key=lambda item: -item[1]):
+        logger.info(f"  {transition:<34} {count}")
+    for flip in report['flips'][:args.show]:
+        logger.info(
+            f"  {flip['repo_url']}#{flip['pr_number']}: {flip['old_decision']} ({flip['old_score']}) "
+            f"-> {flip['decision']} ({flip['score']} = static {flip['static']} + AI {flip['ai']})"
+        )
+
+    if args.json_path:
+        path = Path(args.json_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {'thresholds': thresholds, 'ai_weight': ai_weight, **report}
+        path.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        logger.info(f"JSON report written to {args.json_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,9 @@ Conholdate agents (optimizer, arbiter, …) report into the same dashboard.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
+import httpx
 import requests
 from src.utils.logger import setup_logger
 
@@ -119,6 +120,8 @@ class MetricsLogger:
         timestamp: Optional[str] = None,
         token_usage: int = 0,
         api_calls_count: int = 0,
+        check_timings: Optional[Dict[str, Dict[str, Any]]] = None,
+        ai_cache: Optional[Dict[str, int]] = None,
     ) -> bool:
         """
         Send one metrics record to the Google Apps Script endpoint.
@@ -134,17 +137,106 @@ class MetricsLogger:
             timestamp:        ISO timestamp override (defaults to UTC now)
             token_usage:      Cumulative AI tokens consumed
             api_calls_count:  Cumulative AI API calls made
+            check_timings:    CheckProfile.summary() of the run, sent only when given
+            ai_cache:         {'hits', 'tokens_saved'} of the AI response cache, sent only when given
 
         Returns:
             True if the HTTP request succeeded (status 200), False otherwise
         """
+        payload = self._build_payload(
+            run_id=run_id,
+            status=status,
+            product=product,
+            platform=platform,
+            items_discovered=items_discovered,
+            items_succeeded=items_succeeded,
+            items_failed=items_failed,
+            run_duration_ms=run_duration_ms,
+            timestamp=timestamp,
+            token_usage=token_usage,
+            api_calls_count=api_calls_count,
+            check_timings=check_timings,
+            ai_cache=ai_cache,
+        )
+        if payload is None:
+            return False
+
+        try:
+            url = f"{self.endpoint}?token={self.token}"
+            response = requests.post(
+                url,
+                json=payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=10,
+            )
+            return self._check_response(response.status_code, response.text, run_id, status)
+
+        except requests.exceptions.Timeout:
+            logger.error("Metrics request timed out")
+            return False
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Metrics request failed: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected metrics error: {e}")
+            return False
+
+    async def log_run_metrics_async(self, run_id: str, status: str, **fields) -> bool:
+        """
+        Asyncio counterpart of log_run_metrics() for the --async engine.
+
+        Posts over httpx so the request shares the engine's event loop
+        instead of blocking it.
+        """
+        payload = self._build_payload(run_id=run_id, status=status, **fields)
+        if payload is None:
+            return False
+
+        try:
+            async with httpx.AsyncClient(timeout=10) as client:
+                response = await client.post(
+                    self.endpoint,
+                    params={'token': self.token},
+                    json=payload,
+                    # Apps Script answers with a redirect to the result page
+                    follow_redirects=True,
+                )
+            return self._check_response(response.status_code, response.text, run_id, status)
+
+        except httpx.TimeoutException:
+            logger.error("Metrics request timed out")
+            return False
+        except httpx.HTTPError as e:
+            logger.error(f"Metrics request failed: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected metrics error: {e}")
+            return False
+
+    def _build_payload(
+        self,
+        run_id: str,
+        status: str,
+        product: Optional[str] = None,
+        platform: str = 'All',
+        items_discovered: int = 0,
+        items_succeeded: int = 0,
+        items_failed: int = 0,
+        run_duration_ms: int = 0,
+        timestamp: Optional[str] = None,
+        token_usage: int = 0,
+        api_calls_count: int = 0,
+        check_timings: Optional[Dict[str, Dict[str, Any]]] = None,
+        ai_cache: Optional[Dict[str, int]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Build the endpoint payload, or return None when metrics cannot be sent."""
         if not self.enabled:
             logger.debug("Metrics disabled — skipping")
-            return False
+            return None
 
         if not self.endpoint or not self.token:
             logger.warning("Metrics endpoint or token not configured — skipping")
-            return False
+            return None
 
         if timestamp is None:
             timestamp = datetime.utcnow().isoformat()
@@ -168,34 +260,19 @@ class MetricsLogger:
             'token_usage':      token_usage,
             'api_calls_count':  api_calls_count,
         }
-
-        try:
-            url = f"{self.endpoint}?token={self.token}"
-            response = requests.post(
-                url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=10,
-            )
-
-            if response.status_code == 200:
-                logger.info(f"Metrics logged for run {run_id} ({status})")
-                return True
-            else:
-                logger.error(
-                    f"Metrics HTTP {response.status_code} for run {run_id}: {response.text}"
-                )
-                return False
-
-        except requests.exceptions.Timeout:
-            logger.error("Metrics request timed out")
-            return False
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Metrics request failed: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected metrics error: {e}")
-            return False
+        if check_timings:
+            payload['check_timings'] = check_timings
+        if ai_cache is not None:
+            payload['ai_cache'] = ai_cache
+        return payload
+
+    @staticmethod
+    def _check_response(status_code: int, text: str, run_id: str, status: str) -> bool:
+        if status_code == 200:
+            logger.info(f"Metrics logged for run {run_id} ({status})")
+            return True
+        logger.error(f"Metrics HTTP {status_code} for run {run_id}: {text}")
+        return False
 
     # ── Convenience wrapper ───────────────────────────────────────────────────
 
@@ -210,6 +287,8 @@ class MetricsLogger:
         duration_ms: int,
         token_usage: int = 0,
         api_calls_count: int = 0,
+        check_timings: Optional[Dict[str, Dict[str, Any]]] = None,
+        ai_cache: Optional[Dict[str, int]] = None,
     ) -> bool:
         """
         Convenience wrapper with PR-arbiter-specific argument names.
@@ -229,21 +308,63 @@ class MetricsLogger:
             duration_ms:    Actual wall-clock duration in milliseconds
             token_usage:    AI tokens consumed
             api_calls_count: AI API calls made
+            check_timings:  Per-check timings (CheckProfile.summary()), if recorded
+            ai_cache:       AI response cache hits and tokens saved, if the cache is on
 
         Returns:
             True if metrics were posted successfully
         """
-        status = _determine_status(files_reviewed, prs_errors)
+        return self.log_run_metrics(**_review_run_fields(
+            run_id, product, platform, files_found, files_reviewed,
+            prs_errors, duration_ms, token_usage, api_calls_count, check_timings, ai_cache,
+        ))
 
-        return self.log_run_metrics(
-            run_id=run_id,
-            status=status,
-            product=product,
-            platform=platform,
-            items_discovered=files_found,
-            items_succeeded=files_reviewed,
-            items_failed=prs_errors,
-            run_duration_ms=duration_ms,
-            token_usage=token_usage,
-            api_calls_count=api_calls_count,
-        )
+    async def log_review_run_async(
+        self,
+        run_id: str,
+        product: Optional[str],
+        platform: str,
+        files_found: int,
+        files_reviewed: int,
+        prs_errors: int,
+        duration_ms: int,
+        token_usage: int = 0,
+        api_calls_count: int = 0,
+        check_timings: Optional[Dict[str, Dict[str, Any]]] = None,
+        ai_cache: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """Asyncio counterpart of log_review_run(); same arguments."""
+        return await self.log_run_metrics_async(**_review_run_fields(
+            run_id, product, platform, files_found, files_reviewed,
+            prs_errors, duration_ms, token_usage, api_calls_count, check_timings, ai_cache,
+        ))
+
+
+def _review_run_fields(
+    run_id: str,
+    product: Optional[str],
+    platform: str,
+    files_found: int,
+    files_reviewed: int,
+    prs_errors: int,
+    duration_ms: int,
+    token_usage: int,
+    api_calls_count: int,
+    check_timings: Optional[Dict[str, Dict[str, Any]]] = None,
+    ai_cache: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """Map PR-arbiter argument names onto log_run_metrics() keyword arguments."""
+    return {
+        'run_id': run_id,
+        'status': _determine_status(files_reviewed, prs_errors),
+        'product': product,
+        'platform': platform,
+        'items_discovered': files_found,
+        'items_succeeded': files_reviewed,
+        'items_failed': prs_errors,
+        'run_duration_ms': duration_ms,
+        'token_usage': token_usage,
+        'api_calls_count': api_calls_count,
+        'check_timings': check_timings,
+        'ai_cache': ai_cache,
+    }
@@ -0,0 +1,184 @@
+"""
+Bounded-queue producer/consumer pipeline.
+
+Each stage owns an input queue of limited size and a fixed number of worker
+threads.  A worker takes an item, applies the stage function and hands the
+result to the next stage's queue, blocking while that queue is full — so a
+slow stage applies backpressure upstream instead of letting work pile up in
+memory.  A stage function returning None drops the item (e.g. a skipped PR).
+
+Per-stage counters (items, drops, errors, busy time, queue depth) are kept so
+the caller can report where the run spent its time.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_STOP = object()  # Sentinel that shuts down one worker
+
+
+class _Stage:
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int, queue_size: int):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.inbox: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.threads: List[threading.Thread] = []
+        self.lock = threading.Lock()
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_s = 0.0
+        self.max_depth = 0
+        self.depth_total = 0
+        self.depth_samples = 0
+
+    def record_depth(self) -> None:
+        depth = self.inbox.qsize()
+        with self.lock:
+            self.max_depth = max(self.max_depth, depth)
+            self.depth_total += depth
+            self.depth_samples += 1
+
+
+class StagedPipeline:
+    """
+    Run items through a fixed sequence of stages connected by bounded queues.
+
+    Usage:
+        pipeline = StagedPipeline(stages, queue_size=4, on_done=..., on_error=...)
+        pipeline.start()
+        for item in items:
+            pipeline.submit(item)      # blocks while the first queue is full
+        pipeline.close()               # drains every stage, then joins workers
+        stats = pipeline.stats()
+    """
+
+    def __init__(
+        self,
+        stages: List[Tuple[str, Callable[[Any], Any], int]],
+        queue_size: int,
+        on_done: Callable[[Any, bool], None],
+        on_error: Optional[Callable[[Any, str, Exception], None]] = None,
+    ):
+        """
+        Args:
+            stages:     (name, fn, workers) per stage, in order.  ``fn`` takes
+                        an item and returns the item for the next stage, or
+                        None to drop it.
+            queue_size: Capacity of every stage's input queue.
+            on_done:    Called once per submitted item when it leaves the
+                        pipeline: (item, True) after the last stage,
+                        (item, False) when dropped or failed.
+            on_error:   Called with (item, stage_name, exception) when a stage
+                        function raises; the item is then dropped.
+        """
+        self._stages = [_Stage(name, fn, workers, queue_size) for name, fn, workers in stages]
+        self._on_done = on_done
+        self._on_error = on_error
+        self.submitted = 0
+        self.blocked_s = 0.0  # producer time spent waiting on backpressure
+        self._started_at = 0.0
+        self._elapsed_s = 0.0
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+        for index, stage in enumerate(self._stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work, args=(index,),
+                    name=f"stage-{stage.name}-{n}", daemon=True,
+                )
+                thread.start()
+                stage.threads.append(thread)
+
+    def submit(self, item: Any) -> None:
+        """Feed one item to the first stage (blocks while its queue is full)."""
+        first = self._stages[0]
+        start = time.perf_counter()
+        first.inbox.put(item)
+        self.blocked_s += time.perf_counter() - start
+        self.submitted += 1
+        first.record_depth()
+
+    def close(self) -> None:
+        """Stop accepting items and shut stages down in order once each is drained."""
+        for stage in self._stages:
+            for _ in stage.threads:
+                stage.inbox.put(_STOP)
+            for thread in stage.threads:
+                thread.join()
+        self._elapsed_s = time.perf_counter() - self._started_at
+
+    def _work(self, index: int) -> None:
+        stage = self._stages[index]
+        downstream = self._stages[index + 1] if index + 1 < len(self._stages) else None
+
+        while True:
+            item = stage.inbox.get()
+            if item is _STOP:
+                return
+
+            start = time.perf_counter()
+            failed = False
+            try:
+                result = stage.fn(item)
+            except Exception as e:
+                result = None
+                failed = True
+                if self._on_error is not None:
+                    self._on_error(item, stage.name, e)
+                else:
+                    logger.error(f"Stage '{stage.name}' failed: {e}", exc_info=True)
+            busy = time.perf_counter() - start
+
+            with stage.lock:
+                stage.busy_s += busy
+                if failed:
+                    stage.errors += 1
+                elif result is None:
+                    stage.dropped += 1
+                else:
+                    stage.processed += 1
+
+            if result is None:
+                self._on_done(item, False)
+            elif downstream is not None:
+                downstream.inbox.put(result)  # blocks while downstream is full
+                downstream.record_depth()
+            else:
+                self._on_done(result, True)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Per-stage counters, in stage order.
+
+        Returns:
+            [{'stage', 'workers', 'processed', 'dropped', 'errors', 'busy_s',
+              'max_queue', 'avg_queue', 'throughput'}, ...]
+            ``throughput`` is items handled per second of pipeline wall time.
+        """
+        elapsed = self._elapsed_s or (time.perf_counter() - self._started_at)
+        rows: List[Dict[str, Any]] = []
+        for stage in self._stages:
+            handled = stage.processed + stage.dropped + stage.errors
+            rows.append({
+                'stage': stage.name,
+                'workers': stage.workers,
+                'processed': stage.processed,
+                'dropped': stage.dropped,
+                'errors': stage.errors,
+                'busy_s': stage.busy_s,
+                'max_queue': stage.max_depth,
+                'avg_queue': (
+                    stage.depth_total / stage.depth_samples if stage.depth_samples else 0.0
+                ),
+                'throughput': handled / elapsed if elapsed > 0 else 0.0,
+            })
+        return rows
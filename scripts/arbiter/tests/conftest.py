@@ -0,0 +1,195 @@
+"""
+Shared test fixtures.
+
+Makes ``src`` importable when pytest runs from outside scripts/arbiter, and
+drives PRArbitrAgent against in-memory GitHub and AI fakes: config and
+checklist come from config/, every state file lives under tmp_path.
+"""
+
+import copy
+import sys
+import threading
+import types
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import yaml
+
+ARBITER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ARBITER_DIR))
+
+import src.main as main_module  # noqa: E402
+from src.ai.response_cache import ResponseCache  # noqa: E402
+from src.review.checklist import load_checklist  # noqa: E402
+from src.state.check_cache import CheckCache  # noqa: E402
+from src.state.repository import StateRepository  # noqa: E402
+from src.state.tree_cache import TreeCache  # noqa: E402
+
+REPO_URL = 'https://github.com/o/r'
+
+GOOD_PAGE = """---
+title: Foo
+layout: reference-single
+categories: [a]
+description: "A long enough description for the Foo class in the API docs"
+summary: Foo class
+---
+## Foo class
+
+Assembly: Aspose.Words.dll (24.1)
+
+```csharp
+public class Foo
+```
+
+| Name | Description |
+| --- | --- |
+| [Bar](/words/foo/bar/) | Bar method |
+"""
+
+# Fails a required check (front-matter layout), so the PR cannot be approved
+BAD_PAGE = GOOD_PAGE.replace('layout: reference-single\n', '')
+
+
+class FakePR:
+    """The PyGithub PullRequest attributes the agent reads, plus posted reviews."""
+
+    def __init__(self, number, files, head_sha=None):
+        self.number = number
+        self.title = f'PR {number}'
+        self.updated_at = datetime(2026, 1, 1)
+        self.head = types.SimpleNamespace(sha=head_sha or f'sha{number}', ref=f'api-update-{number}')
+        self.base = types.SimpleNamespace(sha='base0')
+        self.labels = []
+        self.files = files
+        self.changed_files = len(files)
+        self.reviews = []
+        self.label_calls = []
+
+    def create_review(self, body, event):
+        self.reviews.append((event, body))
+
+    def add_to_labels(self, *labels):
+        self.label_calls.append(labels)
+
+
+class FakeAI:
+    """AIClient stand-in: every file scores 80."""
+
+    def __init__(self, score=80):
+        self.score = score
+        self.token_usage = 0
+        self.api_calls = 0
+        self.cache_hits = 0
+        self.tokens_saved = 0
+        self._lock = threading.Lock()
+
+    def complete_json(self, prompt, temperature=0.2):
+        with self._lock:
+            self.api_calls += 1
+            self.token_usage += 10
+        return {'score': self.score, 'summary': 'ok', 'issues': [], 'recommendation': 'APPROVE'}
+
+
+class FakeGitHub:
+    """Open PRs and file contents served in place of the GitHub API."""
+
+    def __init__(self):
+        self.prs = []
+        self.contents = {}
+        self.fetched = []
+        self._lock = threading.Lock()
+
+    def add_pr(self, number, n_files=3, bad=(), prefix=None, **kwargs):
+        """Add a PR changing ``n_files`` pages; indexes in ``bad`` get BAD_PAGE."""
+        prefix = prefix or f'p{number}'
+        files = []
+        for i in range(n_files):
+            path = f'content/{prefix}/en/f{i}.md'
+            files.append({
+                'path': path,
+                'status': 'modified',
+                'patch': '@@ -1,1 +1,1 @@\n-a\n+b',
+                'additions': 1,
+                'deletions': 1,
+                'sha': f'blob-{prefix}-{i}',
+            })
+            self.contents[path] = BAD_PAGE if i in bad else GOOD_PAGE
+        pr = FakePR(number, files, **kwargs)
+        self.prs.append(pr)
+        return pr
+
+    def get_file_content(self, repo, path, ref):
+        with self._lock:
+            self.fetched.append(path)
+        return self.contents.get(path)
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(main_module, 'fetch_open_prs', lambda repo, **kw: list(self.prs))
+        monkeypatch.setattr(main_module, 'get_pr_files', lambda pr: [dict(f) for f in pr.files])
+        monkeypatch.setattr(main_module, 'get_file_content', self.get_file_content)
+        monkeypatch.setattr(main_module, 'post_review', lambda pr, decision, body: pr.create_review(body, decision))
+        monkeypatch.setattr(main_module, 'add_labels', lambda pr, labels: pr.add_to_labels(*labels))
+        monkeypatch.setattr(main_module, 'merge_pr', lambda pr, **kw: True)
+
+
+@pytest.fixture
+def github(monkeypatch):
+    fake = FakeGitHub()
+    fake.install(monkeypatch)
+    return fake
+
+
+@pytest.fixture
+def make_agent(tmp_path, monkeypatch):
+    """
+    Factory for a PRArbitrAgent wired to the fakes.
+
+    Keyword arguments update the ``review`` config section; ``ai=True``
+    enables the AI stage (FakeAI); ``cls`` picks the engine class. Agents
+    are closed at teardown.
+    """
+    base_cfg = yaml.safe_load((ARBITER_DIR / 'config' / 'config.yaml').read_text())
+    base_cfg['github']['token'] = 't'
+    base_cfg['gpt_oss'].update(endpoint='e', api_key='k')
+    base_cfg['products'] = {'p': {'content_repo': REPO_URL}}
+    base_cfg['metrics']['enabled'] = False
+    base_cfg['prompts'] = {k: str(ARBITER_DIR / v) for k, v in base_cfg.get('prompts', {}).items()}
+    agents = []
+
+    def factory(ai=False, cls=None, **review):
+        cfg = copy.deepcopy(base_cfg)
+        cfg['review']['file_results'] = {'path': str(tmp_path / 'file_results.sqlite')}
+        cfg['review'].update(review)
+        checklist = load_checklist(str(ARBITER_DIR / 'config' / 'checklist.yaml'))
+        checklist['ai_evaluation']['enabled'] = ai
+        monkeypatch.setattr(main_module, 'load_config', lambda path: copy.deepcopy(cfg))
+        monkeypatch.setattr(main_module, 'load_checklist', lambda path: checklist)
+        monkeypatch.setattr(main_module, 'AIClient', lambda **kw: FakeAI())
+        monkeypatch.setattr(
+            main_module, 'GitHubClient',
+            lambda token: types.SimpleNamespace(
+                get_repository=lambda url: types.SimpleNamespace(full_name='o/r'),
+            ),
+        )
+        monkeypatch.setattr(main_module, 'StateRepository', lambda path: StateRepository(str(tmp_path / 'state.json')))
+        monkeypatch.setattr(
+            main_module, 'CheckCache',
+            lambda path, **kw: CheckCache(str(tmp_path / 'check_cache.sqlite'), **kw),
+        )
+        monkeypatch.setattr(
+            main_module, 'TreeCache',
+            lambda path, **kw: TreeCache(str(tmp_path / 'tree_cache.sqlite'), **kw),
+        )
+        monkeypatch.setattr(
+            main_module, 'ResponseCache',
+            lambda path, **kw: ResponseCache(str(tmp_path / 'ai_cache.sqlite'), **kw),
+        )
+        agent = (cls or main_module.PRArbitrAgent)('config.yaml')
+        agents.append(agent)
+        return agent
+
+    yield factory
+    for agent in agents:
+        agent.close()
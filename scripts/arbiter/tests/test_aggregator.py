@@ -0,0 +1,62 @@
+"""ReviewAggregator and its top-issue counter."""
+
+from src.review.aggregator import ReviewAggregator, _TopIssues
+
+CHECKS = [
+    {'id': 'req', 'description': 'Required thing', 'type': 'required', 'weight': 40},
+    {'id': 'opt', 'description': 'Optional thing', 'type': 'optional', 'weight': 40},
+]
+
+
+def _result(path, failed=(), score=80, issues=()):
+    return {
+        'path': path,
+        'stratum': 'type/small',
+        'failed_checks': list(failed),
+        'ai_result': {'score': score, 'weighted_contribution': score // 5, 'issues': list(issues)},
+    }
+
+
+def test_top_issues_is_exact_within_capacity():
+    counter = _TopIssues(capacity=10)
+    for issue in ['a'] * 5 + ['b'] * 3 + ['c'] * 3 + ['d']:
+        counter.add(issue)
+
+    assert counter.most_common(3) == [('a', 5), ('b', 3), ('c', 3)]
+
+
+def test_top_issues_keeps_heavy_hitters_past_capacity():
+    counter = _TopIssues(capacity=5)
+    for n in range(1000):
+        counter.add('frequent' if n % 3 == 0 else f'rare-{n}')
+
+    assert len(counter.counts) == 5
+    top, count = counter.most_common(1)[0]
+    assert top == 'frequent'
+    assert count >= 334  # never undercounted; overcount bounded by the evicted minimum
+
+
+def test_summary_keeps_a_bounded_failing_file_sample():
+    aggregator = ReviewAggregator(CHECKS, top_k=2, failing_files=3)
+    for n in range(100):
+        aggregator.add(_result(f'f{n}.md', failed=['opt'] if n % 2 else [], issues=[f'issue {n % 7}']))
+
+    summary = aggregator.summary()
+    assert summary['files'] == 100
+    assert summary['failing_count'] == 100
+    assert [f['path'] for f in summary['failing_files']] == ['f0.md', 'f1.md', 'f2.md']
+    assert summary['top_issues'][0][0] == 'Optional thing'
+    assert len(summary['top_issues']) == 2
+    assert summary['avg_static'] == 60
+    assert not summary['required_failed']
+
+
+def test_required_failure_caps_the_static_score():
+    aggregator = ReviewAggregator(CHECKS)
+    aggregator.add(_result('a.md', failed=['req']))
+    aggregator.add(_result('b.md'))
+
+    summary = aggregator.summary()
+    assert summary['required_failed']
+    assert summary['avg_static'] == 49
+    assert summary['failed_checks'] == ['req']
@@ -0,0 +1,138 @@
+"""AsyncPRArbitrAgent: the asyncio engine against the same fakes as the thread engine."""
+
+import asyncio
+
+import pytest
+
+import src.main_async as main_async
+from src.github.async_client import AsyncGitHubClient
+from src.main_async import AsyncPRArbitrAgent
+
+
+class FakeAsyncGitHub:
+    """AsyncGitHubClient over a FakeGitHub's PRs and contents (set by the fixture)."""
+
+    full_name = staticmethod(AsyncGitHubClient.full_name)
+    github = None
+    max_in_flight = 0
+
+    def __init__(self, token, **kwargs):
+        self.in_flight = 0
+
+    def _pr(self, number):
+        return next(pr for pr in self.github.prs if pr.number == number)
+
+    async def close(self):
+        pass
+
+    async def fetch_open_prs(self, full_name, **kwargs):
+        return [
+            {
+                'number': pr.number,
+                'title': pr.title,
+                'updated_at': pr.updated_at.isoformat(),
+                'head_sha': pr.head.sha,
+                'head_ref': pr.head.ref,
+                'base_sha': pr.base.sha,
+                'labels': [],
+            }
+            for pr in self.github.prs
+        ]
+
+    async def get_pr_files(self, full_name, pr_number):
+        return [dict(f) for f in self._pr(pr_number).files]
+
+    async def get_changed_file_count(self, full_name, pr_number):
+        return len(self._pr(pr_number).files)
+
+    async def get_file_content(self, full_name, path, ref):
+        self.in_flight += 1
+        FakeAsyncGitHub.max_in_flight = max(FakeAsyncGitHub.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return self.github.get_file_content(None, path, ref)
+
+    async def get_tree_sha(self, full_name, path, ref):
+        return None
+
+    async def get_tree_paths(self, full_name, tree_sha):
+        return None
+
+    async def post_review(self, full_name, pr_number, decision, body):
+        self._pr(pr_number).create_review(body, decision)
+        return True
+
+    async def add_labels(self, full_name, pr_number, labels):
+        self._pr(pr_number).add_to_labels(*labels)
+
+    async def merge_pr(self, full_name, pr_number, **kwargs):
+        return True
+
+
+class FakeAsyncAI:
+    def __init__(self, **kwargs):
+        self.token_usage = 0
+        self.api_calls = 0
+        self.cache_hits = 0
+        self.tokens_saved = 0
+
+    async def complete_json(self, prompt, temperature=0.2):
+        self.api_calls += 1
+        self.token_usage += 10
+        return {'score': 80, 'summary': 'ok', 'issues': [], 'recommendation': 'APPROVE'}
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def async_io(github, monkeypatch):
+    monkeypatch.setattr(FakeAsyncGitHub, 'github', github)
+    monkeypatch.setattr(FakeAsyncGitHub, 'max_in_flight', 0)
+    monkeypatch.setattr(main_async, 'AsyncGitHubClient', FakeAsyncGitHub)
+    monkeypatch.setattr(main_async, 'AsyncAIClient', FakeAsyncAI)
+    return FakeAsyncGitHub
+
+
+def _decisions(agent):
+    return {r['pr_number']: (r['decision'], r['score']) for r in agent.state_repo.get_all_reviews()}
+
+
+def test_async_engine_matches_the_thread_engine(make_agent, github, async_io, tmp_path):
+    for number in range(5):
+        github.add_pr(number, n_files=4, bad=(0,) if number % 2 else ())
+    threaded = make_agent(ai=True)
+    threaded.run()
+    expected = _decisions(threaded)
+    threaded.close()
+    (tmp_path / 'state.json').unlink()
+    for pr in github.prs:
+        pr.reviews.clear()
+
+    agent = make_agent(ai=True, cls=AsyncPRArbitrAgent)
+    agent.run()
+
+    assert _decisions(agent) == expected
+    assert agent.metrics['prs_reviewed'] == 5
+    assert all(len(pr.reviews) == 1 for pr in github.prs)
+
+
+def test_async_engine_honours_max_prs(make_agent, github, async_io):
+    for number in range(6):
+        github.add_pr(number)
+    agent = make_agent(cls=AsyncPRArbitrAgent, concurrency=4)
+
+    agent.run(max_prs=2)
+
+    assert sum(1 for pr in github.prs if pr.reviews) == 2
+    assert agent.metrics['prs_reviewed'] == 2
+
+
+def test_async_engine_overlaps_file_fetches(make_agent, github, async_io):
+    github.add_pr(1, n_files=20)
+    agent = make_agent(cls=AsyncPRArbitrAgent)
+
+    agent.run()
+
+    assert agent.metrics['prs_reviewed'] == 1
+    assert async_io.max_in_flight > 1
@@ -0,0 +1,37 @@
+"""BodyScan facts and the structural checks that read them."""
+
+from src.review.checklist import BodyScan, ParsedDocument, _check_tables_well_formed
+
+BODY = """## Foo class
+
+| Name | Description |
+| --- | --- |
+| [Bar](/words/foo/bar/) | Bar method |
+
+### Remarks
+
+| A | B | C |
+| --- | --- | --- |
+uid: Foo.Bar
+| x | y | z |
+"""
+
+
+def test_lines_pass_records_table_runs_and_headings():
+    scan = BodyScan(BODY)
+
+    assert scan.table_runs == [[2, 2, 2], [3, 3], [3]]
+    assert scan.headings == ['Foo class', 'Remarks']
+    assert scan.has_h2 and scan.has_uid_line
+    assert scan.links == ['/words/foo/bar/']
+
+
+def test_tables_of_different_widths_are_well_formed():
+    assert _check_tables_well_formed(ParsedDocument(BODY))
+    assert _check_tables_well_formed(ParsedDocument('No tables here.\n'))
+
+
+def test_a_ragged_table_is_not_well_formed():
+    ragged = BODY.replace('| [Bar](/words/foo/bar/) | Bar method |', '| Bar | Bar method | extra |')
+
+    assert not _check_tables_well_formed(ParsedDocument(ragged))
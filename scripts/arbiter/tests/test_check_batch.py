@@ -0,0 +1,62 @@
+"""run_checks_batch() on worker processes matches run_checks()."""
+
+import pytest
+
+import src.review.checklist as checklist_module
+from conftest import ARBITER_DIR, BAD_PAGE, GOOD_PAGE, REPO_URL
+from src.review.checklist import load_checklist, run_checks, run_checks_batch
+
+CHECKLIST = load_checklist(str(ARBITER_DIR / 'config' / 'checklist.yaml'))
+
+
+def _files():
+    pages = [GOOD_PAGE, BAD_PAGE, GOOD_PAGE.replace('</code>', ''), GOOD_PAGE.replace('| Bar method |', '|')]
+    return [(pages[i % len(pages)], {'patch': '+x' * (i % 3)}) for i in range(12)]
+
+
+@pytest.mark.parametrize('workers', [1, 2, 3])
+def test_batch_matches_serial_checks(workers):
+    files = _files()
+    serial = [run_checks(content, CHECKLIST, context) for content, context in files]
+
+    assert run_checks_batch(files, CHECKLIST, workers=workers) == serial
+
+
+def test_batch_reads_paths_in_the_worker(tmp_path):
+    files = _files()[:4]
+    paths = []
+    for i, (content, context) in enumerate(files):
+        path = tmp_path / f'f{i}.md'
+        path.write_text(content, encoding='utf-8')
+        paths.append((path, context))
+
+    assert run_checks_batch(paths, CHECKLIST, workers=2) == [run_checks(c, CHECKLIST, ctx) for c, ctx in files]
+
+
+def test_batch_falls_back_in_process_when_workers_cannot_start(monkeypatch):
+    def broken(*args, **kwargs):
+        raise OSError('no processes')
+
+    monkeypatch.setattr(checklist_module, 'ProcessPoolExecutor', broken)
+    files = _files()[:5]
+
+    assert run_checks_batch(files, CHECKLIST, workers=4) == [run_checks(c, CHECKLIST, ctx) for c, ctx in files]
+    assert run_checks_batch([], CHECKLIST, workers=4) == []
+
+
+def test_large_pr_checked_on_workers_matches_inline(make_agent, github):
+    inline_pr = github.add_pr(1, n_files=6, bad=(1, 4))
+    inline = make_agent(parallel_checks={'enabled': False})
+    inline.run()
+    pooled_pr = github.add_pr(2, n_files=6, bad=(1, 4))
+    pooled = make_agent(parallel_checks={'enabled': True, 'min_files': 2, 'workers': 2})
+    pooled.run()
+
+    by_file = lambda agent, number: sorted(
+        (path.rsplit('/', 1)[1], r['static_score'], r['failed_checks'])
+        for path, r in agent.file_store.get(REPO_URL, number).items()
+    )
+    assert pooled._check_pool is not None
+    assert inline._check_pool is None
+    assert [e for e, _ in inline_pr.reviews] == [e for e, _ in pooled_pr.reviews]
+    assert by_file(inline, 1) == by_file(pooled, 2)
@@ -0,0 +1,43 @@
+"""check_dir CLI: exit codes and reports."""
+
+import json
+import xml.etree.ElementTree as ET
+
+from conftest import ARBITER_DIR, BAD_PAGE, GOOD_PAGE
+from src.review.check_dir import main
+
+CHECKLIST = str(ARBITER_DIR / 'config' / 'checklist.yaml')
+
+
+def _tree(root, bad=False):
+    (root / 'words' / 'foo').mkdir(parents=True)
+    (root / 'words' / 'foo' / '_index.md').write_text(GOOD_PAGE, encoding='utf-8')
+    (root / 'words' / 'foo' / 'bar.md').write_text(BAD_PAGE if bad else GOOD_PAGE, encoding='utf-8')
+    (root / 'words' / 'notes.txt').write_text('not markdown', encoding='utf-8')
+    return root
+
+
+def test_clean_directory_exits_0(tmp_path):
+    root = _tree(tmp_path / 'api')
+    report = tmp_path / 'out' / 'report.json'
+
+    assert main([str(root), '--checklist', CHECKLIST, '--workers', '1', '--json', str(report)]) == 0
+    data = json.loads(report.read_text())
+    assert data['files'] == 2 and data['passed']
+    assert sorted(r['path'] for r in data['results']) == ['words/foo/_index.md', 'words/foo/bar.md']
+
+
+def test_required_failure_exits_1_and_fails_its_junit_case(tmp_path):
+    root = _tree(tmp_path / 'api', bad=True)
+    junit = tmp_path / 'junit.xml'
+
+    assert main([str(root), '--checklist', CHECKLIST, '--workers', '2', '--junit', str(junit)]) == 1
+    suite = ET.parse(junit).getroot().find('testsuite')
+    assert (suite.get('tests'), suite.get('failures')) == ('2', '1')
+    failed = [case for case in suite.iter('testcase') if case.find('failure') is not None]
+    assert [(case.get('classname'), case.get('name')) for case in failed] == [('words.foo', 'bar.md')]
+    assert 'frontmatter_has_layout' in failed[0].find('failure').get('message')
+
+
+def test_missing_directory_exits_2(tmp_path):
+    assert main([str(tmp_path / 'missing'), '--checklist', CHECKLIST]) == 2
@@ -0,0 +1,73 @@
+"""CheckMatrix: scores, pack/unpack round-trip and AI re-scaling."""
+
+import numpy as np
+
+from src.review.check_matrix import REQUIRED_CAP, CheckMatrix
+
+CHECKS = [
+    {'id': 'frontmatter_present', 'weight': 40, 'type': 'required'},
+    {'id': 'tables_well_formed', 'weight': 30, 'type': 'recommended'},
+    {'id': 'code_examples_present', 'weight': 30, 'type': 'recommended'},
+]
+
+RESULTS = [
+    {'failed_checks': [], 'ai_result': {'score': 80, 'weighted_contribution': 16}},
+    {'failed_checks': ['tables_well_formed'], 'skipped_checks': ['code_examples_present'],
+     'ai_result': {'score': 55, 'weighted_contribution': 11}},
+    {'failed_checks': ['frontmatter_present'], 'timed_out_checks': ['frontmatter_present'],
+     'ai_result': {'score': 70, 'weighted_contribution': 14, 'estimated': True}},
+]
+
+
+def _matrix(results=RESULTS, checks=CHECKS, capacity=1):
+    matrix = CheckMatrix(checks, capacity=capacity)
+    for result in results:
+        matrix.add(result)
+    return matrix
+
+
+def test_static_scores_apply_the_required_cap():
+    matrix = _matrix()
+    assert matrix.static_scores().tolist() == [100, 40, min(60, REQUIRED_CAP)]
+    assert matrix.failed_anywhere() == ['frontmatter_present', 'tables_well_formed']
+
+
+def test_pack_unpack_round_trip():
+    matrix = _matrix()
+    restored = CheckMatrix.unpack(matrix.pack(), CHECKS)
+
+    assert len(restored) == len(matrix)
+    for name in ('failed', 'skipped', 'timed_out', 'ai_scores', 'ai_contributions', 'ai_estimated'):
+        np.testing.assert_array_equal(getattr(restored, name), getattr(matrix, name))
+    assert restored.pr_static_score() == matrix.pr_static_score()
+    assert restored.pr_ai_contribution() == matrix.pr_ai_contribution()
+
+
+def test_unpack_under_a_changed_checklist():
+    packed = _matrix().pack()
+    newer = [CHECKS[0], CHECKS[2], {'id': 'new_check', 'weight': 10, 'type': 'recommended'}]
+    restored = CheckMatrix.unpack(packed, newer)
+
+    assert restored.ids == ['frontmatter_present', 'code_examples_present', 'new_check']
+    # Dropped column ignored, new column passes everywhere
+    assert restored.failed.tolist() == [[False, False, False], [False, False, False], [True, False, False]]
+    assert restored.skipped[:, 1].tolist() == [False, True, False]
+
+
+def test_empty_pack_has_no_cell_matrices():
+    packed = _matrix(results=[{'failed_checks': []}]).pack()
+    assert packed == {'checks': [c['id'] for c in CHECKS], 'rows': 1}
+
+
+def test_scaled_ai_contributions():
+    matrix = _matrix()
+    assert matrix.scaled_ai_contributions(20).tolist() == [16, 11, 14]
+    # Evaluated files re-scale from their score, estimated ones proportionally
+    assert matrix.scaled_ai_contributions(40).tolist() == [32, 22, 28]
+    assert matrix.scaled_ai_contributions(10).tolist() == [8, 6, 7]
+    assert matrix.pr_ai_contribution(40) == round((32 + 22 + 28) / 3)
+
+
+def test_files_without_ai_contribute_nothing():
+    matrix = _matrix(results=[{'failed_checks': []}, RESULTS[0]])
+    assert matrix.scaled_ai_contributions(40).tolist() == [0, 32]
@@ -0,0 +1,41 @@
+"""check_timeout_ms: a runaway checker is stopped with outcome 'timeout'."""
+
+import time
+
+import pytest
+
+from conftest import GOOD_PAGE
+from src.review.checklist import run_checks, run_checks_batch
+
+# Catastrophic backtracking: exponential in the run of 'a's
+PAGE = GOOD_PAGE + '\n' + 'a' * 40 + '!\n'
+
+
+def _checklist(check_type, timeout_ms=50):
+    return {
+        'check_timeout_ms': timeout_ms,
+        'checks': [
+            {'id': 'frontmatter_present', 'description': 'fm', 'weight': 60, 'type': 'required'},
+            {'id': 'no_runaway', 'description': 'runaway', 'weight': 20, 'type': check_type,
+             'pattern': r'(a+)+$', 'scope': 'body', 'must_not_match': True},
+        ],
+    }
+
+
+@pytest.mark.parametrize('check_type, score', [('recommended', 60), ('required', 49)])
+def test_runaway_check_times_out(check_type, score):
+    started = time.monotonic()
+    got, results = run_checks(PAGE, _checklist(check_type))
+
+    assert time.monotonic() - started < 5
+    assert [(r['id'], r['outcome'], r['passed']) for r in results] == [
+        ('frontmatter_present', 'pass', True),
+        ('no_runaway', 'timeout', False),
+    ]
+    assert got == score
+
+
+def test_checks_on_worker_processes_are_bounded_too():
+    results = run_checks_batch([(PAGE, None), (GOOD_PAGE, None)], _checklist('recommended'), workers=2)
+
+    assert [r[1][1]['outcome'] for r in results] == ['timeout', 'pass']
@@ -0,0 +1,52 @@
+"""Checkpoints of reviews under way (FileResultStore 'checkpoints' table)."""
+
+from conftest import REPO_URL
+from src.state.file_results import FileResultStore
+
+
+def _record(score):
+    return {'sha': 's', 'checklist': 'c', 'stratum': 'x', 'static_score': score, 'failed_checks': []}
+
+
+def test_checkpoint_writes_merge_per_file(tmp_path):
+    store = FileResultStore(str(tmp_path / 'fr.sqlite'))
+    store.save_checkpoint(REPO_URL, 1, 'h1', {'a.md': _record(90), 'b.md': _record(80)})
+    store.save_checkpoint(REPO_URL, 1, 'h1', {'b.md': {**_record(80), 'ai_result': {'score': 70}}})
+    store.save_checkpoint(REPO_URL, 2, 'h1', {'c.md': _record(10)})
+
+    checkpoint = store.get_checkpoint(REPO_URL, 1, 'h1')
+
+    assert sorted(checkpoint) == ['a.md', 'b.md']
+    assert checkpoint['b.md']['ai_result'] == {'score': 70}
+    assert store.get_checkpoint(REPO_URL, 1, 'other') == {}
+    store.close()
+
+
+def test_checkpoint_at_a_new_head_replaces_the_old_one(tmp_path):
+    store = FileResultStore(str(tmp_path / 'fr.sqlite'))
+    store.save_checkpoint(REPO_URL, 1, 'h1', {'a.md': _record(90), 'b.md': _record(80)})
+    store.save_checkpoint(REPO_URL, 1, 'h2', {'b.md': _record(50)})
+
+    assert store.get_checkpoint(REPO_URL, 1, 'h1') == {}
+    assert store.get_checkpoint(REPO_URL, 1, 'h2') == {'b.md': _record(50)}
+
+    store.clear_checkpoint(REPO_URL, 1)
+    assert store.get_checkpoint(REPO_URL, 1, 'h2') == {}
+    store.close()
+
+
+def test_interrupted_review_resumes_from_its_checkpoint(make_agent, github):
+    pr = github.add_pr(1, n_files=5, bad=(3,))
+    first = make_agent(ai=True, skip_ai_when_decided=False, checkpoint={'enabled': True, 'batch_files': 2})
+    job = first._new_job('o/r', pr, 'p', REPO_URL, first._blank_product_metrics())
+    for stage in ('fetch', 'checks', 'ai'):
+        job = getattr(first, f'_stage_{stage}')(job)  # the run dies before deciding
+    assert len(first.file_store.get_checkpoint(REPO_URL, 1, 'sha1')) == 5
+
+    second = make_agent(ai=True, skip_ai_when_decided=False, checkpoint={'enabled': True, 'batch_files': 2})
+    second.run()
+
+    assert second.metrics['files_resumed'] == 5
+    assert second.ai_client.api_calls == 0
+    assert [event for event, _ in pr.reviews] == ['REQUEST_CHANGES']
+    assert second.file_store.get_checkpoint(REPO_URL, 1, 'sha1') == {}
@@ -0,0 +1,66 @@
+"""Concurrent PR review workers (review.concurrency)."""
+
+import threading
+
+import pytest
+
+from conftest import REPO_URL
+
+
+@pytest.mark.parametrize('max_prs', [1, 3, 5])
+def test_max_prs_is_exact_with_parallel_workers(make_agent, github, max_prs):
+    for number in range(10):
+        github.add_pr(number)
+    agent = make_agent(concurrency=4)
+
+    agent.run(max_prs=max_prs)
+
+    assert sum(1 for pr in github.prs if pr.reviews) == max_prs
+    assert agent.metrics['prs_reviewed'] == max_prs
+
+
+def test_parallel_workers_count_every_pr_once(make_agent, github):
+    for number in range(8):
+        github.add_pr(number, bad=(1,) if number % 3 == 0 else ())
+    agent = make_agent(concurrency=4)
+
+    agent.run()
+
+    assert agent.metrics['prs_found'] == 8
+    assert agent.metrics['prs_reviewed'] == 8
+    assert agent.metrics['approved'] == 5
+    assert agent.metrics['request_changes'] + agent.metrics['rejected'] == 3
+    assert agent.metrics['errors'] == 0
+    assert all(len(pr.reviews) == 1 for pr in github.prs)
+
+
+def test_incr_is_thread_safe(make_agent):
+    agent = make_agent()
+    product_metrics = {'files_reviewed': 0}
+
+    def bump():
+        for _ in range(5000):
+            agent._incr('prs_reviewed', agent.metrics)
+            agent._incr('files_reviewed', product_metrics)
+
+    workers = [threading.Thread(target=bump) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert agent.metrics['prs_reviewed'] == 40000
+    assert product_metrics['files_reviewed'] == 40000
+
+
+def test_skipped_prs_are_not_counted_against_max_prs(make_agent, github):
+    for number in range(6):
+        github.add_pr(number)
+    agent = make_agent(concurrency=3)
+    agent.state_repo.save_review(REPO_URL, 0, 'p', 'APPROVE', 90, 'x')
+    agent.state_repo.save_review(REPO_URL, 1, 'p', 'APPROVE', 90, 'x')
+
+    agent.run(max_prs=3)
+
+    assert [pr.number for pr in github.prs if pr.reviews] == [2, 3, 4]
+    assert agent.metrics['prs_skipped'] == 2
@@ -0,0 +1,103 @@
+"""Decision rules: score thresholds and decisions the AI cannot change."""
+
+import pytest
+
+from src.review.aggregator import ReviewAggregator
+from src.review.decision import MAX_COMMENT_CHARS, build_review_comment, decision_if_fixed, score_to_decision
+
+THRESHOLDS = {'approve': 70, 'request_changes': 40}
+
+
+@pytest.mark.parametrize('total, decision', [
+    (100, 'APPROVE'), (70, 'APPROVE'), (69, 'REQUEST_CHANGES'), (40, 'REQUEST_CHANGES'), (39, 'REJECT'),
+])
+def test_score_to_decision(total, decision):
+    assert score_to_decision(total, THRESHOLDS) == decision
+
+
+@pytest.mark.parametrize('static_score, fixed', [
+    (100, 'APPROVE'),          # already at the cap
+    (70, 'APPROVE'),           # AI can only add points
+    (49, 'REQUEST_CHANGES'),   # capped required failure: 49 + 20 < 70
+    (50, None),                # 50 + 20 reaches approve
+    (30, None),                # 30 + 20 reaches request_changes
+    (19, 'REJECT'),            # 19 + 20 < 40
+])
+def test_decision_if_fixed(static_score, fixed):
+    assert decision_if_fixed(static_score, 20, THRESHOLDS) == fixed
+
+
+def test_ai_is_skipped_when_the_static_score_fixes_the_decision(make_agent, github):
+    github.add_pr(1)
+    github.add_pr(2, bad=(0,))
+    agent = make_agent(ai=True)
+
+    agent.run()
+
+    assert agent.ai_client.api_calls == 0
+    assert agent.metrics['ai_prs_skipped'] == 2
+    assert agent.metrics['ai_files_skipped'] == 6
+    assert [pr.reviews[0][0] for pr in github.prs] == ['APPROVE', 'REQUEST_CHANGES']
+
+
+def test_ai_runs_when_it_can_change_the_decision(make_agent, github):
+    github.add_pr(1, bad=(0,))  # static 49: REJECT without AI, REQUEST_CHANGES with it
+    agent = make_agent(ai=True, score_thresholds={'approve': 70, 'request_changes': 60})
+
+    agent.run()
+
+    assert agent.ai_client.api_calls > 0
+    assert agent.metrics['ai_prs_skipped'] == 0
+    assert github.prs[0].reviews[0][0] == 'REQUEST_CHANGES'
+
+
+def test_skip_can_be_turned_off(make_agent, github):
+    github.add_pr(1)
+    agent = make_agent(ai=True, skip_ai_when_decided=False)
+
+    agent.run()
+
+    assert agent.ai_client.api_calls > 0
+    assert agent.metrics['ai_prs_skipped'] == 0
+
+
+def _summary(files, issue_chars, failing_files=25):
+    aggregator = ReviewAggregator(
+        [{'id': 'opt', 'description': 'Optional thing', 'type': 'optional', 'weight': 80}],
+        failing_files=failing_files,
+    )
+    for n in range(files):
+        aggregator.add({
+            'path': f'content/p/en/f{n}.md',
+            'stratum': 'type/small',
+            'failed_checks': ['opt'],
+            'ai_result': {'score': 50, 'weighted_contribution': 10, 'issues': [f'{n} ' + 'x' * issue_chars]},
+        })
+    return aggregator.summary()
+
+
+def test_comment_lists_every_sampled_failing_file_when_it_fits():
+    body = build_review_comment('REJECT', 10, _summary(30, 100), THRESHOLDS)
+
+    assert len(body) <= MAX_COMMENT_CHARS
+    assert 'content/p/en/f24.md' in body
+    assert 'content/p/en/f25.md' not in body  # failing_files sample of 25
+
+
+def test_comment_lists_fewer_files_to_fit_the_limit():
+    body = build_review_comment('REJECT', 10, _summary(200, 2000, failing_files=200), THRESHOLDS)
+
+    assert len(body) <= MAX_COMMENT_CHARS
+    assert 'content/p/en/f0.md' in body
+    assert 'content/p/en/f199.md' not in body
+
+
+def test_comment_is_truncated_when_even_the_head_is_too_long():
+    summary = _summary(1, 10)
+    summary['ai_summary'] = 'y' * (MAX_COMMENT_CHARS * 2)
+    summary['ai_skipped'] = True
+
+    body = build_review_comment('REJECT', 10, summary, THRESHOLDS)
+
+    assert len(body) == MAX_COMMENT_CHARS
+    assert body.endswith("*…comment truncated to fit GitHub's size limit.*")
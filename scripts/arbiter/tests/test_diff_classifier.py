@@ -0,0 +1,67 @@
+"""classify_patch(): trivial diff kinds and a structural change."""
+
+import pytest
+
+from src.review.diff_classifier import classify_patch
+
+VERSION_STAMP = (
+    "@@ -10,3 +10,3 @@\n"
+    " ## Requirements\n"
+    "-Assembly: Aspose.Words.dll (24.1.0)\n"
+    "+Assembly: Aspose.Words.dll (24.2.0)\n"
+    " \n"
+)
+
+WHITESPACE = (
+    "@@ -20,3 +20,4 @@\n"
+    " Some text\n"
+    "-| a | b |\n"
+    "+|  a  |  b  |\n"
+    "+\n"
+    " More text\n"
+)
+
+FRONTMATTER = (
+    "@@ -1,5 +1,5 @@\n"
+    " ---\n"
+    " title: Document\n"
+    "-description: Old description\n"
+    "+description: New description\n"
+    " weight: 10\n"
+)
+
+STRUCTURAL = (
+    "@@ -30,3 +30,3 @@\n"
+    " ## Methods\n"
+    "-| [Save](./save/) | Saves the document. |\n"
+    "+| [Save](./save/) | Saves the document to a stream. |\n"
+    " \n"
+)
+
+
+@pytest.mark.parametrize('patch, kind', [
+    (VERSION_STAMP, 'version_stamp'),
+    (WHITESPACE, 'whitespace'),
+    (FRONTMATTER, 'frontmatter'),
+])
+def test_trivial_kinds(patch, kind):
+    assert classify_patch(patch) == kind
+
+
+def test_structural_change_is_not_trivial():
+    assert classify_patch(STRUCTURAL) is None
+
+
+def test_file_takes_its_most_significant_kind():
+    assert classify_patch(VERSION_STAMP + WHITESPACE) == 'whitespace'
+    assert classify_patch(VERSION_STAMP + STRUCTURAL) is None
+
+
+def test_only_the_enabled_kinds_are_recognised():
+    assert classify_patch(FRONTMATTER, kinds=('version_stamp', 'whitespace')) is None
+    assert classify_patch(VERSION_STAMP, kinds=('version_stamp',)) == 'version_stamp'
+
+
+def test_no_patch():
+    assert classify_patch(None) is None
+    assert classify_patch('') is None
@@ -0,0 +1,38 @@
+"""_split_batch_result(): batched AI responses split back into per-file results."""
+
+from src.review.evaluator import _split_batch_result
+
+CHECKLIST = {'ai_evaluation': {'weight': 20}}
+DOCUMENTS = [('a.md', 'A'), ('b.md', 'B'), ('c.md', 'C')]
+
+
+def test_results_by_path():
+    raw = {'results': [{'path': 'a.md', 'score': 50}, {'path': 'b.md', 'score': 100}]}
+    found = _split_batch_result(raw, DOCUMENTS, CHECKLIST)
+    assert set(found) == {'a.md', 'b.md'}
+    assert found['a.md']['weighted_contribution'] == 10
+    assert found['b.md']['weighted_contribution'] == 20
+
+
+def test_bare_array_is_accepted():
+    found = _split_batch_result([{'path': 'c.md', 'score': 80}], DOCUMENTS, CHECKLIST)
+    assert list(found) == ['c.md']
+
+
+def test_malformed_elements_are_dropped():
+    raw = {'results': [
+        'not an object',
+        {'path': 'a.md'},                       # no score
+        {'path': 'elsewhere.md', 'score': 90},  # not in the batch
+        {'path': 'b.md', 'score': 40},
+        {'path': 'b.md', 'score': 99},          # repeated path: first wins
+    ]}
+    found = _split_batch_result(raw, DOCUMENTS, CHECKLIST)
+    assert list(found) == ['b.md']
+    assert found['b.md']['score'] == 40
+
+
+def test_response_without_a_result_array():
+    assert _split_batch_result({'score': 80}, DOCUMENTS, CHECKLIST) == {}
+    assert _split_batch_result({'results': 'nope'}, DOCUMENTS, CHECKLIST) == {}
+    assert _split_batch_result(None, DOCUMENTS, CHECKLIST) == {}
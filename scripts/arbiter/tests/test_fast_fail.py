@@ -0,0 +1,44 @@
+"""fast_fail: skip recommended checks once a file's score is fixed at the cap."""
+
+import pytest
+
+from conftest import ARBITER_DIR, BAD_PAGE, GOOD_PAGE
+from src.review.checklist import load_checklist, run_checks
+
+CHECKLIST = load_checklist(str(ARBITER_DIR / 'config' / 'checklist.yaml'))
+FAST = dict(CHECKLIST, fast_fail=True)
+
+PAGES = [
+    GOOD_PAGE,
+    BAD_PAGE,
+    BAD_PAGE.replace('</code>', ''),
+    BAD_PAGE.replace('| Bar method |', '|'),
+    'no frontmatter at all\n',
+]
+
+
+@pytest.mark.parametrize('page', PAGES)
+def test_fast_fail_keeps_score_and_evaluated_outcomes(page):
+    score, results = run_checks(page, CHECKLIST, {'patch': ''})
+    fast_score, fast_results = run_checks(page, FAST, {'patch': ''})
+
+    assert fast_score == score
+    assert [r['id'] for r in fast_results] == [r['id'] for r in results]
+    for full, fast in zip(results, fast_results):
+        if fast['outcome'] != 'skipped':
+            assert fast['outcome'] == full['outcome']
+        else:
+            assert fast['type'] != 'required' and not fast['passed']
+
+
+def test_capped_file_skips_recommended_checks():
+    _, results = run_checks(BAD_PAGE, FAST, {'patch': ''})
+
+    assert any(r['outcome'] == 'skipped' for r in results)
+    assert all(r['outcome'] != 'skipped' for r in run_checks(BAD_PAGE, CHECKLIST, {'patch': ''})[1])
+
+
+def test_passing_file_runs_every_check():
+    _, results = run_checks(GOOD_PAGE, FAST, {'patch': ''})
+
+    assert all(r['outcome'] in ('pass', 'fail') for r in results)
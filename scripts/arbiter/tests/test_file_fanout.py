@@ -0,0 +1,52 @@
+"""Per-file fan-out (review.file_fanout) and the agent lifecycle across runs."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.main import PRArbitrAgent
+
+from conftest import REPO_URL
+
+FANOUT = {'enabled': True, 'github_workers': 4, 'ai_workers': 2}
+
+
+def test_map_files_preserves_order():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert PRArbitrAgent._map_files(pool, lambda n: n * n, list(range(50))) == [n * n for n in range(50)]
+    assert PRArbitrAgent._map_files(None, str, [1, 2]) == ['1', '2']
+
+
+def _decisions(agent):
+    return {r['pr_number'] % 10: (r['decision'], r['score']) for r in agent.state_repo.get_all_reviews()}
+
+
+def test_fanout_gives_the_serial_decisions(make_agent, github):
+    for number in range(4):
+        github.add_pr(number, n_files=6, bad=(2,) if number % 2 else ())
+    serial = make_agent(ai=True)
+    serial.run()
+    expected = _decisions(serial)
+    serial.close()
+
+    github.prs.clear()
+    for number in range(10, 14):
+        github.add_pr(number, n_files=6, bad=(2,) if number % 2 else ())
+    fanned = make_agent(ai=True, file_fanout=FANOUT)
+    fanned.state_repo.reviews.truncate()
+    fanned.run()
+
+    assert _decisions(fanned) == expected
+    assert fanned.metrics['prs_reviewed'] == 4
+
+
+def test_agent_runs_again_until_closed(make_agent, github):
+    github.add_pr(1)
+    agent = make_agent(file_fanout=FANOUT)
+    agent.run()
+
+    github.add_pr(2)
+    agent.run()
+
+    assert agent.metrics['prs_reviewed'] == 1
+    assert agent.metrics['errors'] == 0
+    assert agent.state_repo.get_review(REPO_URL, 2) is not None
+    assert all(len(pr.reviews) == 1 for pr in github.prs)
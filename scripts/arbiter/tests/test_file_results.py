@@ -0,0 +1,82 @@
+"""FileResultStore and incremental re-review."""
+
+import pytest
+
+from src.state.file_results import FileResultStore
+
+from conftest import BAD_PAGE, REPO_URL
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FileResultStore(str(tmp_path / 'file_results.sqlite'))
+    yield store
+    store.close()
+
+
+def _record(score):
+    return {'sha': f'blob{score}', 'static_score': score, 'failed_checks': []}
+
+
+def test_save_replaces_a_prs_results(store):
+    store.save(REPO_URL, 1, {'a.md': _record(1), 'b.md': _record(2)}, approved=False)
+    store.save(REPO_URL, 1, {'a.md': _record(3)}, approved=False)
+
+    assert store.get(REPO_URL, 1) == {'a.md': _record(3)}
+    assert store.get(REPO_URL, 2) == {}
+
+
+def test_known_good_is_the_latest_approved_verdict(store):
+    store.save(REPO_URL, 1, {'a.md': _record(1), 'b.md': _record(1)}, approved=True)
+    store.save(REPO_URL, 2, {'a.md': _record(2)}, approved=True)
+    store.save(REPO_URL, 3, {'a.md': _record(3), 'c.md': _record(3)}, approved=False)
+
+    assert store.get_known_good(REPO_URL, ['a.md', 'b.md', 'c.md']) == {'a.md': _record(2), 'b.md': _record(1)}
+    assert store.get_known_good(REPO_URL, ['a.md'], exclude_pr=2) == {'a.md': _record(1)}
+    assert store.get_known_good('https://github.com/o/other', ['a.md']) == {}
+
+
+def test_prune_keeps_open_prs_and_the_latest_approved_verdicts(store):
+    store.save(REPO_URL, 1, {'a.md': _record(1), 'b.md': _record(1)}, approved=True)
+    store.save(REPO_URL, 2, {'a.md': _record(2)}, approved=True)
+    store.save(REPO_URL, 3, {'c.md': _record(3)}, approved=False)
+    store.save(REPO_URL, 4, {'d.md': _record(4)}, approved=False)
+
+    assert store.prune(REPO_URL, [4]) == 2  # PR 1's a.md (superseded), PR 3 (not approved)
+
+    assert store.get(REPO_URL, 1) == {'b.md': _record(1)}
+    assert store.get(REPO_URL, 2) == {'a.md': _record(2)}
+    assert store.get(REPO_URL, 3) == {}
+    assert store.get(REPO_URL, 4) == {'d.md': _record(4)}
+
+
+def test_re_review_checks_only_changed_files(make_agent, github):
+    pr = github.add_pr(1, n_files=5)
+    agent = make_agent()
+    agent.run()
+    github.fetched.clear()
+
+    pr.head.sha = 'sha1-fixup'
+    pr.files[3]['sha'] = 'blob-changed'
+    github.contents[pr.files[3]['path']] = BAD_PAGE
+    agent.run()
+
+    assert github.fetched == [pr.files[3]['path']]
+    assert agent.metrics['files_reused'] == 4
+    assert pr.reviews[-1][0] == 'REQUEST_CHANGES'
+    assert agent.state_repo.get_review(REPO_URL, 1)['head_sha'] == 'sha1-fixup'
+
+
+def test_results_of_closed_prs_are_pruned(make_agent, github):
+    github.add_pr(1)
+    github.add_pr(2, bad=(0,))
+    agent = make_agent()
+    agent.run()
+
+    github.prs.clear()
+    github.add_pr(3)
+    agent.run()
+
+    assert agent.file_store.get(REPO_URL, 2) == {}  # not approved
+    assert len(agent.file_store.get(REPO_URL, 1)) == 3  # latest approved verdicts
+    assert len(agent.file_store.get(REPO_URL, 3)) == 3
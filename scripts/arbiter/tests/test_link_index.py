@@ -0,0 +1,116 @@
+"""LinkIndex.unresolved(): internal links against the PR's page index."""
+
+import asyncio
+import types
+
+import httpx
+
+import src.main as main_module
+from src.github.async_client import AsyncGitHubClient
+from src.github.pr_fetcher import get_tree_paths
+from src.review.link_index import LinkIndex, tree_urls
+
+ROOT = 'content/reference.aspose.net/words/en/'
+SOURCE = ROOT + 'Aspose.Words/Document.md'
+
+
+def _index():
+    index = LinkIndex()
+    index.add_tree('words', tree_urls('words', [
+        '_index.md', 'Aspose.Words/_index.md', 'Aspose.Words/Document.md', 'Aspose.Words/Old.md', 'images/x.png',
+    ]))
+    index.add_pr_files([
+        {'path': ROOT + 'Aspose.Words/New.md', 'status': 'added'},
+        {'path': ROOT + 'Aspose.Words/Old.md', 'status': 'removed'},
+    ])
+    return index
+
+
+def test_unresolved_links_with_line_numbers():
+    content = '\n'.join([
+        '# Document',
+        '[ok](/words/aspose.words/document/)',
+        '[added](/words/aspose.words/new/) [removed](/words/aspose.words/old/)',
+        '[missing](../missing/)',
+        '[sibling file](New.md#ctor) [image](/words/images/x.png)',
+    ])
+    count, links = _index().unresolved(content, SOURCE)
+    assert count == 2
+    assert links == [
+        {'line': 3, 'link': '/words/aspose.words/old/'},
+        {'line': 4, 'link': '../missing/'},
+    ]
+
+
+def test_out_of_scope_links_are_not_judged():
+    content = '\n'.join([
+        '[external](https://example.com/x/)',
+        '[anchor](#section)',
+        '[other family](/cells/nope/)',
+        '```',
+        '[in code](/words/nope/)',
+        '```',
+    ])
+    assert _index().unresolved(content, SOURCE) == (0, [])
+
+
+def test_count_is_exact_beyond_the_listed_links(monkeypatch):
+    from src.review import link_index
+    monkeypatch.setattr(link_index, 'MAX_LINKS_PER_FILE', 2)
+    content = '\n'.join(f'[x](/words/missing{i}/)' for i in range(5))
+    count, links = _index().unresolved(content, SOURCE)
+    assert count == 5
+    assert len(links) == 2
+
+
+# ── Git trees ─────────────────────────────────────────────────────────────────
+
+class _Tree:
+    def __init__(self, paths, truncated=False):
+        self.tree = [types.SimpleNamespace(path=p, type='blob') for p in paths]
+        self.truncated = truncated
+
+
+class _Repo:
+    def __init__(self, truncated):
+        self.truncated = truncated
+        self.calls = 0
+
+    def get_git_tree(self, sha, recursive=False):
+        self.calls += 1
+        return _Tree(['_index.md', 'Aspose.Words/_index.md'], self.truncated)
+
+
+def test_truncated_tree_is_not_used():
+    assert get_tree_paths(_Repo(truncated=False), 't1') == ['_index.md', 'Aspose.Words/_index.md']
+    assert get_tree_paths(_Repo(truncated=True), 't1') is None
+
+
+def test_async_truncated_tree_is_not_used():
+    def handler(request):
+        return httpx.Response(200, json={'truncated': True, 'tree': [{'path': 'a.md', 'type': 'blob'}]})
+
+    async def fetch():
+        client = AsyncGitHubClient('t')
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(base_url='https://api.github.com', transport=httpx.MockTransport(handler))
+        try:
+            return await client.get_tree_paths('o/r', 't1')
+        finally:
+            await client.close()
+
+    assert asyncio.run(fetch()) is None
+
+
+def test_truncated_tree_is_not_cached_or_judged(make_agent, github, monkeypatch):
+    monkeypatch.setattr(main_module, 'get_tree_sha', lambda repo, directory, ref: 'tree1')
+    agent = make_agent()
+    repo = _Repo(truncated=True)
+    pr_files = [{'path': SOURCE, 'status': 'modified'}]
+
+    for _ in range(2):
+        index = agent._build_link_index(repo, 'base0', pr_files)
+        assert index.resolve('/words/aspose.words/missing/', SOURCE) is None
+
+    assert repo.calls == 2  # fetched again, never served from the tree cache
+    assert agent.tree_cache.get('tree1') is None
@@ -0,0 +1,70 @@
+"""Declarative pattern checks: one PatternSet scan per scope."""
+
+import re
+
+import pytest
+
+from src.review.checklist import ParsedDocument, PatternSet, pattern_checks, run_checks
+
+DOC = "---\ntitle: Foo Bar\n---\nSee abc here.\nTODO: fill in\n"
+
+
+def _check(check_id, pattern, **options):
+    return {'id': check_id, 'description': '', 'weight': 1, 'type': 'recommended',
+            'pattern': pattern, **options}
+
+
+def test_each_check_answered_as_its_own_search():
+    checks = [
+        _check('ab', 'ab'),
+        _check('bc', 'bc'),            # overlaps the 'ab' match
+        _check('todo', r'\btodo\b', ignore_case=True),
+        _check('absent', 'zzz'),
+    ]
+    patterns = PatternSet('body', None, checks)
+    assert patterns.scan(ParsedDocument(DOC)) == {'ab', 'bc', 'todo'}
+
+
+def test_no_match_and_missing_scope_text():
+    patterns = PatternSet('field', 'summary', [_check('summary_x', 'x', scope='field', field='summary')])
+    assert patterns.scan(ParsedDocument(DOC)) == frozenset()
+    assert PatternSet('body', None, [_check('q', 'q')]).scan(ParsedDocument(DOC)) == frozenset()
+
+
+def test_must_not_match_and_field_scope():
+    checklist = {'checks': [
+        _check('no_todo', 'TODO', must_not_match=True),
+        _check('title_foo', ['^Foo', '^Baz'], scope='field', field='title'),
+        _check('frontmatter_bar', 'Bar', scope='frontmatter'),
+    ]}
+    _, results = run_checks(DOC, checklist)
+    assert {r['id']: r['passed'] for r in results} == {
+        'no_todo': False, 'title_foo': True, 'frontmatter_bar': True,
+    }
+
+
+def test_builtin_pattern_check_needs_only_its_id():
+    checklist = {'checks': [{'id': 'no_placeholder_text', 'description': '', 'weight': 5, 'type': 'recommended'}]}
+    assert run_checks(DOC, checklist)[0] == 0
+    assert run_checks(DOC.replace('TODO', 'Note'), checklist)[0] == 5
+
+
+def test_scan_matches_re_search():
+    texts = ['', 'abc', 'cab ba', 'xxy b', 'ABC\nc', 'b' * 5]
+    checks = [_check(f'c{i}', p) for i, p in enumerate(['ab', 'b', 'abc', 'c$', 'x*y', 'ba?'])]
+    patterns = PatternSet('content', None, checks)
+    for text in texts:
+        expected = {c['id'] for c in checks if re.search(c['pattern'], text)}
+        assert patterns.scan(ParsedDocument(text)) == expected, text
+
+
+@pytest.mark.parametrize('spec', [
+    {'pattern': '(a)\\1'},
+    {'pattern': '(?P<name>a)'},
+    {'pattern': '('},
+    {'pattern': 'a', 'scope': 'nowhere'},
+    {'pattern': 'a', 'scope': 'field'},
+])
+def test_invalid_pattern_checks_fail_the_load(spec):
+    with pytest.raises(ValueError):
+        pattern_checks({'checks': [{'id': 'bad', **spec}]})
@@ -0,0 +1,96 @@
+"""StagedPipeline and the staged review (review.pipeline)."""
+
+import threading
+
+from src.utils.pipeline import StagedPipeline
+
+
+def _run(stages, items, queue_size=2):
+    done = []
+    lock = threading.Lock()
+
+    def on_done(item, finished):
+        with lock:
+            done.append((item, finished))
+
+    errors = []
+    pipeline = StagedPipeline(
+        stages, queue_size=queue_size, on_done=on_done,
+        on_error=lambda item, stage, exc: errors.append((item, stage, str(exc))),
+    )
+    pipeline.start()
+    for item in items:
+        pipeline.submit(item)
+    pipeline.close()
+    return pipeline, done, errors
+
+
+def _fail_on_three(n):
+    if n == 3:
+        raise ValueError('three')
+    return n
+
+
+def test_every_item_leaves_once_and_close_drains_all_stages():
+    pipeline, done, errors = _run(
+        [
+            ('double', lambda n: n * 2, 2),
+            ('drop', lambda n: None if n % 4 else n, 3),
+            ('plus_one', lambda n: n + 1, 1),
+        ],
+        range(20),
+    )
+
+    assert sorted(item for item, finished in done if finished) == [n * 2 + 1 for n in range(0, 20, 2)]
+    assert sum(1 for _, finished in done if not finished) == 10
+    assert errors == []
+    assert all(not t.is_alive() for stage in pipeline._stages for t in stage.threads)
+
+
+def test_stats_count_processed_dropped_and_errors():
+    pipeline, done, errors = _run(
+        [('check', _fail_on_three, 2), ('drop_even', lambda n: n if n % 2 else None, 1)],
+        range(6),
+    )
+
+    check, drop_even = pipeline.stats()
+    assert (check['stage'], check['workers']) == ('check', 2)
+    assert (check['processed'], check['dropped'], check['errors']) == (5, 0, 1)
+    assert (drop_even['processed'], drop_even['dropped'], drop_even['errors']) == (2, 3, 0)
+    assert errors == [(3, 'check', 'three')]
+    assert pipeline.submitted == 6
+    assert len(done) == 6
+    assert all(row['max_queue'] <= 2 for row in (check, drop_even))
+
+
+def test_bounded_queues_apply_backpressure():
+    release = threading.Event()
+    pipeline = StagedPipeline(
+        [('slow', lambda n: release.wait() and n, 1)],
+        queue_size=1, on_done=lambda item, finished: None,
+    )
+    pipeline.start()
+    feeder = threading.Thread(target=lambda: [pipeline.submit(n) for n in range(4)])
+    feeder.start()
+    feeder.join(timeout=0.2)
+
+    assert feeder.is_alive()  # blocked on the full first queue
+    release.set()
+    feeder.join()
+    pipeline.close()
+    assert pipeline.stats()[0]['processed'] == 4
+
+
+def test_staged_review_matches_the_worker_pool(make_agent, github):
+    for number in range(6):
+        github.add_pr(number, bad=(0,) if number % 3 == 0 else ())
+    agent = make_agent(ai=True, pipeline={'enabled': True, 'queue_size': 1, 'workers': {'checks': 2}})
+
+    agent.run(max_prs=4)
+
+    assert agent.metrics['prs_reviewed'] == 4
+    assert sum(1 for pr in github.prs if pr.reviews) == 4
+    assert agent.metrics['request_changes'] + agent.metrics['rejected'] == 2
+    (stats,) = agent.pipeline_stats
+    assert [row['stage'] for row in stats['stages']] == ['fetch', 'checks', 'ai', 'decide', 'publish', 'persist']
+    assert stats['stages'][-1]['processed'] == 4
@@ -0,0 +1,49 @@
+"""What-if rescoring: replay_review() over stored review records."""
+
+from src.tools.rescore import replay_review, rescore
+
+
+def _reviewed(make_agent, github):
+    github.add_pr(1, n_files=4)
+    github.add_pr(2, n_files=4, bad=(2,))
+    agent = make_agent(ai=True, skip_ai_when_decided=False)
+    agent.run()
+    return agent
+
+
+def _settings(agent):
+    return agent.checklist['checks'], agent.thresholds, agent.checklist['ai_evaluation'].get('weight', 20)
+
+
+def test_replay_under_the_same_settings_reproduces_each_review(make_agent, github):
+    agent = _reviewed(make_agent, github)
+    reviews = agent.state_repo.get_all_reviews()
+
+    replays = [replay_review(review, *_settings(agent)) for review in reviews]
+
+    assert len(replays) == 2
+    for replay in replays:
+        assert (replay['decision'], replay['score']) == (replay['old_decision'], replay['old_score'])
+        assert replay['files'] == 4
+    assert rescore(reviews, *_settings(agent))['flipped'] == 0
+
+
+def test_stricter_threshold_flips_the_approval(make_agent, github):
+    agent = _reviewed(make_agent, github)
+    checks, thresholds, ai_weight = _settings(agent)
+
+    summary = rescore(agent.state_repo.get_all_reviews(), checks, dict(thresholds, approve=101), ai_weight)
+
+    assert summary['flipped'] == 1
+    assert [(f['pr_number'], f['old_decision'], f['decision']) for f in summary['flips']] == [
+        (1, 'APPROVE', 'REQUEST_CHANGES'),
+    ]
+
+
+def test_review_without_stored_outcomes_is_not_replayed(make_agent, github):
+    agent = _reviewed(make_agent, github)
+    review = dict(agent.state_repo.get_all_reviews()[0])
+    del review['check_matrix']
+
+    assert replay_review(review, *_settings(agent)) is None
+    assert rescore([review], *_settings(agent))['without_outcomes'] == 1
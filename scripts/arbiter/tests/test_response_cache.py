@@ -0,0 +1,61 @@
+"""ResponseCache: TTL expiry and least-recently-used eviction."""
+
+import pytest
+
+from src.ai import response_cache
+from src.ai.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(response_cache.time, 'time', clock.time)
+    return clock
+
+
+def _cache(tmp_path, **options):
+    return ResponseCache(str(tmp_path / 'ai_cache.sqlite'), **options)
+
+
+def test_hit_returns_response_and_tokens(tmp_path, clock):
+    cache = _cache(tmp_path)
+    key = ResponseCache.key('prompt', 'gpt-oss', 0.2)
+    cache.put(key, {'score': 80}, 123)
+    assert cache.get(key) == ({'score': 80}, 123)
+    assert cache.get(ResponseCache.key('prompt', 'gpt-oss', 0.3)) is None
+    cache.close()
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = _cache(tmp_path, ttl_s=60)
+    cache.put('old', {'score': 1}, 1)
+    clock.now += 61
+    assert cache.get('old') is None
+    # Expired entries are dropped, not only hidden
+    clock.now -= 61
+    assert cache.get('old') is None
+    cache.close()
+
+
+def test_least_recently_used_are_evicted(tmp_path, clock):
+    cache = _cache(tmp_path, max_entries=2)
+    cache.put('a', {'v': 'a'}, 1)
+    clock.now += 1
+    cache.put('b', {'v': 'b'}, 1)
+    clock.now += 1
+    assert cache.get('a') is not None   # 'a' is now more recent than 'b'
+    clock.now += 1
+    cache.put('c', {'v': 'c'}, 1)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == ({'v': 'a'}, 1)
+    assert cache.get('c') == ({'v': 'c'}, 1)
+    cache.close()
@@ -0,0 +1,87 @@
+"""Stratified AI sampling for very large PRs (review.ai_sampling)."""
+
+import math
+
+import pytest
+
+from src.review.sampling import page_type, plan_sample, sample_size, sample_summary, stratum_key
+
+from conftest import GOOD_PAGE
+
+
+def test_sample_size():
+    assert sample_size(0, 0.95, 5, 15) == 0
+    assert sample_size(10, 0.95, 5, 15) == 8  # n0 ≈ 35, finite population correction
+    assert sample_size(1, 0.95, 5, 15) == 1
+    assert sample_size(10_000, 0.95, 5, 15) == 35
+    assert sample_size(10_000, 0.95, 1, 15) > sample_size(10_000, 0.95, 5, 15)
+
+
+def test_stratum_key_and_page_type():
+    assert page_type(GOOD_PAGE) == 'other'
+    assert page_type('no frontmatter') == 'other'
+    assert page_type('---\nlayout: reference-home\n---\n') == 'home'
+    assert stratum_key('type', {'additions': 5, 'deletions': 5}, [20, 200]) == 'type/small'
+    assert stratum_key('type', {'additions': 150, 'deletions': 0}, [20, 200]) == 'type/medium'
+    assert stratum_key('type', {'additions': 201}, [20, 200]) == 'type/large'
+
+
+def _items(**strata):
+    return [
+        {'path': f'{stratum}/{i}.md', 'stratum': stratum}
+        for stratum, size in strata.items() for i in range(size)
+    ]
+
+
+def test_plan_sample_allocates_proportionally_with_a_floor():
+    items = _items(big=900, mid=90, tiny=10)
+    chosen = plan_sample(items, target=100, min_per_stratum=2)
+
+    per_stratum = {}
+    for item, flag in zip(items, chosen):
+        per_stratum[item['stratum']] = per_stratum.get(item['stratum'], 0) + flag
+    assert per_stratum == {'big': 90, 'mid': 9, 'tiny': 2}
+
+
+def test_plan_sample_is_deterministic_and_never_exceeds_a_stratum():
+    items = _items(a=50, b=1)
+    first = plan_sample(items, target=10, min_per_stratum=3)
+
+    assert plan_sample(list(reversed(items)), target=10, min_per_stratum=3) == list(reversed(first))
+    assert sum(first[-1:]) == 1  # 'b' holds one file
+    assert sum(first) == 11
+
+
+def test_sample_summary_is_none_without_estimates():
+    assert sample_summary({'a': [3, 240.0, 3, 240.0, 19200.0]}, 0.95, 15) is None
+    assert sample_summary({}, 0.95, 15) is None
+
+
+def test_sample_summary_interval():
+    # 100 files, 10 sampled, all scoring 80: no spread within the sample
+    summary = sample_summary({'a': [100, 8000.0, 10, 800.0, 64000.0]}, 0.95, 15)
+    assert summary['rate'] == pytest.approx(0.1)
+    assert summary['mean'] == pytest.approx(80.0)
+    assert summary['half_width'] == pytest.approx(0.0)
+
+    # One sampled file: the stratum falls back to the assumed stddev
+    summary = sample_summary({'a': [100, 8000.0, 1, 80.0, 6400.0]}, 0.95, 15)
+    assert summary['half_width'] == pytest.approx(1.959964 * math.sqrt(0.99 * 15 ** 2), rel=1e-5)
+
+
+def test_large_pr_evaluates_only_the_sample(make_agent, github):
+    github.add_pr(1, n_files=150)
+    agent = make_agent(
+        ai=True, skip_ai_when_decided=False,
+        ai_sampling={'enabled': True, 'min_files': 100, 'confidence': 0.95, 'margin': 5,
+                     'assumed_stddev': 15, 'min_per_stratum': 2},
+    )
+
+    agent.run()
+
+    evaluated = agent.ai_client.api_calls
+    assert evaluated == sample_size(150, 0.95, 5, 15)
+    assert agent.metrics['ai_files_estimated'] == 150 - evaluated
+    assert agent.state_repo.get_review('https://github.com/o/r', 1)['score'] == 100
+    event, body = github.prs[0].reviews[0]
+    assert f'{evaluated} of 150 files' in body
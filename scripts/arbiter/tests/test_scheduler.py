@@ -0,0 +1,63 @@
+"""plan_within_budget(): deferred-first greedy selection."""
+
+from src.review.scheduler import estimate_pr_cost, plan_within_budget
+
+from conftest import REPO_URL
+
+
+def _pr(number, estimate_s, deferred_at=None):
+    return {'number': number, 'estimate_s': estimate_s, 'deferred_at': deferred_at}
+
+
+def _numbers(candidates):
+    return [c['number'] for c in candidates]
+
+
+def test_estimate_pr_cost():
+    assert estimate_pr_cost(10, 1.5, 5.0) == 20.0
+    assert estimate_pr_cost(-3, 1.5, 5.0) == 5.0
+
+
+def test_deferred_prs_go_first_oldest_first():
+    selected, deferred = plan_within_budget(
+        [_pr(1, 10), _pr(2, 10, '2026-01-02'), _pr(3, 10, '2026-01-01')], budget_s=100,
+    )
+    assert _numbers(selected) == [3, 2, 1]
+    assert deferred == []
+
+
+def test_smaller_prs_fill_in_after_one_that_does_not_fit():
+    selected, deferred = plan_within_budget([_pr(1, 60), _pr(2, 50), _pr(3, 30)], budget_s=100)
+    assert _numbers(selected) == [1, 3]
+    assert _numbers(deferred) == [2]
+
+
+def test_concurrency_spreads_the_budget_over_lanes():
+    candidates = [_pr(1, 60), _pr(2, 60), _pr(3, 60), _pr(4, 60)]
+    selected, deferred = plan_within_budget(candidates, budget_s=100, concurrency=2)
+    assert _numbers(selected) == [1, 2, 3]
+    assert _numbers(deferred) == [4]
+
+
+def test_pr_longer_than_the_budget_is_deferred_even_with_spare_lanes():
+    selected, deferred = plan_within_budget([_pr(1, 150), _pr(2, 20)], budget_s=100, concurrency=4)
+    assert _numbers(selected) == [2]
+    assert _numbers(deferred) == [1]
+
+
+def test_deferred_pr_goes_first_in_the_next_run(make_agent, github):
+    github.add_pr(1)
+    github.add_pr(2)
+    agent = make_agent(scheduler={'safety_margin_s': 0, 'default_per_file_s': 1.0, 'per_pr_overhead_s': 5})
+
+    agent.run(time_budget_s=12)  # 3 files × 1s + 5s = 8s per PR: one fits
+
+    assert [pr.number for pr in github.prs if pr.reviews] == [1]
+    assert list(agent.state_repo.get_deferred(REPO_URL)) == [2]
+
+    github.add_pr(3)
+    github.prs.reverse()  # PR 3 is listed before the deferred PR 2
+    agent.run(time_budget_s=7)  # measured latency is ~0: one more 5s PR fits
+
+    assert sorted(pr.number for pr in github.prs if pr.reviews) == [1, 2]
+    assert list(agent.state_repo.get_deferred(REPO_URL)) == [3]
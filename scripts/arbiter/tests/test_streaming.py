@@ -0,0 +1,97 @@
+"""Chunked fetch → check → release of file contents (review.streaming)."""
+
+from conftest import BAD_PAGE, REPO_URL
+
+
+def _run_stages(agent, pr, *stages):
+    job = agent._new_job('o/r', pr, 'p', REPO_URL, agent._blank_product_metrics())
+    for stage in stages:
+        job = getattr(agent, f'_stage_{stage}')(job)
+    return job
+
+
+def _holding_content(job):
+    return [r['path'] for r in job['results'] if 'content' in r]
+
+
+def test_chunked_review_matches_a_single_chunk(make_agent, github):
+    one = github.add_pr(1, n_files=7, bad=(2, 5))
+    chunked = github.add_pr(2, n_files=7, bad=(2, 5))
+    agent = make_agent(ai=True, streaming={'chunk_files': 1000})
+    _run_stages(agent, one, 'fetch', 'checks', 'ai', 'decide', 'publish', 'persist')
+    agent = make_agent(ai=True, streaming={'chunk_files': 2}, file_fanout={'enabled': True})
+    _run_stages(agent, chunked, 'fetch', 'checks', 'ai', 'decide', 'publish', 'persist')
+
+    assert [event for event, _ in one.reviews] == [event for event, _ in chunked.reviews]
+    by_file = lambda number: sorted(
+        (path.rsplit('/', 1)[1], r['static_score'], r['failed_checks'])
+        for path, r in agent.file_store.get(REPO_URL, number).items()
+    )
+    assert by_file(1) == by_file(2)
+
+
+def test_contents_are_released_after_the_checks_without_a_budget(make_agent, github):
+    pr = github.add_pr(1, n_files=6)
+    agent = make_agent(ai=True, skip_ai_when_decided=False, streaming={'chunk_files': 2, 'keep_content_mb': 0})
+
+    job = _run_stages(agent, pr, 'fetch', 'checks')
+    assert _holding_content(job) == []
+    assert len(github.fetched) == 6
+
+    github.fetched.clear()
+    job = agent._stage_ai(job)
+    assert sorted(github.fetched) == sorted(f['path'] for f in pr.files)  # re-fetched to evaluate
+    assert _holding_content(job) == []
+    assert agent.ai_client.api_calls == 6
+
+
+def test_contents_within_the_budget_are_kept_for_the_ai_stage(make_agent, github):
+    pr = github.add_pr(1, n_files=6)
+    agent = make_agent(ai=True, skip_ai_when_decided=False, streaming={'chunk_files': 2, 'keep_content_mb': 1})
+
+    job = _run_stages(agent, pr, 'fetch', 'checks')
+    assert len(_holding_content(job)) == 6
+
+    github.fetched.clear()
+    job = agent._stage_ai(job)
+    assert github.fetched == []
+    assert agent.ai_client.api_calls == 6
+
+
+def test_no_content_is_kept_when_ai_is_off(make_agent, github):
+    pr = github.add_pr(1, n_files=4, bad=(1,))
+    agent = make_agent(ai=False, streaming={'chunk_files': 3})
+
+    job = _run_stages(agent, pr, 'fetch', 'checks')
+
+    assert _holding_content(job) == []
+    assert [r['static_score'] < 100 for r in job['results']] == [False, True, False, False]
+
+
+def test_only_the_ai_sample_keeps_its_content(make_agent, github):
+    pr = github.add_pr(1, n_files=120)
+    agent = make_agent(
+        ai=True, skip_ai_when_decided=False,
+        ai_sampling={'enabled': True, 'min_files': 100, 'confidence': 0.95, 'margin': 5,
+                     'assumed_stddev': 15, 'min_per_stratum': 2},
+    )
+    job = _run_stages(agent, pr, 'fetch', 'checks')
+
+    sample = agent._plan_ai(job)
+
+    assert 0 < len(sample) < 120
+    assert sorted(_holding_content(job)) == sorted(r['path'] for r in sample)
+
+
+def test_decide_releases_contents_and_patches(make_agent, github):
+    pr = github.add_pr(1, n_files=3)
+    github.contents[pr.files[0]['path']] = BAD_PAGE
+    agent = make_agent(ai=True, skip_ai_when_decided=False)
+    job = _run_stages(agent, pr, 'fetch', 'checks', 'ai')
+    results = job['results']
+    assert _holding_content(job) == []  # released once evaluated
+    results[0].update(content=BAD_PAGE, patch='@@')
+
+    agent._stage_decide(job)
+
+    assert not any('content' in r or 'patch' in r for r in results)